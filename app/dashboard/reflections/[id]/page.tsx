@@ -61,8 +61,8 @@ export default function ReflectionDetailPage() {
   const { data: reflectionData, isLoading } = useQuery({
     queryKey: ['reflection', reflectionId],
     queryFn: async () => {
-      // 먼저 AI 회고 목록에서 찾기
-      const reflectionsResponse = await fetch(`/api/v1/reflections`, {
+      // 먼저 AI 회고 상세에서 찾기 (목록은 competency_analysis 를 포함하지 않음)
+      const reflectionsResponse = await fetch(`/api/v1/reflections/${reflectionId}`, {
         headers: {
           'x-user-id': localStorage.getItem('x-user-id') || 'dev-user-default',
         },
@@ -70,8 +70,7 @@ export default function ReflectionDetailPage() {
       
       if (reflectionsResponse.ok) {
         const result = await reflectionsResponse.json();
-        const reflections = result?.data?.reflections || [];
-        const reflection = reflections.find((r: any) => r.id === reflectionId);
+        const reflection = result?.data?.reflection;
         
         if (reflection) {
           // AI 회고인 경우 결과 페이지로 리다이렉트
@@ -0,0 +1,146 @@
+"""
+알림 배치 작업
+
+실행 방법:
+- 읽지 않은 알림 수 보정 (10분마다): python -m app.batch.notification_jobs reconcile_unread_counts
+- 오래된 읽은 알림 보관 (매일): python -m app.batch.notification_jobs archive_read
+- 다이제스트 대기열 보내기 (주기별): python -m app.batch.notification_jobs send_digests daily|weekly|monthly
+"""
+
+import asyncio
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Dict
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from app.database import get_supabase
+from app.config import settings
+from app.events import NotificationCreated, publish
+from app import subscribers  # noqa: F401  캐시 태그 무효화 구독자 등록
+from app.utils.notification_digest import DIGEST_FREQUENCIES
+from app.utils.query_tracer import traced
+from app.utils.unread_counter import adjust_unread, reconcile_unread_counts
+
+# 다이제스트 RPC 한 번에 처리할 사용자 수
+DIGEST_USERS_PER_CALL = 500
+
+@traced("batch:reconcile_unread_counts")
+async def reconcile_unread_notification_counts():
+    """사용자별 읽지 않은 알림 수를 notifications 의 실제 개수로 보정"""
+    print(f"[{datetime.now()}] 읽지 않은 알림 수 보정 시작")
+    
+    try:
+        corrected = await reconcile_unread_counts()
+        print(f"{corrected}명의 카운터 보정")
+        print(f"[{datetime.now()}] 읽지 않은 알림 수 보정 완료")
+        
+    except Exception as e:
+        print(f"[ERROR] 읽지 않은 알림 수 보정 실패: {str(e)}")
+        raise
+
+@traced("batch:archive_read_notifications")
+async def archive_read_notifications():
+    """읽은 지 보관 기간이 지난 알림을 청크 단위로 보관함(또는 삭제)으로 이동 (매일 실행)"""
+    print(f"[{datetime.now()}] 오래된 알림 정리 시작")
+    
+    try:
+        supabase = get_supabase()
+        before = datetime.now(timezone.utc) - timedelta(days=settings.notification_retention_days)
+        chunk_size = settings.notification_cleanup_chunk_size
+        total = 0
+        
+        # 한 번에 전부 지우면 긴 트랜잭션 / 잠금이 생기므로 청크마다 커밋하고 잠시 쉰다
+        while True:
+            response = await asyncio.to_thread(
+                lambda: supabase.rpc("archive_read_notifications", {
+                    "p_before": before.isoformat(),
+                    "p_limit": chunk_size,
+                    "p_archive": settings.notification_archive_enabled
+                }).execute()
+            )
+            moved = response.data or 0
+            total += moved
+            if moved < chunk_size:
+                break
+            await asyncio.sleep(settings.notification_cleanup_pause_seconds)
+        
+        action = "보관" if settings.notification_archive_enabled else "삭제"
+        print(f"{before.date()} 이전에 읽은 알림 {total}개 {action}")
+        print(f"[{datetime.now()}] 오래된 알림 정리 완료")
+        
+    except Exception as e:
+        print(f"[ERROR] 오래된 알림 정리 실패: {str(e)}")
+        raise
+
+@traced("batch:send_notification_digests")
+async def send_notification_digests(frequency: str):
+    """notification_frequency 가 frequency 인 사용자의 다이제스트 대기열을 알림 한 건으로 넣음
+
+    다이제스트 타입 알림은 만들 때 대기열(notification_digest_queue)로 가므로,
+    notifications INSERT / 읽지 않은 수 갱신 / 스트림 전달이 사용자당 주기마다 한 번이 된다
+    """
+    print(f"[{datetime.now()}] {frequency} 다이제스트 시작")
+    
+    try:
+        supabase = get_supabase()
+        before = datetime.now(timezone.utc)
+        queued: Dict[str, int] = {}
+        sent = 0
+        
+        while True:
+            response = await asyncio.to_thread(
+                lambda: supabase.rpc("flush_notification_digests", {
+                    "p_frequency": frequency,
+                    "p_before": before.isoformat(),
+                    "p_min_count": settings.notification_digest_min_count,
+                    "p_limit": DIGEST_USERS_PER_CALL
+                }).execute()
+            )
+            rows = response.data or []
+            await adjust_unread(Counter(row["user_id"] for row in rows))
+            for row in rows:
+                notification = row["notification"]
+                await publish(NotificationCreated(
+                    row["user_id"], notification_id=notification["id"], notification=notification
+                ))
+                queued[row["user_id"]] = row["collapsed"]
+            sent += len(rows)
+            # 모인 알림이 p_min_count 보다 적은 사용자는 행이 여러 개이므로 사용자 수로 끝을 판단한다
+            if len({row["user_id"] for row in rows}) < DIGEST_USERS_PER_CALL:
+                break
+        
+        print(f"{len(queued)}명의 대기 알림 {sum(queued.values())}개를 알림 {sent}개로 보냄")
+        print(f"[{datetime.now()}] {frequency} 다이제스트 완료")
+        
+    except Exception as e:
+        print(f"[ERROR] 다이제스트 실패: {str(e)}")
+        raise
+
+def main():
+    """메인 실행 함수"""
+    if len(sys.argv) < 2:
+        print("사용법: python -m app.batch.notification_jobs <command>")
+        print("Commands:")
+        print("  reconcile_unread_counts       - 읽지 않은 알림 수 보정 (10분마다)")
+        print("  archive_read                  - 오래된 읽은 알림 보관 (매일)")
+        print("  send_digests <daily|weekly|monthly> - 다이제스트 (해당 주기마다)")
+        return
+    
+    command = sys.argv[1]
+    
+    if command == "reconcile_unread_counts":
+        asyncio.run(reconcile_unread_notification_counts())
+    elif command == "archive_read":
+        asyncio.run(archive_read_notifications())
+    elif command == "send_digests" and len(sys.argv) > 2 and sys.argv[2] in DIGEST_FREQUENCIES:
+        asyncio.run(send_notification_digests(sys.argv[2]))
+    else:
+        print(f"알 수 없는 명령: {' '.join(sys.argv[1:])}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
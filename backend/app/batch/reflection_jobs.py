@@ -7,6 +7,7 @@
 """
 
 import asyncio
+from collections import Counter
 from datetime import datetime, timedelta
 from typing import List
 import sys
@@ -17,7 +18,13 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 
 from app.database import get_supabase
 from app.config import settings
+from app.events import NotificationCreated, publish
+from app import subscribers  # noqa: F401  캐시 태그 무효화 구독자 등록
+from app.utils.notification_digest import defer_digest_notifications
+from app.utils.query_tracer import traced
+from app.utils.unread_counter import adjust_unread
 
+@traced("batch:send_reflection_reminders")
 async def send_reflection_reminders():
     """회고 리마인더 전송 (시간별 실행)"""
     print(f"[{datetime.now()}] 회고 리마인더 전송 시작")
@@ -46,22 +53,34 @@ async def send_reflection_reminders():
         
         print(f"{len(spaces)}개의 리마인더를 전송합니다")
         
-        # 알림 생성
-        for space in spaces:
-            user = space.get('users', {})
-            user_id = space['user_id']
-            
-            notification_data = {
-                "user_id": user_id,
+        # 알림 생성 (한 번의 다건 insert)
+        notifications = [
+            {
+                "user_id": space['user_id'],
                 "type": "reminder",
                 "title": "회고 작성 시간입니다",
-                "message": f"'{space['name']}' 스페이스의 회고를 작성해주세요",
-                "link": f"/spaces/{space['id']}/reflect",
-                "is_read": False
+                "content": f"'{space['name']}' 스페이스의 회고를 작성해주세요",
+                "link": f"/spaces/{space['id']}/reflect"
             }
-            
-            supabase.table("notifications").insert(notification_data).execute()
-            
+            for space in spaces
+        ]
+        # 다이제스트로 받는 사용자의 리마인더는 대기열로 (send_digests 가 주기마다 한 건으로 넣는다)
+        notifications = await defer_digest_notifications(notifications)
+        if len(notifications) < len(spaces):
+            print(f"{len(spaces) - len(notifications)}개는 다이제스트 대기열에 넣었습니다")
+        inserted = []
+        if notifications:
+            inserted = supabase.table("notifications").insert(notifications).execute().data or []
+        await adjust_unread(Counter(notification["user_id"] for notification in inserted))
+        
+        # 알림 스트림 / 캐시 태그에 반영 (다른 프로세스의 스트림은 공유 캐시 태그 버전으로 알아챈다)
+        for notification in inserted:
+            await publish(NotificationCreated(
+                notification["user_id"], notification_id=notification["id"], notification=notification
+            ))
+        
+        for space in spaces:
+            user = space.get('users', {})
             print(f"  - {user.get('name', 'Unknown')} ({user.get('email')}): {space['name']}")
         
         print(f"[{datetime.now()}] 회고 리마인더 전송 완료")
@@ -70,6 +89,7 @@ async def send_reflection_reminders():
         print(f"[ERROR] 리마인더 전송 실패: {str(e)}")
         raise
 
+@traced("batch:calculate_daily_metrics")
 async def calculate_daily_metrics():
     """일일 성장 메트릭 계산 (매일 자정 실행)"""
     print(f"[{datetime.now()}] 일일 메트릭 계산 시작")
@@ -0,0 +1,115 @@
+"""
+연속 기록 백필
+
+기존 회고 / 마이크로 로그 / 헬스체크 날짜로 user_streaks 를 다시 계산한다.
+마이그레이션 직후 한 번, 이후에는 지난 날짜 기록 / 삭제를 반영하도록 매일 새벽 실행한다.
+사용자마다 계산 직후 apply_streak_backfill RPC 로 저장해, 백필 중 들어온 실시간 갱신을 되돌리지 않는다.
+
+실행 방법:
+- 전체 사용자: python -m app.batch.streak_jobs backfill
+- 한 사용자: python -m app.batch.streak_jobs backfill <user_id>
+"""
+
+import asyncio
+from datetime import date, datetime, timezone
+from typing import List, Optional
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from app.database import get_supabase
+from app.events import reflection_active_date
+from app.utils.query_tracer import traced
+from app.utils.streaks import compute_streak
+
+PAGE_SIZE = 1000
+
+def _date_column(row: dict) -> Optional[date]:
+    return date.fromisoformat(str(row["date"])[:10]) if row.get("date") else None
+
+# (테이블, 조회 컬럼, 활동한 날) - 활동한 날로 치는 기록
+# 회고는 ReflectionCreated 구독자와 같은 규칙(reflection_active_date)으로 날짜를 정한다
+ACTIVITY_SOURCES = (
+    ("reflections", "reflection_date, created_at", reflection_active_date),
+    ("micro_logs", "date", _date_column),
+    ("health_checks", "date", _date_column),
+)
+
+def _select_all(query_factory) -> List[dict]:
+    """PostgREST 기본 행 수 제한을 넘는 결과를 페이지 단위로 모두 조회"""
+    rows, start = [], 0
+    while True:
+        page = query_factory().range(start, start + PAGE_SIZE - 1).execute().data or []
+        rows.extend(page)
+        if len(page) < PAGE_SIZE:
+            return rows
+        start += PAGE_SIZE
+
+def _active_days(supabase, user_id: str) -> List[date]:
+    days = []
+    for table, columns, active_day in ACTIVITY_SOURCES:
+        rows = _select_all(lambda: supabase.table(table).select(columns).eq("user_id", user_id))
+        days.extend(day for day in map(active_day, rows) if day is not None)
+    return days
+
+@traced("batch:backfill_streaks")
+async def backfill_streaks(user_id: Optional[str] = None):
+    """사용자별 활동 날짜를 한 번 훑어 user_streaks 를 다시 계산"""
+    print(f"[{datetime.now()}] 연속 기록 백필 시작")
+    
+    try:
+        supabase = get_supabase()
+        
+        if user_id:
+            user_ids = [user_id]
+        else:
+            user_ids = [u["id"] for u in _select_all(lambda: supabase.table("users").select("id").order("id"))]
+        
+        print(f"{len(user_ids)}명의 연속 기록 계산")
+        
+        today = date.today()
+        written = removed = 0
+        for uid in user_ids:
+            # 읽기 전 시각을 함께 넘겨, 읽은 뒤 실시간 갱신이 들어온 행을 되돌리지 않게 한다
+            read_at = datetime.now(timezone.utc).isoformat()
+            current, longest, last_active = compute_streak(_active_days(supabase, uid), today)
+            supabase.rpc("apply_streak_backfill", {
+                "p_user_id": uid,
+                "p_current": current,
+                "p_longest": longest,
+                # 기록을 모두 지운 사용자는 남아 있는 행을 지운다
+                "p_last_active": last_active.isoformat() if last_active else None,
+                "p_read_at": read_at,
+            }).execute()
+            if last_active is None:
+                removed += 1
+            else:
+                written += 1
+        
+        print(f"{written}명의 연속 기록 저장, 기록 없는 사용자 {removed}명 정리")
+        print(f"[{datetime.now()}] 연속 기록 백필 완료")
+        
+    except Exception as e:
+        print(f"[ERROR] 연속 기록 백필 실패: {str(e)}")
+        raise
+
+def main():
+    """메인 실행 함수"""
+    if len(sys.argv) < 2:
+        print("사용법: python -m app.batch.streak_jobs <command>")
+        print("Commands:")
+        print("  backfill [user_id] - 기록 전체로 연속 기록 다시 계산 (매일 새벽)")
+        return
+    
+    command = sys.argv[1]
+    
+    if command == "backfill":
+        asyncio.run(backfill_streaks(sys.argv[2] if len(sys.argv) > 2 else None))
+    else:
+        print(f"알 수 없는 명령: {command}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
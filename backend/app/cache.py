@@ -0,0 +1,437 @@
+"""
+2단 캐시 (프로세스 내 LRU + 공유 백엔드)
+
+- 1차(L1): 워커 프로세스 내 LRU (TTL + 최대 개수)
+- 2차(L2, 선택): Redis 호환 서버 또는 SQLite 파일 - gunicorn 워커 간 공유
+- 태그 무효화: 항목마다 저장 시점의 태그 버전을 함께 저장하고,
+  invalidate_tags("user:{id}:logs") 는 태그 버전을 올려 이전 항목을 모두 무효로 만든다
+- 스탬피드 방지: 워커 안에서는 single-flight, 워커 사이에서는 L2 잠금 키
+  (잠금을 못 잡은 워커는 잠시 L2 를 기다렸다가 값이 없으면 직접 계산)
+
+공유 백엔드를 쓰면 다른 워커의 무효화는 L1 에 최대 cache_local_ttl_seconds 늦게 반영된다.
+L2 에 저장하는 값은 JSON 으로 직렬화할 수 있어야 한다.
+
+라우트에서의 사용:
+
+    @cached(ttl=60, tags=["user:{user_id}:logs"])
+    async def fetch_logs(user_id: str, page: int): ...
+
+    await invalidate_tags(f"user:{user_id}:logs")
+"""
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence
+
+from app.config import settings
+from app.utils.lru import LRUCache
+from app.utils.metrics import registry
+from app.utils.singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+cache_requests_total = registry.counter(
+    "cache_requests_total", "2단 캐시 조회 결과", ("name", "result")
+)
+
+# 캐시 키에 포함할 인자 타입 (Depends 로 주입된 클라이언트 등은 제외)
+_KEY_TYPES = (str, int, float, bool, type(None), date, datetime)
+
+
+# ===== 공유 백엔드 =====
+
+class SharedBackend(ABC):
+    """워커 간 공유 캐시 저장소"""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        ...
+
+    @abstractmethod
+    async def tag_versions(self, tags: Sequence[str]) -> Dict[str, int]:
+        ...
+
+    @abstractmethod
+    async def bump_tags(self, tags: Sequence[str]) -> None:
+        ...
+
+    @abstractmethod
+    async def acquire_lock(self, key: str, ttl: float) -> bool:
+        ...
+
+    @abstractmethod
+    async def release_lock(self, key: str) -> None:
+        ...
+
+    async def close(self) -> None:
+        pass
+
+
+class RedisBackend(SharedBackend):
+    """Redis 호환 서버 (redis 패키지 필요)"""
+
+    def __init__(self, url: str, prefix: str = "proof:cache:"):
+        import redis.asyncio as redis
+
+        self._redis = redis.from_url(url, decode_responses=True)
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[str]:
+        return await self._redis.get(self.prefix + key)
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        await self._redis.set(self.prefix + key, value, px=max(1, int(ttl * 1000)))
+
+    async def tag_versions(self, tags: Sequence[str]) -> Dict[str, int]:
+        if not tags:
+            return {}
+        values = await self._redis.mget([f"{self.prefix}tag:{tag}" for tag in tags])
+        return {tag: int(value or 0) for tag, value in zip(tags, values)}
+
+    async def bump_tags(self, tags: Sequence[str]) -> None:
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for tag in tags:
+                pipe.incr(f"{self.prefix}tag:{tag}")
+            await pipe.execute()
+
+    async def acquire_lock(self, key: str, ttl: float) -> bool:
+        return bool(await self._redis.set(f"{self.prefix}lock:{key}", "1", nx=True, px=max(1, int(ttl * 1000))))
+
+    async def release_lock(self, key: str) -> None:
+        await self._redis.delete(f"{self.prefix}lock:{key}")
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+class SQLiteBackend(SharedBackend):
+    """SQLite 파일 (Redis 없는 단일 서버에서 워커 간 공유용)"""
+
+    def __init__(self, path: str):
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=5)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT, expires_at REAL)")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS cache_tags (tag TEXT PRIMARY KEY, version INTEGER)")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS cache_locks (key TEXT PRIMARY KEY, expires_at REAL)")
+
+    def _run(self, sql: str, params: Sequence[Any] = ()) -> List[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    async def get(self, key: str) -> Optional[str]:
+        rows = await asyncio.to_thread(
+            self._run, "SELECT value FROM cache WHERE key = ? AND expires_at > ?", (key, time.time())
+        )
+        return rows[0][0] if rows else None
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        await asyncio.to_thread(
+            self._run,
+            "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, value, time.time() + ttl),
+        )
+
+    async def tag_versions(self, tags: Sequence[str]) -> Dict[str, int]:
+        if not tags:
+            return {}
+        placeholders = ",".join("?" * len(tags))
+        rows = await asyncio.to_thread(
+            self._run, f"SELECT tag, version FROM cache_tags WHERE tag IN ({placeholders})", list(tags)
+        )
+        versions = dict(rows)
+        return {tag: int(versions.get(tag, 0)) for tag in tags}
+
+    async def bump_tags(self, tags: Sequence[str]) -> None:
+        def bump():
+            with self._lock:
+                for tag in tags:
+                    self._conn.execute(
+                        "INSERT INTO cache_tags (tag, version) VALUES (?, 1) "
+                        "ON CONFLICT(tag) DO UPDATE SET version = version + 1",
+                        (tag,),
+                    )
+        await asyncio.to_thread(bump)
+
+    async def acquire_lock(self, key: str, ttl: float) -> bool:
+        def acquire() -> bool:
+            now = time.time()
+            with self._lock:
+                self._conn.execute("DELETE FROM cache_locks WHERE key = ? AND expires_at <= ?", (key, now))
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO cache_locks (key, expires_at) VALUES (?, ?)", (key, now + ttl)
+                )
+                return cursor.rowcount == 1
+        return await asyncio.to_thread(acquire)
+
+    async def release_lock(self, key: str) -> None:
+        await asyncio.to_thread(self._run, "DELETE FROM cache_locks WHERE key = ?", (key,))
+
+    async def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def create_shared_backend() -> Optional[SharedBackend]:
+    """settings.cache_backend 에 맞는 공유 백엔드 (memory 면 None)"""
+    if settings.cache_backend == "redis":
+        try:
+            return RedisBackend(settings.cache_redis_url)
+        except ImportError:
+            logger.warning("redis 패키지가 없어 공유 캐시 없이 프로세스 내 캐시만 사용합니다")
+            return None
+    if settings.cache_backend == "sqlite":
+        return SQLiteBackend(settings.cache_sqlite_path)
+    if settings.cache_backend != "memory":
+        raise ValueError(f"알 수 없는 캐시 백엔드: {settings.cache_backend}")
+    return None
+
+
+# ===== 2단 캐시 =====
+
+class Cache:
+    """L1(LRU) + L2(공유 백엔드) + 태그 버전 무효화 + 스탬피드 방지"""
+
+    def __init__(
+        self,
+        maxsize: int,
+        default_ttl: float,
+        shared: Optional[SharedBackend] = None,
+        local_ttl: Optional[float] = None,
+        lock_timeout: float = 3.0,
+    ):
+        self.default_ttl = default_ttl
+        self.shared = shared
+        self.local_ttl = local_ttl
+        self.lock_timeout = lock_timeout
+        self._local = LRUCache(maxsize=maxsize)
+        self._tag_versions: Dict[str, int] = {}
+        self._flight = SingleFlight()
+
+    # --- 태그 버전 ---
+
+    async def _current_versions(self, tags: Sequence[str]) -> Dict[str, int]:
+        if not tags:
+            return {}
+        if self.shared is None:
+            return {tag: self._tag_versions.get(tag, 0) for tag in tags}
+        versions = await self.shared.tag_versions(tags)
+        self._tag_versions.update(versions)
+        return versions
+
+    def _valid_locally(self, entry: Dict[str, Any]) -> bool:
+        return all(self._tag_versions.get(tag, 0) == version for tag, version in entry["t"].items())
+
+    async def tag_versions(self, *tags: str) -> Dict[str, int]:
+        """태그별 현재 버전 (조건부 GET 의 ETag 등)"""
+        return await self._current_versions(tags)
+
+    async def invalidate_tags(self, *tags: str) -> None:
+        """태그가 붙은 모든 항목 무효화 (버전 증가)"""
+        for tag in tags:
+            self._tag_versions[tag] = self._tag_versions.get(tag, 0) + 1
+        if self.shared is not None:
+            await self.shared.bump_tags(tags)
+            # 공유 버전을 다시 읽어 로컬 버전과 맞춘다
+            await self._current_versions(tags)
+
+    # --- 조회 ---
+
+    def _set_local(self, key: str, entry: Dict[str, Any], ttl: float) -> None:
+        local_ttl = min(ttl, self.local_ttl) if self.shared is not None and self.local_ttl else ttl
+        self._local.set(key, entry, ttl=local_ttl)
+
+    async def _load_shared(self, key: str) -> Optional[Dict[str, Any]]:
+        raw = await self.shared.get(key)
+        if raw is None:
+            return None
+        entry = json.loads(raw)
+        versions = await self._current_versions(list(entry["t"]))
+        if any(versions.get(tag, 0) != version for tag, version in entry["t"].items()):
+            return None
+        return entry
+
+    async def _wait_for_shared(self, key: str) -> Optional[Dict[str, Any]]:
+        """다른 워커가 계산 중일 때 L2 에 값이 생기길 잠시 기다림"""
+        deadline = time.monotonic() + self.lock_timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+            entry = await self._load_shared(key)
+            if entry is not None:
+                return entry
+        return None
+
+    async def get_or_set(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+        tags: Sequence[str] = (),
+        name: str = "default",
+    ) -> Any:
+        ttl = ttl if ttl is not None else self.default_ttl
+
+        entry = self._local.get(key, _MISSING)
+        if entry is not _MISSING and self._valid_locally(entry):
+            cache_requests_total.inc(name=name, result="l1_hit")
+            return entry["v"]
+
+        if self._flight.inflight(key):
+            cache_requests_total.inc(name=name, result="coalesced")
+
+        async def load() -> Any:
+            if self.shared is not None:
+                shared_entry = await self._load_shared(key)
+                if shared_entry is not None:
+                    cache_requests_total.inc(name=name, result="l2_hit")
+                    self._set_local(key, shared_entry, ttl)
+                    return shared_entry["v"]
+
+                if not await self.shared.acquire_lock(key, self.lock_timeout):
+                    shared_entry = await self._wait_for_shared(key)
+                    if shared_entry is not None:
+                        cache_requests_total.inc(name=name, result="l2_hit")
+                        self._set_local(key, shared_entry, ttl)
+                        return shared_entry["v"]
+                    # 잠금 보유 워커가 늦으면 직접 계산 (잠금 없이)
+                    return await self._compute(key, loader, ttl, tags, name, release=False)
+                return await self._compute(key, loader, ttl, tags, name, release=True)
+
+            return await self._compute(key, loader, ttl, tags, name, release=False)
+
+        return await self._flight.do(key, load)
+
+    async def _compute(self, key, loader, ttl, tags, name, release: bool) -> Any:
+        cache_requests_total.inc(name=name, result="miss")
+        try:
+            # 계산 전 버전을 기록해 계산 중 무효화가 일어나면 결과가 바로 무효가 되게 한다
+            versions = await self._current_versions(list(tags))
+            value = await loader()
+            await self._store(key, {"v": value, "t": versions}, ttl, name)
+            return value
+        finally:
+            if release:
+                await self.shared.release_lock(key)
+
+    async def _store(self, key: str, entry: Dict[str, Any], ttl: float, name: str) -> None:
+        self._set_local(key, entry, ttl)
+        if self.shared is not None:
+            try:
+                await self.shared.set(key, json.dumps(entry, ensure_ascii=False, default=str), ttl)
+            except (TypeError, ValueError):
+                logger.warning(f"공유 캐시에 저장할 수 없는 값입니다: {name}")
+
+    # --- 여러 항목을 한 번에 채우는 호출자용 (조회 한 번으로 빠진 항목만 계산) ---
+
+    async def get(self, key: str, ttl: Optional[float] = None, name: str = "default") -> Any:
+        """유효한 캐시 값 (없거나 태그가 무효화됐으면 None)"""
+        entry = self._local.get(key, _MISSING)
+        if entry is not _MISSING and self._valid_locally(entry):
+            cache_requests_total.inc(name=name, result="l1_hit")
+            return entry["v"]
+        if self.shared is not None:
+            shared_entry = await self._load_shared(key)
+            if shared_entry is not None:
+                cache_requests_total.inc(name=name, result="l2_hit")
+                self._set_local(key, shared_entry, ttl if ttl is not None else self.default_ttl)
+                return shared_entry["v"]
+        cache_requests_total.inc(name=name, result="miss")
+        return None
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        tags: Sequence[str] = (),
+        versions: Optional[Dict[str, int]] = None,
+        name: str = "default",
+    ) -> None:
+        """값 저장. versions 는 값을 계산하기 전에 tag_versions 로 읽어 둔 버전
+        (계산 중 무효화가 일어나면 저장한 값이 바로 무효가 된다)"""
+        if versions is None:
+            versions = await self._current_versions(list(tags))
+        entry = {"v": value, "t": {tag: versions.get(tag, 0) for tag in tags}}
+        await self._store(key, entry, ttl if ttl is not None else self.default_ttl, name)
+
+    def clear_local(self) -> None:
+        self._local.clear()
+        self._tag_versions.clear()
+
+    async def close(self) -> None:
+        if self.shared is not None:
+            await self.shared.close()
+
+    def reopen_shared(self) -> None:
+        """fork 된 워커에서 공유 백엔드 커넥션을 새로 연다 (gunicorn preload_app)"""
+        if self.shared is not None:
+            self.shared = create_shared_backend()
+        self.clear_local()
+
+    # --- 데코레이터 ---
+
+    def cached(
+        self,
+        ttl: Optional[float] = None,
+        tags: Iterable[str] = (),
+        key: Optional[Callable[..., str]] = None,
+    ) -> Callable:
+        """async 함수 결과 캐시
+
+        tags 는 인자 이름으로 포맷된다 (예: "user:{user_id}:logs").
+        key 를 주지 않으면 str/int/날짜 등 단순 타입 인자만으로 키를 만든다.
+        """
+        tag_templates = list(tags)
+
+        def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+            signature = inspect.signature(func)
+            name = f"{func.__module__}.{func.__qualname__}"
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                arguments = bound.arguments
+                if key is not None:
+                    cache_key = f"{name}:{key(*args, **kwargs)}"
+                else:
+                    simple = {k: v for k, v in arguments.items() if isinstance(v, _KEY_TYPES)}
+                    digest = hashlib.sha1(
+                        json.dumps(simple, sort_keys=True, default=str).encode("utf-8")
+                    ).hexdigest()
+                    cache_key = f"{name}:{digest}"
+                resolved_tags = [template.format(**arguments) for template in tag_templates]
+                return await self.get_or_set(
+                    cache_key, lambda: func(*args, **kwargs), ttl=ttl, tags=resolved_tags, name=name
+                )
+
+            return wrapper
+
+        return decorator
+
+
+cache = Cache(
+    maxsize=settings.cache_max_entries,
+    default_ttl=settings.cache_default_ttl_seconds,
+    shared=create_shared_backend(),
+    local_ttl=settings.cache_local_ttl_seconds,
+    lock_timeout=settings.cache_lock_timeout_ms / 1000,
+)
+
+cached = cache.cached
+invalidate_tags = cache.invalidate_tags
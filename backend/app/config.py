@@ -26,6 +26,117 @@ class Settings(BaseSettings):
     # OpenAI (AI 분석용)
     openai_api_key: str = ""
     openai_model: str = "gpt-4-turbo-preview"
+    # 로컬 mock 서버로 테스트할 때는 http://127.0.0.1:8100/v1 등으로 변경
+    openai_base_url: str = "https://api.openai.com/v1"
+
+    # LLM 클라이언트 (동시 실행 한도 / 데드라인 / 키워드 마이크로 배칭)
+    llm_max_concurrency: int = 16
+    llm_per_user_concurrency: int = 2
+    llm_timeout_seconds: float = 30.0
+    llm_batch_window_ms: int = 20
+    llm_batch_max_size: int = 16
+    llm_batch_max_chars: int = 500
+
+    # AI 분석 캐시 (reflection_ai_analysis 테이블 + 프로세스 내 LRU)
+    ai_cache_ttl_hours: int = 12
+    ai_cache_max_entries: int = 512
+
+    # 파일 업로드 / 저장소
+    upload_max_bytes: int = 10 * 1024 * 1024
+    upload_chunk_size: int = 64 * 1024
+    storage_backend: str = "local"  # local | supabase
+    storage_local_dir: str = "./storage"
+    storage_public_base_url: str = "/files"
+    storage_bucket: str = "files"
+    
+    # 증빙 문서 처리 (0 이면 CPU 코어 수 / 웹 워커 수만큼 프로세스 사용)
+    document_workers: int = 0
+    document_thumbnail_size: int = 320
+    document_max_pages: int = 50
+
+    # 내부 운영 엔드포인트(/metrics 등) 접근 토큰 (x-internal-token 헤더)
+    # 비어 있으면 development 환경에서만 허용
+    internal_api_token: str = ""
+
+    # 요청당 쿼리 예산 / N+1 감지 (off | warn | raise)
+    query_budget_mode: str = "warn"
+    query_nplus1_threshold: int = 5
+
+    # 요청 프로파일링 (pyinstrument, x-profile: 1 + x-internal-token 또는 샘플링)
+    profiling_enabled: bool = False
+    profiling_sample_rate: float = 0.0
+    profiling_interval: float = 0.001
+    profiling_dir: str = "./profiles"
+    profiling_max_files: int = 50
+
+    # 이벤트 루프 지연 모니터 / 블로킹 감지
+    loop_monitor_enabled: bool = True
+    loop_monitor_interval: float = 0.1
+    loop_block_threshold_ms: int = 100
+
+    # 인기 읽기 엔드포인트 (트렌딩/마감 임박/키워드/템플릿) 캐시 TTL
+    hot_read_cache_ttl_seconds: int = 30
+
+    # 2단 캐시 (app.cache): memory | sqlite | redis
+    cache_backend: str = "memory"
+    cache_redis_url: str = "redis://localhost:6379/0"
+    cache_sqlite_path: str = "./cache.sqlite3"
+    cache_max_entries: int = 1024
+    cache_default_ttl_seconds: int = 60
+    # 공유 백엔드 사용 시 L1 최대 보존 시간 (다른 워커의 무효화가 늦게 보일 수 있는 최대 시간)
+    cache_local_ttl_seconds: int = 5
+    cache_lock_timeout_ms: int = 3000
+
+    # 회고 스토리 뷰 캐시 (기간별 결과 / 주간 집계, 마이크로 로그 쓰기로 무효화)
+    story_cache_ttl_seconds: int = 600
+    story_week_cache_ttl_seconds: int = 86400
+
+    # 활동 조회수 / 북마크 수 write-behind 반영 주기와 버퍼 최대 활동 수
+    counter_flush_interval_seconds: float = 5.0
+    counter_buffer_max_keys: int = 5000
+
+    # 조건부 GET(ETag/304) / 응답 압축 (min_size 미만 응답은 압축하지 않음)
+    etag_enabled: bool = True
+    compression_enabled: bool = True
+    compression_min_size: int = 1024
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 4
+
+    # 쓰기 이벤트 버스 구독자별 큐 크기
+    event_queue_size: int = 1000
+
+    # 알림 스트림(SSE): 워커당 / 사용자당 최대 연결 수, heartbeat 주기, 재연결용 사용자별 최근 이벤트 수
+    notification_stream_max_connections: int = 1000
+    notification_stream_max_per_user: int = 5
+    notification_stream_heartbeat_seconds: float = 15.0
+    notification_stream_replay_size: int = 50
+
+    # 알림 보관 / 다이제스트 (app.batch.notification_jobs)
+    # 읽은 지 notification_retention_days 가 지난 알림을 청크 단위로 보관함(또는 삭제)으로 옮긴다
+    notification_retention_days: int = 90
+    notification_archive_enabled: bool = True
+    notification_cleanup_chunk_size: int = 1000
+    notification_cleanup_pause_seconds: float = 0.2
+    # 다이제스트로 모을 알림 타입 (daily / weekly / monthly 사용자는 대기열로, app.utils.notification_digest)
+    # 주기마다 모인 알림이 최소 개수 이상이면 한 건으로, 적으면 원래 알림 그대로 보낸다
+    notification_digest_types: str = "reminder,system"
+    notification_digest_min_count: int = 2
+
+    # /api/batch 한 번에 받을 하위 요청 수와 동시에 실행할 하위 요청 수
+    batch_max_items: int = 50
+    batch_concurrency: int = 8
+
+    # 과부하 수용 제어 (워커 단위, 낮은 우선순위부터 503 + Retry-After)
+    admission_enabled: bool = True
+    admission_max_in_flight: int = 256
+    admission_low_priority_in_flight: int = 64
+    admission_loop_lag_ms: int = 200
+    admission_supabase_latency_ms: int = 1500
+    admission_retry_after_seconds: int = 5
+    admission_low_priority_paths: str = "/api/search,/api/v1/reflections/story,*/trending"
+    admission_critical_paths: str = "POST /api/v1/reflections/micro,POST /api/v1/reflections"
+    # 오래 열려 있는 스트림 (처리 중 요청 수에 넣지 않음, 자체 연결 수 제한 사용)
+    admission_exempt_paths: str = "/api/notifications/notifications/stream"
     
     class Config:
         env_file = ".env"
@@ -18,6 +18,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 
 from app.database import get_supabase
 from app.config import settings
+from app.utils.query_tracer import traced
 
 class ActivityCrawler:
     def __init__(self):
@@ -307,6 +308,7 @@ class ActivityCrawler:
         
         return list(majors)[:5]  # 최대 5개
     
+    @traced("crawler:save_to_supabase")
     def save_to_supabase(self, activities: List[Dict]):
         """Supabase에 저장"""
         print(f"\n💾 Supabase에 저장 중... (총 {len(activities)}개)")
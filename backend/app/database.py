@@ -1,5 +1,6 @@
 from supabase import create_client, Client
 from app.config import settings
+from app.utils.instrumented_supabase import InstrumentedClient
 from typing import Optional
 import logging
 import traceback
@@ -9,15 +10,15 @@ logger = logging.getLogger(__name__)
 _supabase_client: Optional[Client] = None
 
 def get_supabase() -> Client:
-    """Supabase 클라이언트 반환 (싱글톤)"""
+    """Supabase 클라이언트 반환 (싱글톤, 호출 메트릭 계측 래퍼 적용)"""
     global _supabase_client
     if _supabase_client is None:
         try:
             # proxy 인자를 제거하고 기본 설정만 사용
-            _supabase_client = create_client(
+            _supabase_client = InstrumentedClient(create_client(
                 supabase_url=settings.supabase_url,
                 supabase_key=settings.supabase_service_key
-            )
+            ))
             logger.info("Supabase 클라이언트 초기화 성공")
         except Exception:
             # 콘솔에 전체 스택트레이스 출력 (디버깅용)
@@ -0,0 +1,327 @@
+"""
+쓰기 이벤트 버스 (프로세스 내, 비동기)
+
+쓰기가 성공한 뒤 라우트가 타입 있는 이벤트(LogCreated, MicroLogDeleted, SpaceUpdated, ...)를
+발행하면 구독자가 캐시 / 카운터 / 검색 색인 등 파생 데이터를 갱신한다.
+
+- inline 구독자: publish 안에서 바로 실행 (캐시 태그 무효화처럼 빠르고 read-your-writes 가 필요한 일)
+- 큐 구독자: 구독자마다 크기 제한이 있는 큐와 워커 태스크를 두고 요청 경로 밖에서 실행
+  큐가 가득 차면 이벤트를 버리고 events_dropped_total 로 기록 (요청을 막지 않음)
+
+이벤트는 같은 워커 안에서만 전달된다. 다른 워커로 퍼져야 하는 캐시는
+app.cache 의 공유 백엔드(태그 버전)를 통해 무효화된다.
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Type
+
+from app.config import settings
+from app.utils.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+events_published_total = registry.counter(
+    "events_published_total", "발행된 이벤트 수", ("event",)
+)
+events_dropped_total = registry.counter(
+    "events_dropped_total", "큐가 가득 차 버린 이벤트 수", ("subscriber",)
+)
+events_failed_total = registry.counter(
+    "events_failed_total", "구독자 처리 실패 수", ("subscriber",)
+)
+events_queue_depth = registry.gauge(
+    "events_queue_depth", "구독자 큐에 쌓인 이벤트 수", ("subscriber",)
+)
+events_handle_seconds = registry.histogram(
+    "events_handle_seconds", "구독자 처리 시간(초)", ("subscriber",)
+)
+
+
+# ===== 이벤트 =====
+
+@dataclass(frozen=True)
+class Event:
+    """모든 쓰기 이벤트의 기반 (user_id 기준)"""
+    user_id: str
+    occurred_at: datetime = field(default_factory=datetime.now, kw_only=True)
+
+    # 이 이벤트로 무효화할 캐시 태그 리소스 이름 (user:{user_id}:{resource})
+    resource = None
+
+    @property
+    def name(self) -> str:
+        return type(self).__name__
+
+    def cache_tags(self) -> List[str]:
+        return [f"user:{self.user_id}:{self.resource}"] if self.resource else []
+
+
+@dataclass(frozen=True)
+class LogCreated(Event):
+    log_id: str
+    project_id: Optional[str] = None
+    resource = "logs"
+
+
+@dataclass(frozen=True)
+class LogUpdated(Event):
+    log_id: str
+    resource = "logs"
+
+
+@dataclass(frozen=True)
+class LogDeleted(Event):
+    log_id: str
+    resource = "logs"
+
+
+@dataclass(frozen=True)
+class ActiveDayEvent(Event):
+    """그날 활동한 것으로 치는 쓰기 (연속 기록 구독자가 구독)"""
+
+    def active_date(self) -> date:
+        return self.occurred_at.date()
+
+
+def micro_log_week_tag(user_id: str, day: date) -> str:
+    """마이크로 로그 주간 태그 (월요일 기준 주, 스토리 뷰 주간 집계 캐시)"""
+    return f"user:{user_id}:micro_logs:{(day - timedelta(days=day.weekday())).isoformat()}"
+
+
+@dataclass(frozen=True)
+class MicroLogCreated(ActiveDayEvent):
+    log_id: str
+    date: str
+    activity_type: Optional[str] = None
+    mood_compare: Optional[str] = None
+    space_id: Optional[str] = None
+    tags: Tuple[str, ...] = ()
+    resource = "micro_logs"
+
+    def active_date(self) -> date:
+        return date.fromisoformat(self.date[:10])
+
+    def cache_tags(self) -> List[str]:
+        return [*super().cache_tags(), micro_log_week_tag(self.user_id, self.active_date())]
+
+
+@dataclass(frozen=True)
+class MicroLogDeleted(Event):
+    log_id: str
+    date: Optional[str] = None
+    resource = "micro_logs"
+
+    def cache_tags(self) -> List[str]:
+        tags = super().cache_tags()
+        if self.date:
+            tags.append(micro_log_week_tag(self.user_id, date.fromisoformat(self.date[:10])))
+        return tags
+
+
+def reflection_active_date(reflection: Dict[str, Any]) -> Optional[date]:
+    """회고를 활동한 날로 칠 날짜: reflection_date, 없으면 created_at 의 날짜
+    (실시간 갱신과 streak_jobs 백필이 같은 규칙을 쓴다)"""
+    value = reflection.get("reflection_date") or reflection.get("created_at")
+    return date.fromisoformat(str(value)[:10]) if value else None
+
+
+@dataclass(frozen=True)
+class ReflectionCreated(ActiveDayEvent):
+    reflection_id: str
+    template_id: Optional[str] = None
+    reflection_date: Optional[str] = None
+    created_at: Optional[str] = None
+    resource = "reflections"
+
+    def active_date(self) -> date:
+        day = reflection_active_date({"reflection_date": self.reflection_date, "created_at": self.created_at})
+        return day or self.occurred_at.date()
+
+
+@dataclass(frozen=True)
+class ReflectionDeleted(Event):
+    reflection_id: str
+    resource = "reflections"
+
+
+@dataclass(frozen=True)
+class SpaceCreated(Event):
+    space_id: str
+    resource = "spaces"
+
+
+@dataclass(frozen=True)
+class SpaceUpdated(Event):
+    space_id: str
+    fields: Tuple[str, ...] = ()
+    resource = "spaces"
+
+
+@dataclass(frozen=True)
+class SpaceCompleted(Event):
+    space_id: str
+    resource = "spaces"
+
+
+@dataclass(frozen=True)
+class UserKeywordAdded(Event):
+    keyword_id: str
+    resource = "keywords"
+
+
+@dataclass(frozen=True)
+class UserKeywordRemoved(Event):
+    keyword_id: str
+    resource = "keywords"
+
+
+@dataclass(frozen=True)
+class LogKeywordAdded(Event):
+    log_id: str
+    keyword_id: str
+    resource = "keywords"
+
+
+@dataclass(frozen=True)
+class HealthCheckRecorded(ActiveDayEvent):
+    date: str
+    health_score: int
+    resource = "health"
+
+    def active_date(self) -> date:
+        return date.fromisoformat(self.date[:10])
+
+
+@dataclass(frozen=True)
+class NotificationEvent(Event):
+    """알림 이벤트 기반 (알림 스트림 / 읽지 않은 개수 구독자가 구독)"""
+    resource = "notifications"
+
+
+@dataclass(frozen=True)
+class NotificationCreated(NotificationEvent):
+    notification_id: str
+    notification: Dict[str, Any] = field(default_factory=dict, hash=False, compare=False)
+
+
+@dataclass(frozen=True)
+class NotificationsRead(NotificationEvent):
+    notification_ids: Tuple[str, ...] = ()
+
+
+# ===== 버스 =====
+
+Handler = Callable[[Event], Awaitable[Any]]
+
+
+class _Subscriber:
+    def __init__(self, name: str, event_type: Type[Event], handler: Handler, queue_size: int):
+        self.name = name
+        self.event_type = event_type
+        self.handler = handler
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.task: Optional[asyncio.Task] = None
+
+
+class EventBus:
+    """타입별 구독 (isinstance 기준, Event 를 구독하면 모든 이벤트 수신)"""
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._inline: List[Tuple[str, Type[Event], Handler]] = []
+        self._subscribers: List[_Subscriber] = []
+        self._closing = False
+
+    def subscribe(
+        self,
+        event_type: Type[Event],
+        handler: Handler,
+        name: Optional[str] = None,
+        inline: bool = False,
+        queue_size: Optional[int] = None,
+    ) -> None:
+        name = name or f"{handler.__module__}.{handler.__qualname__}"
+        if inline:
+            self._inline.append((name, event_type, handler))
+        else:
+            self._subscribers.append(_Subscriber(name, event_type, handler, queue_size or self.queue_size))
+
+    def on(self, event_type: Type[Event], **options) -> Callable[[Handler], Handler]:
+        """구독 데코레이터"""
+        def decorator(handler: Handler) -> Handler:
+            self.subscribe(event_type, handler, **options)
+            return handler
+        return decorator
+
+    async def _observe(self, name: str, handler: Handler, event: Event) -> None:
+        started = time.perf_counter()
+        try:
+            await handler(event)
+        except Exception:
+            events_failed_total.inc(subscriber=name)
+            logger.exception(f"이벤트 처리 실패: {name} ({event.name})")
+        finally:
+            events_handle_seconds.observe(time.perf_counter() - started, subscriber=name)
+
+    async def publish(self, event: Event) -> None:
+        """쓰기 성공 후 호출. inline 구독자를 실행하고 큐 구독자에 전달 (큐 대기 없음)"""
+        events_published_total.inc(event=event.name)
+        for name, event_type, handler in self._inline:
+            if isinstance(event, event_type):
+                await self._observe(name, handler, event)
+
+        if self._closing:
+            return
+        for subscriber in self._subscribers:
+            if not isinstance(event, subscriber.event_type):
+                continue
+            self._ensure_worker(subscriber)
+            try:
+                subscriber.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                events_dropped_total.inc(subscriber=subscriber.name)
+                logger.warning(f"이벤트 큐가 가득 차 {event.name} 를 버립니다: {subscriber.name}")
+                continue
+            events_queue_depth.set(subscriber.queue.qsize(), subscriber=subscriber.name)
+
+    def _ensure_worker(self, subscriber: _Subscriber) -> None:
+        if subscriber.task is None or subscriber.task.done():
+            subscriber.task = asyncio.get_running_loop().create_task(self._worker(subscriber))
+
+    async def _worker(self, subscriber: _Subscriber) -> None:
+        while True:
+            event = await subscriber.queue.get()
+            try:
+                await self._observe(subscriber.name, subscriber.handler, event)
+            finally:
+                subscriber.queue.task_done()
+                events_queue_depth.set(subscriber.queue.qsize(), subscriber=subscriber.name)
+
+    def stats(self) -> Dict[str, int]:
+        return {s.name: s.queue.qsize() for s in self._subscribers}
+
+    async def drain(self, timeout: float = 5.0) -> None:
+        """새 이벤트를 받지 않고 남은 큐를 처리한 뒤 워커 종료 (종료 시 호출)"""
+        self._closing = True
+        pending = [s for s in self._subscribers if s.task is not None]
+        try:
+            async with asyncio.timeout(timeout):
+                for subscriber in pending:
+                    await subscriber.queue.join()
+        except TimeoutError:
+            logger.warning(f"이벤트 큐 정리 시간 초과: {self.stats()}")
+        for subscriber in pending:
+            subscriber.task.cancel()
+        await asyncio.gather(*(s.task for s in pending), return_exceptions=True)
+        for subscriber in pending:
+            subscriber.task = None
+            # 다음 이벤트 루프에서 다시 쓸 수 있도록 큐를 새로 만든다
+            subscriber.queue = asyncio.Queue(maxsize=subscriber.queue.maxsize)
+        self._closing = False
+
+
+bus = EventBus(queue_size=settings.event_queue_size)
+publish = bus.publish
@@ -1,13 +1,30 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.staticfiles import StaticFiles
 from datetime import datetime
 from app.config import settings
+from app.cache import cache
+from app.events import bus
+from app import subscribers  # noqa: F401  이벤트 구독자 등록
+from app.utils.llm_client import llm_client
+from app.utils.storage import get_storage
+from app.utils.documents import document_pipeline
+from app.utils.uploads import UploadSizeLimitMiddleware
+from app.utils.metrics import MetricsMiddleware
+from app.utils.query_tracer import QueryTraceMiddleware
+from app.utils.profiling import ProfilingMiddleware
+from app.utils.loop_monitor import loop_monitor
+from app.utils.admission import AdmissionControlMiddleware
+from app.utils.counter_buffer import counter_buffer
+from app.utils.responses import FastJSONResponse
+from app.utils.http_cache import CompressionMiddleware, ConditionalGetMiddleware
 from app.routes import (
     auth, users, logs, projects, keywords, 
     evidence, endorsements, portfolios,
     reflections, recommendations, ai,
     dashboard, search, notifications, upload,
-    survey, health, spaces
+    survey, health, spaces, internal,
+    activities, templates, batch
 )
 
 app = FastAPI(
@@ -15,9 +32,18 @@ app = FastAPI(
     description="상경계열 학생 경험 관리 플랫폼 (FastAPI + Supabase)",
     version="2.0.0",
     docs_url="/api/docs",
-    redoc_url="/api/redoc"
+    redoc_url="/api/redoc",
+    default_response_class=FastJSONResponse,
 )
 
+# 조건부 GET(ETag/304) 후 압축 (압축 미들웨어가 바깥이어야 ETag 가 압축 전 본문 기준이 된다)
+app.add_middleware(ConditionalGetMiddleware)
+app.add_middleware(CompressionMiddleware)
+
+# 과부하 시 낮은 우선순위 요청부터 거절 (검색/트렌딩/스토리 → 일반, 핵심 쓰기는 유지)
+# CORS 보다 먼저 등록해 503 응답에도 CORS 헤더가 붙도록 한다
+app.add_middleware(AdmissionControlMiddleware)
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -27,6 +53,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 업로드 크기 제한 (본문 수신 전 Content-Length 로 거절)
+app.add_middleware(UploadSizeLimitMiddleware, path_prefixes=["/api/upload"])
+
+# 요청 단위 프로파일링 (PROFILING_ENABLED 일 때만 동작)
+app.add_middleware(ProfilingMiddleware)
+
+# 요청당 Supabase 호출 수 추적 / N+1 경고
+app.add_middleware(QueryTraceMiddleware)
+
+# 라우트별 지연시간 / 상태 코드 / 처리 중 요청 수 (가장 바깥에서 측정)
+app.add_middleware(MetricsMiddleware, exclude_paths=["/metrics"])
+
 # 라우터 등록 (프론트엔드 API 명세서에 맞춰 /api/v1 제거)
 app.include_router(auth.router, prefix="/auth", tags=["인증"])
 app.include_router(users.router, prefix="/users", tags=["사용자 관리"])
@@ -46,6 +84,31 @@ app.include_router(endorsements.router, prefix="/api/endorsements", tags=["동
 app.include_router(survey.router, prefix="/api/v1/survey", tags=["설문"])
 app.include_router(health.router, prefix="/api/v1", tags=["헬스체크"])
 app.include_router(spaces.router, tags=["스페이스"])
+app.include_router(internal.router, tags=["내부"])
+app.include_router(activities.router)  # /api/v1/recommendations (trending, deadline-soon 등)
+app.include_router(templates.router)  # /api/v1/templates
+app.include_router(batch.router, prefix="/api")  # /api/batch
+
+# 로컬 저장소 사용 시 업로드 파일 제공 (Supabase Storage 대체)
+if settings.storage_backend == "local":
+    app.mount(settings.storage_public_base_url, StaticFiles(directory=get_storage().root), name="files")
+
+@app.on_event("startup")
+async def startup():
+    """이벤트 루프 지연 모니터 / 카운터 반영 작업 시작"""
+    if settings.loop_monitor_enabled:
+        loop_monitor.start()
+    counter_buffer.start()
+
+@app.on_event("shutdown")
+async def shutdown():
+    """종료 시 외부 커넥션 정리"""
+    await loop_monitor.stop()
+    await bus.drain()
+    await counter_buffer.stop()
+    await llm_client.close()
+    await document_pipeline.shutdown()
+    await cache.close()
 
 @app.get("/", tags=["Health Check"])
 async def root():
@@ -1,8 +1,12 @@
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import List, Optional
 from datetime import datetime, date
 from ..database import get_supabase
-from ..auth import get_current_user
+from ..utils.auth import get_current_user
+from ..utils.coalesce import coalescing_cache
+from ..utils.counter_buffer import BOOKMARK, VIEW, counter_buffer
+from ..utils.responses import success_response
 from ..schemas import (
     ActivityCreate,
     ActivityResponse,
@@ -19,6 +23,10 @@ from ..schemas import (
 
 router = APIRouter(prefix="/api/v1/recommendations", tags=["Activity Recommendations"])
 
+# 사용자와 무관한 인기 목록 (동시 요청 합치기 + 짧은 TTL)
+trending_cache = coalescing_cache("trending_activities")
+deadline_soon_cache = coalescing_cache("deadline_soon_activities")
+
 def calculate_match_score(user_data: dict, activity: dict) -> tuple:
     """활동과 사용자 간 매칭 점수 계산"""
     score = 0.0
@@ -177,15 +185,12 @@ async def list_recommended_activities(
             activity['is_bookmarked'] = activity['id'] in bookmarked_ids
             activity['has_applied'] = activity['id'] in applied_ids
     
-    return SuccessResponse(
-        data={
-            "activities": scored_activities,
-            "total": len(scored_activities),
-            "page": page,
-            "per_page": limit
-        },
-        timestamp=datetime.now()
-    )
+    return success_response({
+        "activities": scored_activities,
+        "total": len(scored_activities),
+        "page": page,
+        "per_page": limit
+    })
 
 @router.get("/activities/{activity_id}", response_model=SuccessResponse)
 async def get_activity_detail(
@@ -207,9 +212,9 @@ async def get_activity_detail(
     
     activity = activity_response.data[0]
     
-    # 조회수 증가
-    supabase.rpc("increment_view_count", {"activity_uuid": activity_id}).execute()
-    activity['view_count'] = activity.get('view_count', 0) + 1
+    # 조회수 증가 (버퍼에 모아 주기적으로 반영, 응답에는 미반영분 포함)
+    counter_buffer.add(activity_id, VIEW)
+    activity['view_count'] = (activity.get('view_count') or 0) + counter_buffer.pending(activity_id, VIEW)
     
     # 북마크 여부 확인
     bookmark_response = supabase.table("user_bookmarks")\
@@ -272,7 +277,7 @@ async def bookmark_activity(
     response = supabase.table("user_bookmarks").insert(bookmark_data).execute()
     
     # 북마크 카운트 증가
-    supabase.rpc("increment_bookmark_count", {"activity_uuid": activity_id}).execute()
+    counter_buffer.add(activity_id, BOOKMARK)
     
     return SuccessResponse(
         data={"bookmark": response.data[0]},
@@ -299,7 +304,7 @@ async def unbookmark_activity(
         raise HTTPException(status_code=404, detail="북마크를 찾을 수 없습니다")
     
     # 북마크 카운트 감소
-    supabase.rpc("decrement_bookmark_count", {"activity_uuid": activity_id}).execute()
+    counter_buffer.add(activity_id, BOOKMARK, -1)
     
     return SuccessResponse(
         data={},
@@ -336,15 +341,12 @@ async def list_bookmarks(
             activity['days_left'] = calculate_days_left(activity.get('application_end_date'))
             activity['is_bookmarked'] = True
     
-    return SuccessResponse(
-        data={
-            "bookmarks": bookmarks,
-            "total": len(bookmarks),
-            "page": page,
-            "per_page": limit
-        },
-        timestamp=datetime.now()
-    )
+    return success_response({
+        "bookmarks": bookmarks,
+        "total": len(bookmarks),
+        "page": page,
+        "per_page": limit
+    })
 
 @router.post("/activities/{activity_id}/apply", response_model=SuccessResponse)
 async def apply_to_activity(
@@ -528,22 +530,27 @@ async def get_trending_activities(
     supabase = Depends(get_supabase)
 ):
     """인기 활동 조회"""
-    user_id = current_user['id']
-    
-    # 조회수와 북마크 수가 높은 활동
-    response = supabase.table("activities")\
-        .select("*")\
-        .eq("status", "active")\
-        .gte("application_end_date", date.today().isoformat())\
-        .order("bookmark_count", desc=True)\
-        .limit(limit)\
-        .execute()
+    today = date.today()
     
-    activities = response.data or []
+    async def load():
+        # 조회수와 북마크 수가 높은 활동
+        response = await asyncio.to_thread(
+            supabase.table("activities")
+            .select("*")
+            .eq("status", "active")
+            .gte("application_end_date", today.isoformat())
+            .order("bookmark_count", desc=True)
+            .limit(limit)
+            .execute
+        )
+        activities = response.data or []
+        
+        # days_left 추가
+        for activity in activities:
+            activity['days_left'] = calculate_days_left(activity.get('application_end_date'))
+        return activities
     
-    # days_left 추가
-    for activity in activities:
-        activity['days_left'] = calculate_days_left(activity.get('application_end_date'))
+    activities = await trending_cache.get((today, limit), load)
     
     return SuccessResponse(
         data={"activities": activities},
@@ -558,26 +565,30 @@ async def get_deadline_soon_activities(
     supabase = Depends(get_supabase)
 ):
     """마감 임박 활동 조회"""
-    user_id = current_user['id']
-    
     from datetime import timedelta
     
-    deadline = date.today() + timedelta(days=days)
-    
-    response = supabase.table("activities")\
-        .select("*")\
-        .eq("status", "active")\
-        .gte("application_end_date", date.today().isoformat())\
-        .lte("application_end_date", deadline.isoformat())\
-        .order("application_end_date")\
-        .limit(limit)\
-        .execute()
-    
-    activities = response.data or []
+    today = date.today()
+    deadline = today + timedelta(days=days)
+    
+    async def load():
+        response = await asyncio.to_thread(
+            supabase.table("activities")
+            .select("*")
+            .eq("status", "active")
+            .gte("application_end_date", today.isoformat())
+            .lte("application_end_date", deadline.isoformat())
+            .order("application_end_date")
+            .limit(limit)
+            .execute
+        )
+        activities = response.data or []
+        
+        # days_left 추가
+        for activity in activities:
+            activity['days_left'] = calculate_days_left(activity.get('application_end_date'))
+        return activities
     
-    # days_left 추가
-    for activity in activities:
-        activity['days_left'] = calculate_days_left(activity.get('application_end_date'))
+    activities = await deadline_soon_cache.get((today, days, limit), load)
     
     return SuccessResponse(
         data={"activities": activities},
@@ -1,14 +1,43 @@
 from fastapi import APIRouter, HTTPException, Header, Depends
+from fastapi.responses import StreamingResponse
 from datetime import datetime
 from typing import List
 from pydantic import BaseModel
 from app.database import get_supabase
 from app.schemas import SuccessResponse
 from app.utils.auth import get_current_user_id
+from app.utils.ai_cache import ai_analysis_cache
+from app.utils.llm_client import llm_client, LLMError, LLMTimeoutError
+import json
 import os
 
 router = APIRouter()
 
+KEYWORD_COLORS = ["blue", "purple", "yellow", "green", "pink"]
+
+FEEDBACK_SYSTEM_PROMPT = (
+    "당신은 상경계열 학생의 회고를 읽고 성장 피드백을 주는 커리어 코치입니다. "
+    '{"feedback": str, "suggestions": [str], "improvement_areas": [str], "strengths": [str]} '
+    "형식의 JSON 으로만 응답하세요."
+)
+
+PROJECT_SYSTEM_PROMPT = (
+    "당신은 학생의 프로젝트 기록을 요약하는 분석가입니다. "
+    '{"ai_summary": str, "key_achievements": [str]} 형식의 JSON 으로만 응답하세요.'
+)
+
+
+def build_feedback_messages(reflection_content: str, progress_score, mood: str, previous_reflections: List[str]) -> List[dict]:
+    """회고 피드백 프롬프트 구성"""
+    context = "\n".join(previous_reflections)
+    return [
+        {"role": "system", "content": FEEDBACK_SYSTEM_PROMPT},
+        {
+            "role": "user",
+            "content": f"이전 회고: {context}\n현재 회고: {reflection_content}\n기분: {mood}\n진행도: {progress_score}\n\n피드백을 제공해주세요."
+        }
+    ]
+
 class TagSuggestionRequest(BaseModel):
     """AI 태그 제안 요청"""
     activity_type: str
@@ -82,15 +111,20 @@ async def extract_keywords(
     try:
         content = data.get("content", "")
         
-        # TODO: OpenAI GPT-4 API 호출
-        # prompt = f"다음 텍스트에서 역량 키워드를 추출해주세요: {content}"
-        
-        # 임시 키워드 (실제로는 AI API 사용)
-        keywords = [
-            {"text": "데이터분석", "color": "blue", "confidence": 0.92},
-            {"text": "팀워크", "color": "purple", "confidence": 0.89},
-            {"text": "리더십", "color": "yellow", "confidence": 0.87}
-        ]
+        if llm_client.enabled and content.strip():
+            # 짧은 텍스트는 다른 요청과 함께 마이크로 배칭되어 한 번에 호출됨
+            extracted = await llm_client.extract_keywords(content, user_id=x_user_id)
+            keywords = [
+                {"text": text, "color": KEYWORD_COLORS[idx % len(KEYWORD_COLORS)], "confidence": None}
+                for idx, text in enumerate(extracted)
+            ]
+        else:
+            # 임시 키워드 (OpenAI 키 미설정 시)
+            keywords = [
+                {"text": "데이터분석", "color": "blue", "confidence": 0.92},
+                {"text": "팀워크", "color": "purple", "confidence": 0.89},
+                {"text": "리더십", "color": "yellow", "confidence": 0.87}
+            ]
         
         suggested_tags = [
             {"text": "협업", "bgColor": "#DDF3EB", "textColor": "#186D50"},
@@ -104,6 +138,8 @@ async def extract_keywords(
             },
             timestamp=datetime.now()
         )
+    except LLMTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -119,41 +155,96 @@ async def generate_feedback(
         mood = data.get("mood", "good")
         previous_reflections = data.get("previous_reflections", [])
         
-        # TODO: OpenAI GPT-4 API 호출
-        # context = "\n".join(previous_reflections)
-        # prompt = f"이전 회고: {context}\n현재 회고: {reflection_content}\n기분: {mood}\n진행도: {progress_score}\n\n피드백을 제공해주세요."
-        
-        # 임시 피드백 (실제로는 AI API 사용)
-        feedback = "훌륭한 진행 상황입니다. 데이터 분석 완료는 프로젝트의 중요한 이정표입니다. 꾸준히 발전하고 있습니다."
-        
-        suggestions = [
-            "다음 단계로 시각화 작업을 진행해보세요",
-            "팀원들과 분석 결과를 공유하면 좋을 것 같습니다",
-            "문서화를 시작하면 나중에 도움이 될 것입니다"
-        ]
-        
-        improvement_areas = [
-            "시간 관리: 다음에는 분석 단계를 세분화하여 시간 예측을 개선해보세요"
-        ]
-        
-        strengths = [
-            "꼼꼼한 데이터 분석",
-            "결과에 대한 만족도 높음",
-            "지속적인 노력"
-        ]
-        
-        return SuccessResponse(
-            data={
+        async def compute_feedback():
+            if llm_client.enabled:
+                result = await llm_client.chat_json(
+                    build_feedback_messages(reflection_content, progress_score, mood, previous_reflections),
+                    user_id=x_user_id,
+                    operation="generate_feedback"
+                )
+                return {
+                    "feedback": result.get("feedback", ""),
+                    "suggestions": result.get("suggestions", []),
+                    "improvement_areas": result.get("improvement_areas", []),
+                    "strengths": result.get("strengths", [])
+                }
+            
+            # 임시 피드백 (OpenAI 키 미설정 시)
+            feedback = "훌륭한 진행 상황입니다. 데이터 분석 완료는 프로젝트의 중요한 이정표입니다. 꾸준히 발전하고 있습니다."
+            
+            suggestions = [
+                "다음 단계로 시각화 작업을 진행해보세요",
+                "팀원들과 분석 결과를 공유하면 좋을 것 같습니다",
+                "문서화를 시작하면 나중에 도움이 될 것입니다"
+            ]
+            
+            improvement_areas = [
+                "시간 관리: 다음에는 분석 단계를 세분화하여 시간 예측을 개선해보세요"
+            ]
+            
+            strengths = [
+                "꼼꼼한 데이터 분석",
+                "결과에 대한 만족도 높음",
+                "지속적인 노력"
+            ]
+            
+            return {
                 "feedback": feedback,
                 "suggestions": suggestions,
                 "improvement_areas": improvement_areas,
                 "strengths": strengths
+            }
+        
+        # 동일 입력(회고 내용/기분/진행도/이전 회고)은 캐시된 분석 재사용
+        result = await ai_analysis_cache.get_or_compute(
+            "reflection_feedback",
+            x_user_id,
+            {
+                "reflection_content": reflection_content,
+                "progress_score": progress_score,
+                "mood": mood,
+                "previous_reflections": previous_reflections
             },
+            compute_feedback,
+            cacheable=llm_client.enabled
+        )
+        
+        return SuccessResponse(
+            data=result,
             timestamp=datetime.now()
         )
+    except LLMTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.post("/generate-feedback/stream")
+async def stream_feedback(
+    data: dict,
+    x_user_id: str = Header(..., alias="x-user-id")
+):
+    """회고 피드백 스트리밍 생성 (text/event-stream)"""
+    messages = build_feedback_messages(
+        data.get("reflection_content", ""),
+        data.get("progress_score", 5),
+        data.get("mood", "good"),
+        data.get("previous_reflections", [])
+    )
+    
+    async def event_stream():
+        try:
+            if llm_client.enabled:
+                async for delta in llm_client.stream_chat(messages, user_id=x_user_id, operation="generate_feedback_stream"):
+                    yield f"data: {json.dumps({'delta': delta}, ensure_ascii=False)}\n\n"
+            else:
+                placeholder = "훌륭한 진행 상황입니다. 꾸준히 발전하고 있습니다."
+                yield f"data: {json.dumps({'delta': placeholder}, ensure_ascii=False)}\n\n"
+            yield "data: [DONE]\n\n"
+        except LLMError as e:
+            yield f"event: error\ndata: {json.dumps({'message': str(e)}, ensure_ascii=False)}\n\n"
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
 @router.post("/analyze-project", response_model=SuccessResponse)
 async def analyze_project(
     data: dict,
@@ -173,25 +264,69 @@ async def analyze_project(
         # 프로젝트의 로그 가져오기
         logs = supabase.table("logs").select("*").eq("project_id", project_id).execute()
         
-        # TODO: OpenAI GPT-4 API로 프로젝트 분석
-        # all_content = "\n".join([log["content"] for log in logs.data])
+        async def compute_analysis():
+            if llm_client.enabled:
+                all_content = "\n".join([log.get("content") or "" for log in logs.data])
+                result = await llm_client.chat_json(
+                    [
+                        {"role": "system", "content": PROJECT_SYSTEM_PROMPT},
+                        {"role": "user", "content": f"프로젝트: {project.data[0].get('name')}\n\n기록:\n{all_content}"}
+                    ],
+                    user_id=x_user_id,
+                    operation="analyze_project"
+                )
+                ai_summary = result.get("ai_summary", "")
+                key_achievements = result.get("key_achievements", [])
+            else:
+                # 임시 요약 (OpenAI 키 미설정 시)
+                ai_summary = "이 프로젝트는 데이터 분석과 팀워크를 중심으로 진행되었습니다. 주요 성과로는 효율적인 협업과 문제 해결 능력 향상이 있습니다."
+                key_achievements = ["데이터 분석 완료", "팀워크 향상", "문제 해결"]
+            
+            return {
+                "ai_summary": ai_summary,
+                "key_achievements": key_achievements
+            }
         
-        ai_summary = "이 프로젝트는 데이터 분석과 팀워크를 중심으로 진행되었습니다. 주요 성과로는 효율적인 협업과 문제 해결 능력 향상이 있습니다."
+        # 프로젝트 정보와 로그 내용이 같으면 캐시된 분석 재사용
+        project_data = project.data[0]
+        result = await ai_analysis_cache.get_or_compute(
+            "project_analysis",
+            x_user_id,
+            {
+                "project": {
+                    "id": project_id,
+                    "name": project_data.get("name"),
+                    "description": project_data.get("description")
+                },
+                "logs": [
+                    {
+                        "title": log.get("title"),
+                        "content": log.get("content"),
+                        "reflection": log.get("reflection")
+                    }
+                    for log in sorted(logs.data, key=lambda l: str(l.get("id")))
+                ]
+            },
+            compute_analysis,
+            cacheable=llm_client.enabled
+        )
         
-        # 프로젝트 테이블 업데이트
+        # 프로젝트 테이블 업데이트 (캐시 적중 시에도 요약 반영)
         supabase.table("projects").update({
-            "ai_summary": ai_summary
+            "ai_summary": result["ai_summary"]
         }).eq("id", project_id).execute()
         
         return SuccessResponse(
             data={
-                "ai_summary": ai_summary,
+                "ai_summary": result["ai_summary"],
                 "total_logs": len(logs.data),
-                "key_achievements": ["데이터 분석 완료", "팀워크 향상", "문제 해결"]
+                "key_achievements": result["key_achievements"]
             },
             timestamp=datetime.now()
         )
     except HTTPException:
         raise
+    except LLMTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -0,0 +1,195 @@
+"""
+일괄 요청 엔드포인트
+
+여러 개의 작은 요청(알림 여러 개 읽음, 로그에 키워드 여러 개 연결, 마이크로 로그 여러 개 삭제 등)을
+한 번의 HTTP 요청으로 보낸다.
+
+    POST /api/batch
+    {"requests": [
+        {"id": "a", "method": "PATCH", "path": "/api/notifications/notifications/1/read"},
+        {"id": "b", "method": "DELETE", "path": "/api/v1/reflections/micro/2"}
+    ]}
+
+- 하위 요청은 HTTP 를 거치지 않고 앱 라우터를 직접 호출한다 (미들웨어 생략)
+- 인증은 배치 요청에서 한 번만 확인하고, 하위 요청에는 확인된 x-user-id 만 전달한다
+- 같은 라우트로 가는 하위 요청이 여러 개고 bulk 핸들러가 등록돼 있으면 한 번의 Supabase 호출로 처리
+- 나머지는 batch_concurrency 개까지 동시에 실행하고, 항목별 status / body 를 요청 순서대로 돌려준다
+"""
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from pydantic import BaseModel, Field
+from starlette.middleware.exceptions import ExceptionMiddleware
+from starlette.routing import Match
+
+from app.config import settings
+from app.utils.auth import get_current_user_id
+from app.utils.batching import BULK_HANDLERS, BatchItem, BulkWriteApplied
+from app.utils.query_tracer import trace_queries
+from app.utils.responses import dumps, success_response
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["일괄 처리"])
+
+ALLOWED_METHODS = {"GET", "POST", "PUT", "PATCH", "DELETE"}
+# 하위 요청에 그대로 넘기지 않는 헤더 (인증은 확인된 x-user-id 로 대체)
+_DROP_HEADERS = {b"authorization", b"x-user-id", b"content-length", b"content-type", b"accept-encoding", b"if-none-match"}
+
+
+class BatchSubRequest(BaseModel):
+    id: Optional[str] = None
+    method: str
+    path: str
+    body: Optional[Any] = None
+
+
+class BatchRequest(BaseModel):
+    requests: List[BatchSubRequest] = Field(..., min_length=1)
+
+
+def _match_route(request: Request, method: str, path: str) -> Tuple[Match, Optional[Any], Dict[str, Any]]:
+    """라우터와 같은 규칙으로 매칭 (PARTIAL 은 경로만 맞고 메서드가 다른 경우)"""
+    scope = {"type": "http", "method": method, "path": path, "root_path": ""}
+    partial = None
+    for route in request.app.router.routes:
+        match, child_scope = route.matches(scope)
+        if match == Match.FULL:
+            return match, route, child_scope.get("path_params", {})
+        if match == Match.PARTIAL and partial is None:
+            partial = route
+    return (Match.PARTIAL, partial, {}) if partial else (Match.NONE, None, {})
+
+
+async def _dispatch(request: Request, user_id: str, sub: BatchSubRequest) -> Tuple[int, Any]:
+    """하위 요청 하나를 앱 라우터에 직접 보내고 (status, body) 반환"""
+    url = urlsplit(sub.path)
+    body = b"" if sub.body is None else dumps(sub.body)
+    headers = [(k, v) for k, v in request.scope["headers"] if k not in _DROP_HEADERS]
+    headers.append((b"x-user-id", user_id.encode()))
+    if sub.body is not None:
+        headers.append((b"content-type", b"application/json"))
+    headers.append((b"content-length", str(len(body)).encode()))
+
+    scope = {
+        **request.scope,
+        "method": sub.method,
+        "path": url.path,
+        "raw_path": url.path.encode(),
+        "query_string": url.query.encode(),
+        "headers": headers,
+    }
+    for key in ("route", "endpoint", "path_params", "state"):
+        scope.pop(key, None)
+
+    received = False
+
+    async def receive():
+        nonlocal received
+        if received:
+            return {"type": "http.disconnect"}
+        received = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    status = 500
+    chunks: List[bytes] = []
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    # 라우터가 던지는 HTTPException / 검증 오류를 앱에 등록된 핸들러로 응답으로 바꾼다
+    app = ExceptionMiddleware(request.app.router, handlers=request.app.exception_handlers)
+    with trace_queries(f"batch {sub.method} {url.path}"):
+        await app(scope, receive, send)
+
+    raw = b"".join(chunks)
+    try:
+        return status, json.loads(raw) if raw else None
+    except ValueError:
+        return status, raw.decode("utf-8", "replace")
+
+
+@router.post("/batch")
+async def run_batch(
+    payload: BatchRequest,
+    request: Request,
+    user_id: str = Depends(get_current_user_id)
+):
+    """하위 요청 일괄 실행 (항목별 결과를 요청 순서대로 반환)"""
+    if len(payload.requests) > settings.batch_max_items:
+        raise HTTPException(status_code=400, detail=f"한 번에 최대 {settings.batch_max_items}개까지 요청할 수 있습니다")
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(payload.requests)
+    singles: List[int] = []
+    groups: Dict[Any, List[BatchItem]] = defaultdict(list)
+
+    for index, sub in enumerate(payload.requests):
+        sub.method = sub.method.upper()
+        path = urlsplit(sub.path).path
+        if sub.method not in ALLOWED_METHODS or not path.startswith("/"):
+            results[index] = {"status": 400, "body": {"detail": "지원하지 않는 하위 요청입니다"}}
+            continue
+        match, route, path_params = _match_route(request, sub.method, path)
+        if route is None:
+            results[index] = {"status": 404, "body": {"detail": "Not Found"}}
+            continue
+        endpoint = getattr(route, "endpoint", None)
+        if endpoint is run_batch:
+            results[index] = {"status": 400, "body": {"detail": "배치 안에 배치를 넣을 수 없습니다"}}
+            continue
+        if match == Match.FULL and endpoint in BULK_HANDLERS and not urlsplit(sub.path).query:
+            groups[endpoint].append(BatchItem(index, sub.method, path, path_params, sub.body))
+        else:
+            singles.append(index)
+
+    semaphore = asyncio.Semaphore(settings.batch_concurrency)
+
+    async def run_single(index: int) -> None:
+        async with semaphore:
+            try:
+                status, body = await _dispatch(request, user_id, payload.requests[index])
+            except Exception as e:
+                logger.exception(f"배치 하위 요청 실패: {payload.requests[index].path}")
+                status, body = 500, {"detail": str(e)}
+        results[index] = {"status": status, "body": body}
+
+    async def run_group(endpoint, items: List[BatchItem]) -> None:
+        if len(items) == 1:
+            singles_in_group = [items[0].index]
+        else:
+            try:
+                async with semaphore:
+                    outcomes = await BULK_HANDLERS[endpoint](user_id, items)
+                for item, (status, body) in zip(items, outcomes):
+                    results[item.index] = {"status": status, "body": body}
+                return
+            except BulkWriteApplied as e:
+                # 쓰기는 끝났으므로 처리한 항목은 그 결과로 응답하고 나머지만 하나씩 다시 실행
+                logger.exception(f"bulk 쓰기 후 처리 실패: {endpoint.__name__} x {len(items)}")
+                for position, (status, body) in e.results.items():
+                    results[items[position].index] = {"status": status, "body": body}
+                singles_in_group = [item.index for position, item in enumerate(items) if position not in e.results]
+            except Exception:
+                logger.exception(f"bulk 처리 실패, 하나씩 다시 실행: {endpoint.__name__} x {len(items)}")
+                singles_in_group = [item.index for item in items]
+        await asyncio.gather(*(run_single(index) for index in singles_in_group))
+
+    await asyncio.gather(
+        *(run_single(index) for index in singles),
+        *(run_group(endpoint, items) for endpoint, items in groups.items()),
+    )
+
+    return success_response({
+        "results": [
+            {"id": sub.id, **result} for sub, result in zip(payload.requests, results)
+        ]
+    })
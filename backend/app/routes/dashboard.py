@@ -1,11 +1,24 @@
-from fastapi import APIRouter, HTTPException, Header
+import asyncio
+import logging
+import time
+from fastapi import APIRouter, Depends, HTTPException, Header
 from datetime import datetime, timedelta
+from typing import Any, Callable, Dict
 from app.database import get_supabase
 from app.schemas import SuccessResponse
+from app.routes.users import user_profile
+from app.utils.auth import get_current_user_id
+from app.utils.query_tracer import query_budget
+from app.utils.responses import success_response
+from app.utils.streaks import streak_from_rows
+from app.utils.unread_counter import unread_from_rows
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
 @router.get("/stats", response_model=SuccessResponse)
+@query_budget(12)
 async def get_dashboard_stats(
     x_user_id: str = Header(..., alias="x-user-id")
 ):
@@ -56,15 +69,14 @@ async def get_dashboard_stats(
         scores = [r.get('progress_score', 0) for r in reflections_data.data if r.get('progress_score')]
         avg_progress = sum(scores) / len(scores) if scores else 0
         
-        # 연속 작성일 계산
-        recent_dates = supabase.table("reflections")\
-            .select("reflection_date")\
+        # 연속 기록 (user_streaks 한 행)
+        streak = supabase.table("user_streaks")\
+            .select("current_streak, longest_streak, last_active_date")\
             .eq("user_id", x_user_id)\
-            .order("reflection_date", desc=True)\
-            .limit(30)\
+            .limit(1)\
             .execute()
         
-        streak_days = calculate_streak(recent_dates.data)
+        streak_stats = streak_from_rows(streak.data)
         
         return SuccessResponse(
             data={
@@ -74,7 +86,8 @@ async def get_dashboard_stats(
                 "total_reflections": reflections_count.count or 0,
                 "active_projects": active_projects.count or 0,
                 "active_spaces": active_spaces.count or 0,
-                "reflection_streak": streak_days,
+                "reflection_streak": streak_stats["current"],
+                "longest_streak": streak_stats["longest"],
                 "avg_progress_score": round(avg_progress, 2),
                 "this_week": {
                     "logs": this_week_logs.count or 0,
@@ -90,37 +103,6 @@ async def get_dashboard_stats(
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-def calculate_streak(reflections_data):
-    """연속 작성일 계산"""
-    if not reflections_data:
-        return 0
-    
-    from datetime import date
-    
-    dates = sorted([
-        datetime.fromisoformat(r['reflection_date']).date() 
-        if isinstance(r['reflection_date'], str) 
-        else r['reflection_date']
-        for r in reflections_data
-    ], reverse=True)
-    
-    if not dates:
-        return 0
-    
-    today = date.today()
-    streak = 0
-    current_date = today
-    
-    for reflection_date in dates:
-        if reflection_date == current_date:
-            streak += 1
-            current_date -= timedelta(days=1)
-        elif reflection_date < current_date:
-            # 날짜가 건너뛰어짐
-            break
-    
-    return streak
-
 @router.get("/recent-activity", response_model=SuccessResponse)
 async def get_recent_activity(
     x_user_id: str = Header(..., alias="x-user-id")
@@ -224,3 +206,206 @@ async def get_reflection_overview(
         )
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
+
+
+# ===== 홈 (대시보드 통합 조회) =====
+
+async def _timed(name: str, fetch: Callable[[], Any], timings: Dict[str, float]) -> Any:
+    """동기 Supabase 조회를 스레드에서 실행하고 소요 시간(ms) 기록"""
+    started = time.perf_counter()
+    try:
+        return await asyncio.to_thread(fetch)
+    finally:
+        timings[name] = round((time.perf_counter() - started) * 1000, 1)
+
+
+def _days_ago(days: int) -> str:
+    return (datetime.now() - timedelta(days=days)).date().isoformat()
+
+
+@router.get("/home", response_model=SuccessResponse)
+@query_budget(13)
+async def get_dashboard_home(user_id: str = Depends(get_current_user_id)):
+    """대시보드 첫 화면 통합 조회
+
+    /stats, /recent-activity, /reflection-overview, /api/notifications/unread-count, /users/me 를
+    한 번에 돌려준다. 겹치는 조회(회고, 스페이스, 로그 수, 프로젝트)는 한 번만 하고
+    모든 조회를 동시에 실행한다. 일부 조회가 실패하면 해당 섹션만 null 과 errors 로 표시한다.
+    전체 개수는 count="exact" 로만 세고, 회고 행은 최근 30일만 읽는다
+    (평균 진행도와 개요의 최근 회고도 최근 30일 기준).
+    """
+    supabase = get_supabase()
+    month_ago = (datetime.now() - timedelta(days=30)).isoformat()
+    month_ago_date = _days_ago(30)
+    timings: Dict[str, float] = {}
+
+    queries = {
+        "user": lambda: supabase.table("users").select("*").eq("id", user_id).execute(),
+        "logs_total": lambda: supabase.table("logs").select("id", count="exact").eq("user_id", user_id).execute(),
+        "logs_month": lambda: supabase.table("logs").select("created_at").eq("user_id", user_id).gte("created_at", month_ago).execute(),
+        "recent_logs": lambda: supabase.table("logs").select("id, title, created_at, projects (name)")
+            .eq("user_id", user_id).order("created_at", desc=True).limit(5).execute(),
+        "projects_total": lambda: supabase.table("projects").select("id", count="exact").eq("user_id", user_id).limit(1).execute(),
+        "projects_active": lambda: supabase.table("projects").select("id", count="exact")
+            .eq("user_id", user_id).eq("status", "active").limit(1).execute(),
+        "keywords_total": lambda: supabase.table("user_keywords").select("id", count="exact").eq("user_id", user_id).execute(),
+        "reflections_total": lambda: supabase.table("reflections").select("id", count="exact").eq("user_id", user_id).limit(1).execute(),
+        # 최근 30일 회고: 이번 주 / 이번 달 수, 평균 진행도, 개요의 최근 회고를 이 한 번의 조회로 계산
+        "reflections": lambda: supabase.table("reflections")
+            .select("id, mood, progress_score, reflection_date, space_id, created_at")
+            .eq("user_id", user_id).gte("reflection_date", month_ago_date).execute(),
+        "recent_reflections": lambda: supabase.table("reflections")
+            .select("id, ai_feedback, mood, reflection_date, space_id, created_at")
+            .eq("user_id", user_id).order("created_at", desc=True).limit(5).execute(),
+        # 활성 스페이스 수 / 개요 / 회고의 스페이스 이름
+        "spaces": lambda: supabase.table("reflection_spaces")
+            .select("id, name, type, status, total_reflections, expected_reflections, next_reflection_date")
+            .eq("user_id", user_id).execute(),
+        "unread": lambda: supabase.table("notification_unread_counts").select("unread_count")
+            .eq("user_id", user_id).limit(1).execute(),
+        "streak": lambda: supabase.table("user_streaks").select("current_streak, longest_streak, last_active_date")
+            .eq("user_id", user_id).limit(1).execute(),
+    }
+
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(_timed(name, fetch, timings) for name, fetch in queries.items()),
+        return_exceptions=True,
+    )
+    fetched = dict(zip(queries, results))
+    failed = {name: str(result) for name, result in fetched.items() if isinstance(result, Exception)}
+    for name, error in failed.items():
+        logger.warning(f"홈 조회 실패 ({name}): {error}")
+
+    def rows(name: str) -> list:
+        return fetched[name].data or []
+
+    def count(name: str) -> int:
+        return fetched[name].count or 0
+
+    sections: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+
+    def build(section: str, needs: tuple, builder: Callable[[], Any]) -> None:
+        missing = [name for name in needs if name in failed]
+        if missing:
+            sections[section] = None
+            errors[section] = "; ".join(f"{name}: {failed[name]}" for name in missing)
+            return
+        try:
+            sections[section] = builder()
+        except Exception as e:
+            logger.exception(f"홈 섹션 구성 실패 ({section})")
+            sections[section] = None
+            errors[section] = str(e)
+
+    def space_names() -> Dict[str, str]:
+        return {space["id"]: space.get("name") for space in rows("spaces")}
+
+    def build_stats() -> dict:
+        reflections = rows("reflections")
+        week_ago_date = _days_ago(7)
+        week_ago = (datetime.now() - timedelta(days=7)).isoformat()
+        dated = [r for r in reflections if r.get("reflection_date")]
+        scores = [r["progress_score"] for r in reflections if r.get("progress_score")]
+        streak = streak_from_rows(rows("streak"))
+        return {
+            "total_logs": count("logs_total"),
+            "total_projects": count("projects_total"),
+            "total_keywords": count("keywords_total"),
+            "total_reflections": count("reflections_total"),
+            "active_projects": count("projects_active"),
+            "active_spaces": sum(1 for space in rows("spaces") if space.get("status") == "active"),
+            "reflection_streak": streak["current"],
+            "longest_streak": streak["longest"],
+            "avg_progress_score": round(sum(scores) / len(scores), 2) if scores else 0,
+            "this_week": {
+                "logs": sum(1 for log in rows("logs_month") if log["created_at"] >= week_ago),
+                "reflections": sum(1 for r in dated if r["reflection_date"] >= week_ago_date),
+            },
+            "this_month": {
+                "logs": len(rows("logs_month")),
+                "reflections": sum(1 for r in dated if r["reflection_date"] >= month_ago_date),
+            },
+        }
+
+    def build_recent_activity() -> list:
+        names = space_names()
+        activities = []
+        for log in rows("recent_logs"):
+            project_name = log.get("projects", {}).get("name", "알 수 없음") if log.get("projects") else "알 수 없음"
+            activities.append({
+                "type": "log",
+                "title": log["title"],
+                "project_name": project_name,
+                "created_at": log["created_at"]
+            })
+        for reflection in rows("recent_reflections"):
+            space_name = names.get(reflection.get("space_id")) or "알 수 없음"
+            snippet = reflection.get("ai_feedback", "")[:50] + "..." if reflection.get("ai_feedback") else "회고 작성"
+            activities.append({
+                "type": "reflection",
+                "title": f"{space_name} 회고",
+                "snippet": snippet,
+                "mood": reflection.get("mood"),
+                "reflection_date": reflection.get("reflection_date"),
+                "created_at": reflection["created_at"]
+            })
+        activities.sort(key=lambda x: x["created_at"], reverse=True)
+        return activities[:10]
+
+    def build_reflection_overview() -> dict:
+        names = space_names()
+        active_spaces = sorted(
+            (
+                {key: space.get(key) for key in ("id", "name", "type", "total_reflections", "expected_reflections", "next_reflection_date")}
+                for space in rows("spaces") if space.get("status") == "active"
+            ),
+            # order("next_reflection_date") 와 같이 null 은 뒤로
+            key=lambda space: (space["next_reflection_date"] is None, space["next_reflection_date"] or ""),
+        )[:5]
+        recent = sorted(
+            (r for r in rows("reflections") if r.get("reflection_date")),
+            key=lambda r: r["reflection_date"],
+            reverse=True,
+        )[:5]
+        today = datetime.now().date()
+        due_today = [
+            space for space in active_spaces
+            if space.get("next_reflection_date") and
+            datetime.fromisoformat(space["next_reflection_date"]).date() <= today
+        ]
+        return {
+            "active_spaces": active_spaces,
+            "recent_reflections": [
+                {
+                    "id": r["id"],
+                    "mood": r.get("mood"),
+                    "progress_score": r.get("progress_score"),
+                    "reflection_date": r["reflection_date"],
+                    "reflection_spaces": {"name": names[r["space_id"]]} if r.get("space_id") in names else None,
+                }
+                for r in recent
+            ],
+            "due_today_count": len(due_today),
+            "due_today": due_today
+        }
+
+    def build_me() -> dict:
+        users = rows("user")
+        if not users:
+            raise ValueError("사용자를 찾을 수 없습니다")
+        streak = streak_from_rows(rows("streak"))["current"]
+        return user_profile(users[0], count("projects_total"), count("logs_total"), streak)
+
+    build("stats", (
+        "logs_total", "logs_month", "projects_total", "projects_active", "keywords_total",
+        "reflections_total", "reflections", "spaces", "streak",
+    ), build_stats)
+    build("recent_activity", ("recent_logs", "recent_reflections", "spaces"), build_recent_activity)
+    build("reflection_overview", ("reflections", "spaces"), build_reflection_overview)
+    build("unread_count", ("unread",), lambda: unread_from_rows(rows("unread")))
+    build("me", ("user", "projects_total", "logs_total", "streak"), build_me)
+
+    timings["total"] = round((time.perf_counter() - started) * 1000, 1)
+    return success_response({**sections, "errors": errors or None, "timings_ms": timings})
@@ -1,8 +1,11 @@
-from fastapi import APIRouter, HTTPException, Header, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, Header, UploadFile, File
 from datetime import datetime
 from typing import Optional
 from app.database import get_supabase
 from app.schemas import EvidenceCreate, SuccessResponse
+from app.utils.evidence_blobs import release_blob
+from app.utils.documents import document_pipeline
+from app.utils.projection import fields_query
 
 router = APIRouter(prefix="/evidence", tags=["evidence"])
 
@@ -35,12 +38,13 @@ async def create_evidence(
 @router.get("", response_model=SuccessResponse)
 async def list_evidence(
     x_user_id: str = Header(..., alias="x-user-id"),
-    project_id: Optional[str] = None
+    project_id: Optional[str] = None,
+    columns: str = Depends(fields_query("evidence"))
 ):
-    """증빙 자료 목록 조회"""
+    """증빙 자료 목록 조회 (ocr_text 등 전체 컬럼은 상세 조회에서)"""
     try:
         supabase = get_supabase()
-        query = supabase.table("evidence").select("*").eq("user_id", x_user_id)
+        query = supabase.table("evidence").select(columns).eq("user_id", x_user_id)
         
         if project_id:
             query = query.eq("project_id", project_id)
@@ -81,6 +85,10 @@ async def delete_evidence(evidence_id: str, x_user_id: str = Header(..., alias="
         if not response.data:
             raise HTTPException(status_code=404, detail="Evidence not found")
         
+        # 같은 파일을 참조하는 증빙이 더 없으면 저장소에서 삭제
+        deleted = response.data[0]
+        await release_blob(supabase, deleted.get("content_hash"), deleted.get("storage_key"))
+        
         return SuccessResponse(
             message="Evidence deleted successfully",
             timestamp=datetime.now()
@@ -110,27 +118,34 @@ async def verify_evidence(evidence_id: str, x_user_id: str = Header(..., alias="
 
 @router.post("/{evidence_id}/ocr", response_model=SuccessResponse)
 async def process_ocr(evidence_id: str, x_user_id: str = Header(..., alias="x-user-id")):
-    """증빙 자료 OCR 처리 (TODO: 실제 OCR 서비스 연동 필요)"""
+    """증빙 자료 텍스트 추출 / 썸네일 재처리 (프로세스 풀에서 실행)"""
     try:
         supabase = get_supabase()
         
-        # TODO: 실제 OCR 처리 로직 구현 (예: OpenAI Vision API, Google Cloud Vision)
-        # 현재는 더미 데이터로 처리
-        ocr_text = "OCR processing placeholder"
-        ocr_confidence = 0.95
-        
-        response = supabase.table("evidence").update({
-            "ocr_text": ocr_text,
-            "ocr_confidence": ocr_confidence
-        }).eq("id", evidence_id).eq("user_id", x_user_id).execute()
+        evidence = supabase.table("evidence")\
+            .select("id, content_hash, storage_key, mime_type")\
+            .eq("id", evidence_id)\
+            .eq("user_id", x_user_id)\
+            .execute()
         
-        if not response.data:
+        if not evidence.data:
             raise HTTPException(status_code=404, detail="Evidence not found")
         
+        row = evidence.data[0]
+        if not row.get("storage_key") or not row.get("content_hash"):
+            raise HTTPException(status_code=400, detail="업로드된 파일이 없는 증빙은 처리할 수 없습니다")
+        
+        # 같은 파일을 참조하는 모든 증빙 행이 함께 갱신됨
+        await document_pipeline.process_evidence(row["content_hash"], row["storage_key"], row["mime_type"])
+        
+        response = supabase.table("evidence").select("*").eq("id", evidence_id).execute()
+        
         return SuccessResponse(
             data={"evidence": response.data[0]},
             message="OCR processed successfully",
             timestamp=datetime.now()
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
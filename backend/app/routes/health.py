@@ -8,6 +8,7 @@ from typing import Optional
 from pydantic import BaseModel
 from app.database import get_supabase
 from app.utils.auth import get_current_user
+from app.events import HealthCheckRecorded, publish
 
 router = APIRouter()
 
@@ -53,6 +54,8 @@ async def create_health_check(
     if not result.data:
         raise HTTPException(status_code=500, detail="Failed to save health check")
     
+    await publish(HealthCheckRecorded(user_id, date=check_date, health_score=data.health_score))
+    
     return {
         "success": True,
         "data": result.data[0]
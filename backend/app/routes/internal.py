@@ -0,0 +1,52 @@
+"""
+내부 운영 엔드포인트 (x-internal-token 필요)
+- /metrics: Prometheus 텍스트 형식 메트릭
+- /internal/profiles: 최근 요청 프로파일 (speedscope JSON)
+- /internal/blocking: 이벤트 루프 지연 / 최근 블로킹 호출 지점
+"""
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import FileResponse, PlainTextResponse
+
+from app.utils.auth import require_internal_token
+from app.utils.loop_monitor import loop_monitor
+from app.utils.metrics import registry
+from app.utils.profiling import profile_store
+
+router = APIRouter(dependencies=[Depends(require_internal_token)])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics():
+    """프로세스 메트릭 (워커별 값이므로 수집기에서 인스턴스 단위로 합산)"""
+    return PlainTextResponse(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@router.get("/internal/profiles")
+async def list_profiles():
+    """최근 프로파일 목록 (최신순)"""
+    return {"success": True, "data": profile_store.list()}
+
+
+@router.get("/internal/profiles/{profile_id}")
+async def get_profile(profile_id: str):
+    """speedscope JSON 다운로드 (https://www.speedscope.app 에서 열기)"""
+    path = profile_store.path_for(profile_id)
+    if path is None:
+        raise HTTPException(status_code=404, detail="프로파일을 찾을 수 없습니다")
+    return FileResponse(path, media_type="application/json", filename=path.name)
+
+
+@router.get("/internal/blocking")
+async def blocking_reports():
+    """루프 지연과 최근 블로킹 호출 스택 (최신순)"""
+    return {
+        "success": True,
+        "data": {
+            "running": loop_monitor.running,
+            "lag_seconds": round(loop_monitor.lag, 4),
+            "lag_ewma_seconds": round(loop_monitor.lag_ewma, 4),
+            "reports": list(reversed(loop_monitor.reports)),
+        },
+    }
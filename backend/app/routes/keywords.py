@@ -1,19 +1,32 @@
+import asyncio
 from fastapi import APIRouter, HTTPException, Header
 from datetime import datetime
+from typing import Any, List, Tuple
 from app.database import get_supabase
 from app.schemas import SuccessResponse
+from app.utils.coalesce import coalescing_cache
+from app.events import LogKeywordAdded, UserKeywordAdded, UserKeywordRemoved, publish
+from app.utils.batching import BatchItem, after_write, bulk_handler
 
 router = APIRouter(prefix="/keywords", tags=["keywords"])
 
+# 키워드 마스터 (모든 사용자 공통, 동시 요청 합치기 + 짧은 TTL)
+keywords_cache = coalescing_cache("keywords")
+
 @router.get("", response_model=SuccessResponse)
 async def list_keywords():
     """키워드 마스터 목록 조회"""
     try:
         supabase = get_supabase()
-        response = supabase.table("keywords").select("*").execute()
+        
+        async def load():
+            response = await asyncio.to_thread(supabase.table("keywords").select("*").execute)
+            return response.data
+        
+        keywords = await keywords_cache.get("all", load)
         
         return SuccessResponse(
-            data={"keywords": response.data},
+            data={"keywords": keywords},
             timestamp=datetime.now()
         )
     except Exception as e:
@@ -62,6 +75,8 @@ async def add_user_keyword(keyword_id: str, x_user_id: str = Header(..., alias="
                 "experience_count": 1
             }).execute()
         
+        await publish(UserKeywordAdded(x_user_id, keyword_id=keyword_id))
+        
         return SuccessResponse(
             data={"user_keyword": response.data[0]},
             message="Keyword added successfully",
@@ -79,6 +94,7 @@ async def remove_user_keyword(keyword_id: str, x_user_id: str = Header(..., alia
         
         if not response.data:
             raise HTTPException(status_code=404, detail="User keyword not found")
+        await publish(UserKeywordRemoved(x_user_id, keyword_id=keyword_id))
         
         return SuccessResponse(
             message="Keyword removed successfully",
@@ -117,6 +133,7 @@ async def add_log_keyword(log_id: str, keyword_id: str, x_user_id: str = Header(
             "log_id": log_id,
             "keyword_id": keyword_id
         }).execute()
+        await publish(LogKeywordAdded(x_user_id, log_id=log_id, keyword_id=keyword_id))
         
         return SuccessResponse(
             data={"log_keyword": response.data[0]},
@@ -125,3 +142,28 @@ async def add_log_keyword(log_id: str, keyword_id: str, x_user_id: str = Header(
         )
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
+
+@bulk_handler(add_log_keyword)
+async def add_log_keywords_bulk(user_id: str, items: List[BatchItem]) -> List[Tuple[int, Any]]:
+    """/api/batch 의 로그-키워드 연결 묶음을 한 번의 다건 insert 로"""
+    rows = [
+        {"log_id": item.path_params["log_id"], "keyword_id": item.path_params["keyword_id"]}
+        for item in items
+    ]
+    supabase = get_supabase()
+    # 한 행이라도 실패하면 전체가 실패하고, 배치 엔드포인트가 하나씩 다시 실행한다
+    response = await asyncio.to_thread(lambda: supabase.table("log_keywords").insert(rows).execute())
+
+    timestamp = datetime.now()
+    results = [
+        (200, SuccessResponse(
+            data={"log_keyword": inserted},
+            message="Keyword added to log successfully",
+            timestamp=timestamp
+        ).model_dump(mode="json"))
+        for inserted in response.data
+    ]
+    async with after_write(dict(enumerate(results))):
+        for row in rows:
+            await publish(LogKeywordAdded(user_id, log_id=row["log_id"], keyword_id=row["keyword_id"]))
+    return results
@@ -1,11 +1,30 @@
-from fastapi import APIRouter, HTTPException, Header, Query
+from fastapi import APIRouter, HTTPException, Header, Query, Request
 from datetime import datetime
 from typing import Optional
 from app.database import get_supabase
 from app.schemas import LogCreate, LogUpdate, SuccessResponse
+from app.cache import cached
+from app.events import LogCreated, LogDeleted, LogUpdated, publish
+from app.utils.responses import success_response
+from app.utils.http_cache import versioned_etag, with_etag
 
 router = APIRouter(prefix="/logs", tags=["logs"])
 
+@cached(ttl=60, tags=["user:{user_id}:logs"])
+async def fetch_logs(user_id: str, project_id: Optional[str], period: Optional[str], page: int, limit: int) -> dict:
+    """사용자 로그 목록 조회 (Log* 이벤트가 user:{id}:logs 태그를 무효화)"""
+    supabase = get_supabase()
+    query = supabase.table("logs").select("*", count="exact").eq("user_id", user_id)
+    
+    if project_id:
+        query = query.eq("project_id", project_id)
+    if period:
+        query = query.eq("period", period)
+    
+    offset = (page - 1) * limit
+    response = query.order("created_at", desc=True).range(offset, offset + limit - 1).execute()
+    return {"logs": response.data, "total": response.count}
+
 @router.post("", response_model=SuccessResponse)
 async def create_log(log: LogCreate, x_user_id: str = Header(..., alias="x-user-id")):
     """경험 로그 생성"""
@@ -21,6 +40,7 @@ async def create_log(log: LogCreate, x_user_id: str = Header(..., alias="x-user-
             "period": log.period,
             "tags": log.tags,
         }).execute()
+        await publish(LogCreated(x_user_id, log_id=response.data[0]["id"], project_id=log.project_id))
         
         return SuccessResponse(
             data={"log": response.data[0]},
@@ -32,6 +52,7 @@ async def create_log(log: LogCreate, x_user_id: str = Header(..., alias="x-user-
 
 @router.get("", response_model=SuccessResponse)
 async def list_logs(
+    request: Request,
     x_user_id: str = Header(..., alias="x-user-id"),
     project_id: Optional[str] = Query(None),
     period: Optional[str] = Query(None),
@@ -40,26 +61,18 @@ async def list_logs(
 ):
     """경험 로그 목록 조회 (페이지네이션, 필터)"""
     try:
-        supabase = get_supabase()
-        query = supabase.table("logs").select("*", count="exact").eq("user_id", x_user_id)
-        
-        if project_id:
-            query = query.eq("project_id", project_id)
-        if period:
-            query = query.eq("period", period)
+        etag, not_modified = await versioned_etag(request, f"user:{x_user_id}:logs")
+        if not_modified:
+            return not_modified
         
-        offset = (page - 1) * limit
-        response = query.order("created_at", desc=True).range(offset, offset + limit - 1).execute()
+        result = await fetch_logs(x_user_id, project_id, period, page, limit)
         
-        return SuccessResponse(
-            data={
-                "logs": response.data,
-                "total": response.count,
-                "page": page,
-                "limit": limit
-            },
-            timestamp=datetime.now()
-        )
+        return with_etag(success_response({
+            "logs": result["logs"],
+            "total": result["total"],
+            "page": page,
+            "limit": limit
+        }), etag)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -94,6 +107,7 @@ async def update_log(log_id: str, log_update: LogUpdate, x_user_id: str = Header
         
         if not response.data:
             raise HTTPException(status_code=404, detail="Log not found")
+        await publish(LogUpdated(x_user_id, log_id=log_id))
         
         return SuccessResponse(
             data={"log": response.data[0]},
@@ -112,6 +126,7 @@ async def delete_log(log_id: str, x_user_id: str = Header(..., alias="x-user-id"
         
         if not response.data:
             raise HTTPException(status_code=404, detail="Log not found")
+        await publish(LogDeleted(x_user_id, log_id=log_id))
         
         return SuccessResponse(
             message="Log deleted successfully",
@@ -1,7 +1,18 @@
-from fastapi import APIRouter, HTTPException, Header, Query
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Header, Query
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from datetime import datetime
+from typing import Any, List, Optional, Tuple
+from app.config import settings
 from app.database import get_supabase
 from app.schemas import SuccessResponse
+from app.events import NotificationCreated, NotificationsRead, publish
+from app.utils.auth import get_stream_user_id
+from app.utils.batching import BatchItem, after_write, bulk_handler
+from app.utils.notification_digest import defer_digest_notifications
+from app.utils.notification_stream import StreamLimitExceeded, event_stream, notification_hub
+from app.utils.unread_counter import adjust_unread, count_unread, mark_all_read
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
 
@@ -21,9 +32,6 @@ async def list_notifications(
         
         response = query.order("created_at", desc=True).limit(limit).execute()
         
-        # 읽지 않은 알림 개수
-        unread_count_response = supabase.table("notifications").select("id", count="exact").eq("user_id", x_user_id).is_("read_at", "null").execute()
-        
         return SuccessResponse(
             data=response.data,
             message=None,
@@ -40,12 +48,18 @@ async def mark_notification_as_read(
     """알림 읽음 처리"""
     try:
         supabase = get_supabase()
+        # 읽지 않은 알림만 갱신 (이미 읽은 알림을 다시 읽어도 카운터가 줄지 않도록)
         response = supabase.table("notifications").update({
             "read_at": datetime.now().isoformat()
-        }).eq("id", notification_id).eq("user_id", x_user_id).execute()
+        }).eq("id", notification_id).eq("user_id", x_user_id).is_("read_at", "null").execute()
         
-        if not response.data:
-            raise HTTPException(status_code=404, detail="Notification not found")
+        if response.data:
+            await adjust_unread({x_user_id: -1})
+            await publish(NotificationsRead(x_user_id, notification_ids=(notification_id,)))
+        else:
+            exists = supabase.table("notifications").select("id").eq("id", notification_id).eq("user_id", x_user_id).execute()
+            if not exists.data:
+                raise HTTPException(status_code=404, detail="Notification not found")
         
         return SuccessResponse(
             data={},
@@ -57,40 +71,131 @@ async def mark_notification_as_read(
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@bulk_handler(mark_notification_as_read)
+async def mark_notifications_as_read_bulk(user_id: str, items: List[BatchItem]) -> List[Tuple[int, Any]]:
+    """/api/batch 의 알림 읽음 처리 묶음을 한 번의 UPDATE 로"""
+    ids = [item.path_params["notification_id"] for item in items]
+    supabase = get_supabase()
+    response = await asyncio.to_thread(
+        lambda: supabase.table("notifications").update({
+            "read_at": datetime.now().isoformat()
+        }).in_("id", ids).eq("user_id", user_id).is_("read_at", "null").execute()
+    )
+    found = {row["id"] for row in response.data or []}
+    ok = SuccessResponse(data={}, message="알림을 읽음 처리했습니다", timestamp=datetime.now()).model_dump(mode="json")
+    written = {position: (200, ok) for position, notification_id in enumerate(ids) if notification_id in found}
+    async with after_write(written):
+        if found:
+            await adjust_unread({user_id: -len(found)})
+            await publish(NotificationsRead(user_id, notification_ids=tuple(found)))
+        already_read = [notification_id for notification_id in ids if notification_id not in found]
+        if already_read:
+            exists = await asyncio.to_thread(
+                lambda: supabase.table("notifications").select("id").in_("id", already_read).eq("user_id", user_id).execute()
+            )
+            found |= {row["id"] for row in exists.data or []}
+    return [
+        (200, ok) if notification_id in found else (404, {"detail": "Notification not found"})
+        for notification_id in ids
+    ]
+
+@router.patch("/read-all", response_model=SuccessResponse)
+async def mark_all_notifications_as_read(
+    x_user_id: str = Header(..., alias="x-user-id")
+):
+    """읽지 않은 알림 모두 읽음 처리"""
+    try:
+        count = await mark_all_read(x_user_id)
+        if count:
+            await publish(NotificationsRead(x_user_id))
+        
+        return SuccessResponse(
+            data={"count": count},
+            message="모든 알림을 읽음 처리했습니다",
+            timestamp=datetime.now()
+        )
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @router.get("/unread-count", response_model=SuccessResponse)
 async def get_unread_count(
     x_user_id: str = Header(..., alias="x-user-id")
 ):
-    """읽지 않은 알림 개수"""
+    """읽지 않은 알림 개수 (사용자별 카운터 한 행 조회)"""
     try:
-        supabase = get_supabase()
-        response = supabase.table("notifications").select("id", count="exact").eq("user_id", x_user_id).is_("read_at", "null").execute()
-        
         return SuccessResponse(
-            data={"count": response.count or 0},
+            data={"count": await count_unread(x_user_id)},
             timestamp=datetime.now()
         )
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.get("/stream")
+async def stream_notifications(
+    x_user_id: str = Depends(get_stream_user_id),
+    last_event_id: Optional[str] = Header(None, alias="last-event-id")
+):
+    """알림 스트림 (text/event-stream)
+
+    브라우저 EventSource 는 헤더를 붙일 수 없으므로 ?access_token=<액세스 토큰> 으로 인증한다
+    (fetch 기반 SSE 클라이언트는 Authorization / x-user-id 헤더도 사용 가능)
+
+    - event: notification - 새 알림 (data: 알림 행)
+    - event: unread_count - 읽지 않은 개수 (data: {"count": n}), 연결 직후 + 바뀔 때마다
+    - heartbeat 주기마다 ": ping" 주석
+    - Last-Event-ID 헤더로 재연결하면 놓친 이벤트부터 다시 보낸다
+    """
+    try:
+        connection = notification_hub.connect(x_user_id)
+    except StreamLimitExceeded as e:
+        if e.reason == "user":
+            raise HTTPException(status_code=429, detail="동시에 열 수 있는 알림 스트림 수를 넘었습니다")
+        raise HTTPException(
+            status_code=503,
+            detail="알림 스트림 연결이 가득 찼습니다",
+            headers={"Retry-After": str(int(settings.notification_stream_heartbeat_seconds))}
+        )
+
+    return StreamingResponse(
+        event_stream(notification_hub, connection, last_event_id),
+        media_type="text/event-stream",
+        # 프록시(nginx) 버퍼링을 끄고 캐시하지 않도록
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        # 스트림이 시작되기 전에 끊겨도 연결 수가 반환되도록
+        background=BackgroundTask(notification_hub.disconnect, connection)
+    )
+
 @router.post("", response_model=SuccessResponse)
 async def create_notification(
     data: dict,
     x_user_id: str = Header(..., alias="x-user-id")
 ):
-    """알림 생성 (내부용)"""
+    """알림 생성 (내부용)
+
+    다이제스트 타입 알림은 다이제스트로 받는 사용자면 대기열에 넣고 주기 작업이 한 건으로 보낸다
+    """
     try:
         supabase = get_supabase()
-        response = supabase.table("notifications").insert({
+        row = {
             "user_id": x_user_id,
             "type": data.get("type"),
             "title": data.get("title"),
             "content": data.get("content"),
             "link": data.get("link")
-        }).execute()
+        }
+        if not await defer_digest_notifications([row]):
+            return SuccessResponse(
+                data={"notification": None, "deferred": True},
+                message="알림이 다이제스트 대기열에 등록되었습니다",
+                timestamp=datetime.now()
+            )
+        response = supabase.table("notifications").insert(row).execute()
+        notification = response.data[0]
+        await adjust_unread({x_user_id: 1})
+        await publish(NotificationCreated(x_user_id, notification_id=notification["id"], notification=notification))
         
         return SuccessResponse(
-            data={"notification": response.data[0]},
+            data={"notification": notification},
             message="알림이 생성되었습니다",
             timestamp=datetime.now()
         )
@@ -1,8 +1,9 @@
-from fastapi import APIRouter, HTTPException, Header
+from fastapi import APIRouter, Depends, HTTPException, Header
 from datetime import datetime
 from typing import Optional
 from app.database import get_supabase
 from app.schemas import PortfolioCreate, SuccessResponse
+from app.utils.projection import fields_query
 
 router = APIRouter(prefix="/portfolios", tags=["portfolios"])
 
@@ -48,11 +49,14 @@ async def create_portfolio(
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("", response_model=SuccessResponse)
-async def list_portfolios(x_user_id: str = Header(..., alias="x-user-id")):
-    """포트폴리오 목록 조회"""
+async def list_portfolios(
+    x_user_id: str = Header(..., alias="x-user-id"),
+    columns: str = Depends(fields_query("portfolios"))
+):
+    """포트폴리오 목록 조회 (settings 는 상세 조회에서)"""
     try:
         supabase = get_supabase()
-        response = supabase.table("portfolios").select("*").eq("user_id", x_user_id).order("created_at", desc=True).execute()
+        response = supabase.table("portfolios").select(columns).eq("user_id", x_user_id).order("created_at", desc=True).execute()
         
         return SuccessResponse(
             data={"portfolios": response.data},
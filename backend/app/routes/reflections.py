@@ -6,12 +6,19 @@
 - Story View (스토리 생성)
 """
 
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, HTTPException, Request
 from pydantic import BaseModel
-from typing import Optional, List
+import asyncio
+from typing import Any, Optional, List, Tuple
 from datetime import datetime, date, timedelta
 from app.database import get_supabase, ensure_reflection_table
 from app.utils.auth import get_current_user_id
+from app.utils.responses import envelope
+from app.utils.http_cache import versioned_etag, with_etag
+from app.utils.projection import fields_query
+from app.utils.batching import BatchItem, after_write, bulk_handler
+from app.utils.story_view import get_story
+from app.events import MicroLogCreated, MicroLogDeleted, ReflectionCreated, ReflectionDeleted, publish
 from collections import Counter
 import logging
 
@@ -109,6 +116,15 @@ async def create_micro_log(
             }
         
         log = response.data[0]
+        await publish(MicroLogCreated(
+            user_id,
+            log_id=log["id"],
+            date=log["date"],
+            activity_type=log.get("activity_type"),
+            mood_compare=log.get("mood_compare"),
+            space_id=log.get("space_id"),
+            tags=tuple(log.get("tags") or ()),
+        ))
         
         return {
             "success": True,
@@ -145,19 +161,53 @@ async def delete_micro_log(
     try:
         supabase = get_supabase()
         # 소유자 확인 및 삭제
-        check = supabase.table("micro_logs").select("id, user_id").eq("id", log_id).single().execute()
+        check = supabase.table("micro_logs").select("id, user_id, date").eq("id", log_id).single().execute()
         if not check.data:
             raise HTTPException(status_code=404, detail="마이크로 로그를 찾을 수 없습니다")
         if check.data.get("user_id") != user_id:
             raise HTTPException(status_code=403, detail="삭제 권한이 없습니다")
 
         res = supabase.table("micro_logs").delete().eq("id", log_id).eq("user_id", user_id).execute()
+        await publish(MicroLogDeleted(user_id, log_id=log_id, date=check.data.get("date")))
         return {"success": True, "data": {"id": log_id}, "error": None}
     except HTTPException:
         raise
     except Exception as e:
         return {"success": False, "data": None, "error": {"code": "INTERNAL_ERROR", "message": str(e)}}
 
+@bulk_handler(delete_micro_log)
+async def delete_micro_logs_bulk(user_id: str, items: List[BatchItem]) -> List[Tuple[int, Any]]:
+    """/api/batch 의 마이크로 로그 삭제 묶음을 한 번의 조회 + 한 번의 DELETE 로"""
+    ids = [item.path_params["log_id"] for item in items]
+    supabase = get_supabase()
+    found = await asyncio.to_thread(
+        lambda: supabase.table("micro_logs").select("id, user_id, date").in_("id", ids).execute()
+    )
+    owners = {row["id"]: row.get("user_id") for row in found.data or []}
+    dates = {row["id"]: row.get("date") for row in found.data or []}
+    owned = [log_id for log_id in dict.fromkeys(ids) if owners.get(log_id) == user_id]
+    if owned:
+        await asyncio.to_thread(
+            lambda: supabase.table("micro_logs").delete().in_("id", owned).eq("user_id", user_id).execute()
+        )
+        written = {
+            position: (200, {"success": True, "data": {"id": log_id}, "error": None})
+            for position, log_id in enumerate(ids) if log_id in owned
+        }
+        async with after_write(written):
+            for log_id in owned:
+                await publish(MicroLogDeleted(user_id, log_id=log_id, date=dates[log_id]))
+
+    results = []
+    for log_id in ids:
+        if log_id not in owners:
+            results.append((404, {"detail": "마이크로 로그를 찾을 수 없습니다"}))
+        elif owners[log_id] != user_id:
+            results.append((403, {"detail": "삭제 권한이 없습니다"}))
+        else:
+            results.append((200, {"success": True, "data": {"id": log_id}, "error": None}))
+    return results
+
 @router.get("/micro")
 async def get_micro_logs(
     user_id: str = Depends(get_current_user_id),
@@ -165,14 +215,15 @@ async def get_micro_logs(
     offset: int = Query(0, ge=0),
     date_from: Optional[date] = None,
     date_to: Optional[date] = None,
-    activity_type: Optional[str] = None
+    activity_type: Optional[str] = None,
+    columns: str = Depends(fields_query("micro_logs"))
 ):
     """초라이트 기록 목록 조회"""
     try:
         supabase = get_supabase()
         
         # 쿼리 빌드
-        query = supabase.table("micro_logs").select("*", count="exact").eq("user_id", user_id)
+        query = supabase.table("micro_logs").select(columns, count="exact").eq("user_id", user_id)
         
         # 날짜 필터
         if date_from:
@@ -305,156 +356,11 @@ async def get_reflection_story(
     user_id: str = Depends(get_current_user_id),
     period: str = Query("week", regex="^(week|month|quarter)$")
 ):
-    """스토리 뷰 생성"""
+    """스토리 뷰 생성 (기간별 결과 캐시 + 주간 집계 병합, app/utils/story_view.py)"""
     try:
-        supabase = get_supabase()
-        
-        # 기간 계산
-        if period == "week":
-            days = 7
-            period_label = "이번 주"
-        elif period == "month":
-            days = 30
-            period_label = "이번 달"
-        else:  # quarter
-            days = 90
-            period_label = "이번 분기"
-        
-        start_date = datetime.now().date() - timedelta(days=days)
-        
-        # 기간 내 로그 조회
-        response = supabase.table("micro_logs") \
-            .select("*") \
-            .eq("user_id", user_id) \
-            .gte("date", str(start_date)) \
-            .order("date", desc=False) \
-            .execute()
-        
-        logs = response.data or []
-        
-        if not logs:
-            return {
-                "success": True,
-                "data": {
-                    "period_label": period_label,
-                    "total_days": days,
-                    "activity_summary": [],
-                    "positive_patterns": [],
-                    "negative_patterns": [],
-                    "strength_analysis": "아직 기록이 부족해요. 더 많은 경험을 기록해보세요!",
-                    "suggested_tracks": [],
-                    "next_suggestion": None
-                },
-                "error": None
-            }
-        
-        # 활동 요약
-        activity_counts = Counter([log["activity_type"] for log in logs])
-        activity_icons = {
-            "contest": "🏆",
-            "club": "👥",
-            "project": "💼",
-            "internship": "💼",
-            "study": "📚",
-            "etc": "✨"
-        }
-        activity_labels = {
-            "contest": "공모전/대외활동",
-            "club": "학회/동아리",
-            "project": "프로젝트",
-            "internship": "인턴/아르바이트",
-            "study": "자격증/공부",
-            "etc": "기타"
-        }
-        activity_summary = [
-            {
-                "type": act_type,
-                "count": count,
-                "icon": activity_icons.get(act_type, "✨"),
-                "label": activity_labels.get(act_type, "기타")
-            }
-            for act_type, count in activity_counts.most_common()
-        ]
-        
-        # 긍정 패턴 분석
-        positive_logs = [log for log in logs if log["mood_compare"] == "better"]
-        positive_patterns = []
-        
-        if positive_logs:
-            # reason 빈도 분석
-            reason_map = {
-                "positive_001": "사람들과 의견 주고받는 활동에서 에너지를 얻어요",
-                "positive_002": "새로운 것을 배우는 과정을 즐겨요",
-                "positive_003": "자신의 강점을 발휘할 수 있는 활동에서 빛나요",
-                "positive_004": "누군가에게 도움이 되는 일에서 보람을 느껴요",
-                "positive_005": "일이 술술 풀릴 때 기분이 좋아져요",
-                "positive_006": "성과를 인정받을 때 뿌듯함을 느껴요"
-            }
-            reason_counts = Counter([log["reason"] for log in positive_logs if log.get("reason")])
-            positive_patterns = [
-                reason_map.get(reason, "긍정적인 경험을 많이 하고 있어요")
-                for reason, _ in reason_counts.most_common(3)
-            ]
-        
-        # 부정 패턴 분석
-        negative_logs = [log for log in logs if log["mood_compare"] == "worse"]
-        negative_patterns = []
-        
-        if negative_logs:
-            reason_map = {
-                "negative_001": "생각보다 잘 안 풀리는 상황에서 스트레스를 받아요",
-                "negative_002": "사람들과 의견이 안 맞을 때 어려움을 느껴요",
-                "negative_003": "시간이 오래 걸리는 작업에서 지쳐요",
-                "negative_004": "자신이 못하는 부분이 드러날 때 힘들어해요",
-                "negative_005": "하기 싫은 일을 억지로 할 때 에너지가 떨어져요",
-                "negative_006": "결과가 기대에 못 미칠 때 실망해요"
-            }
-            reason_counts = Counter([log["reason"] for log in negative_logs if log.get("reason")])
-            negative_patterns = [
-                reason_map.get(reason, "어려운 경험도 있었어요")
-                for reason, _ in reason_counts.most_common(2)
-            ]
-        
-        # 강점 분석 (빈도 높은 태그 기반)
-        all_positive_tags = []
-        for log in positive_logs:
-            if log.get("tags"):
-                all_positive_tags.extend(log["tags"])
-        
-        strength_analysis = "아직 패턴이 명확하지 않아요. 더 많은 경험을 기록해보세요!"
-        if all_positive_tags:
-            top_tags = [tag for tag, _ in Counter(all_positive_tags).most_common(3)]
-            strength_analysis = f"**{', '.join(top_tags)}** 분야에서 강점을 보이고 있어요."
-        
-        # 추천 진로 트랙 (간단 버전 - AI 통합 시 개선)
-        suggested_tracks = [
-            {
-                "track": "기획/전략",
-                "score": 75,
-                "reason": "체계적인 활동 기록과 분석 능력"
-            }
-        ]
-        
-        # 다음 행동 제안
-        next_suggestion = {
-            "title": "더 다양한 경험 쌓기",
-            "description": "지금까지의 경험을 바탕으로, 새로운 분야에도 도전해보세요.",
-            "action": "추천 활동 보러가기",
-            "recommended_activities": []
-        }
-        
         return {
             "success": True,
-            "data": {
-                "period_label": period_label,
-                "total_days": days,
-                "activity_summary": activity_summary,
-                "positive_patterns": positive_patterns,
-                "negative_patterns": negative_patterns,
-                "strength_analysis": strength_analysis,
-                "suggested_tracks": suggested_tracks,
-                "next_suggestion": next_suggestion
-            },
+            "data": await get_story(user_id, period, datetime.now().date()),
             "error": None
         }
     except Exception as e:
@@ -520,6 +426,13 @@ async def create_reflection(
         
         reflection = response.data[0]
         logger.info(f"저장 성공: ID={reflection.get('id')}, 템플릿={template_id}")
+        await publish(ReflectionCreated(
+            user_id,
+            reflection_id=reflection["id"],
+            template_id=template_id,
+            reflection_date=reflection.get("reflection_date"),
+            created_at=reflection.get("created_at"),
+        ))
         
         return {
             "success": True,
@@ -547,17 +460,23 @@ async def create_reflection(
 
 @router.get("")
 async def list_reflections(
+    request: Request,
     user_id: str = Depends(get_current_user_id),
     limit: int = Query(50, le=100),
-    template_id: Optional[str] = None
+    template_id: Optional[str] = None,
+    columns: str = Depends(fields_query("reflections"))
 ):
-    """회고 목록 조회 (모든 템플릿 지원)"""
+    """회고 목록 조회 (모든 템플릿 지원, 회고 버전이 같으면 304)"""
     try:
+        etag, not_modified = await versioned_etag(request, f"user:{user_id}:reflections")
+        if not_modified:
+            return not_modified
+        
         supabase = get_supabase()
         
         # 통합 reflections 테이블에서 조회
         query = supabase.table("reflections") \
-            .select("*") \
+            .select(columns) \
             .eq("user_id", user_id)
         
         # 특정 템플릿 필터링
@@ -575,13 +494,7 @@ async def list_reflections(
         all_reflections = response.data or []
         logger.info(f"조회 결과: {len(all_reflections)}개")
         
-        return {
-            "success": True,
-            "data": {
-                "reflections": all_reflections
-            },
-            "error": None
-        }
+        return with_etag(envelope({"reflections": all_reflections}), etag)
     except Exception as e:
         logger.exception("회고 목록 조회 오류")
         return {
@@ -612,6 +525,7 @@ async def delete_reflection(
 
         # 삭제
         supabase.table("reflections").delete().eq("id", reflection_id).eq("user_id", user_id).execute()
+        await publish(ReflectionDeleted(user_id, reflection_id=reflection_id))
 
         return {"success": True, "data": {"id": reflection_id}, "error": None}
     except HTTPException:
@@ -633,3 +547,28 @@ async def get_growth_stats(user_id: str = Depends(get_current_user_id)):
         },
         "error": None
     }
+
+
+@router.get("/{reflection_id}")
+async def get_reflection(
+    reflection_id: str,
+    user_id: str = Depends(get_current_user_id)
+):
+    """단일 AI 회고 상세 조회 (competency_analysis 포함 전체 행)"""
+    try:
+        supabase = get_supabase()
+        response = supabase.table("reflections") \
+            .select("*") \
+            .eq("id", reflection_id) \
+            .eq("user_id", user_id) \
+            .execute()
+        
+        if not response.data:
+            raise HTTPException(status_code=404, detail="회고를 찾을 수 없습니다")
+        
+        return {"success": True, "data": {"reflection": response.data[0]}, "error": None}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("회고 상세 조회 오류")
+        return {"success": False, "data": None, "error": {"code": "INTERNAL_ERROR", "message": str(e)}}
@@ -1,8 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import List, Optional
 from datetime import datetime, timedelta
 from ..database import get_supabase
 from ..utils.auth import get_current_user
+from ..events import SpaceCompleted, SpaceCreated, SpaceUpdated, publish
+from ..utils.projection import PROJECTIONS
+from ..utils.responses import FastJSONResponse
 from ..schemas import (
     ReflectionSpaceCreate, 
     ReflectionSpaceResponse,
@@ -94,19 +97,22 @@ async def create_space(
     if not response.data:
         raise HTTPException(status_code=500, detail="스페이스 생성에 실패했습니다")
     
+    await publish(SpaceCreated(user_id, space_id=response.data[0]["id"]))
     return response.data[0]
 
 @router.get("", response_model=List[ReflectionSpaceResponse])
 async def list_spaces(
     status: Optional[str] = None,
     type: Optional[str] = None,
+    fields: Optional[str] = Query(None, description="쉼표로 구분한 컬럼 (일부만 받을 때)"),
     current_user: dict = Depends(get_current_user),
     supabase = Depends(get_supabase)
 ):
     """회고 스페이스 목록 조회"""
     user_id = current_user['id']
     
-    query = supabase.table("reflection_spaces").select("*").eq("user_id", user_id)
+    columns = PROJECTIONS["reflection_spaces"].select(fields)
+    query = supabase.table("reflection_spaces").select(columns).eq("user_id", user_id)
     
     if status:
         query = query.eq("status", status)
@@ -114,6 +120,9 @@ async def list_spaces(
         query = query.eq("type", type)
     
     response = query.order("created_at", desc=True).execute()
+    if fields:
+        # 일부 컬럼만 요청하면 응답 모델 검증 없이 그대로 반환
+        return FastJSONResponse(response.data)
     return response.data
 
 @router.get("/{space_id}", response_model=ReflectionSpaceResponse)
@@ -169,6 +178,7 @@ async def update_space(
         .eq("user_id", user_id)\
         .execute()
     
+    await publish(SpaceUpdated(user_id, space_id=space_id, fields=tuple(sorted(updates))))
     return response.data[0]
 
 @router.delete("/{space_id}")
@@ -189,6 +199,7 @@ async def delete_space(
     if not response.data:
         raise HTTPException(status_code=404, detail="스페이스를 찾을 수 없습니다")
     
+    await publish(SpaceCompleted(user_id, space_id=space_id))
     return {"message": "스페이스가 완료 처리되었습니다"}
 
 @router.post("/recommend-cycle")
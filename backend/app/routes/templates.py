@@ -1,11 +1,16 @@
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException
 from typing import List, Optional
 from ..database import get_supabase
-from ..auth import get_current_user
+from ..utils.auth import get_current_user
+from ..utils.coalesce import coalescing_cache
 from ..schemas import ReflectionTemplateResponse, TemplateRecommendRequest
 
 router = APIRouter(prefix="/api/v1/templates", tags=["Templates"])
 
+# 사용자와 무관한 템플릿 목록 (동시 요청 합치기 + 짧은 TTL)
+templates_cache = coalescing_cache("reflection_templates")
+
 @router.get("", response_model=List[ReflectionTemplateResponse])
 async def list_templates(
     category: Optional[str] = None,
@@ -18,8 +23,11 @@ async def list_templates(
     if category:
         query = query.eq("category", category)
     
-    response = query.order("usage_count", desc=True).execute()
-    return response.data
+    async def load():
+        response = await asyncio.to_thread(query.order("usage_count", desc=True).execute)
+        return response.data
+    
+    return await templates_cache.get(("list", category), load)
 
 @router.get("/{template_id}", response_model=ReflectionTemplateResponse)
 async def get_template(
@@ -97,11 +105,15 @@ async def get_popular_templates(
     supabase = Depends(get_supabase)
 ):
     """인기 템플릿 조회"""
-    response = supabase.table("reflection_templates")\
-        .select("id, name, category, usage_count")\
-        .eq("is_active", True)\
-        .order("usage_count", desc=True)\
-        .limit(limit)\
-        .execute()
+    async def load():
+        response = await asyncio.to_thread(
+            supabase.table("reflection_templates")
+            .select("id, name, category, usage_count")
+            .eq("is_active", True)
+            .order("usage_count", desc=True)
+            .limit(limit)
+            .execute
+        )
+        return response.data
     
-    return {"templates": response.data}
+    return {"templates": await templates_cache.get(("popular", limit), load)}
@@ -1,11 +1,29 @@
 from fastapi import APIRouter, HTTPException, Header, UploadFile, File, Form
 from datetime import datetime
 from typing import Optional
+from pathlib import PurePath
+import uuid
 from app.database import get_supabase
 from app.schemas import SuccessResponse
+from app.utils.storage import get_storage
+from app.utils.uploads import DOCX_MIME, content_key, stream_upload
+from app.utils.evidence_blobs import EVIDENCE_PREFIX, ensure_blob, find_derived_artifacts
+from app.utils.documents import document_pipeline
 
 router = APIRouter(prefix="/upload", tags=["upload"])
 
+# 파일 형식 검증 (실제 형식은 첫 바이트로 판별)
+ALLOWED_TYPES = {
+    "profile": ["image/jpeg", "image/png", "image/webp"],
+    "evidence": ["image/jpeg", "image/png", "application/pdf"],
+    "document": ["application/pdf", "application/msword", DOCX_MIME]
+}
+
+def safe_filename(filename: Optional[str]) -> str:
+    """저장 키에 쓸 파일명 (경로 구분자 제거)"""
+    name = PurePath(filename or "file").name.replace("\\", "_")
+    return name or "file"
+
 @router.post("", response_model=SuccessResponse)
 async def upload_file(
     file: UploadFile = File(...),
@@ -14,39 +32,27 @@ async def upload_file(
 ):
     """파일 업로드"""
     try:
-        # 파일 크기 검증 (10MB)
-        file_content = await file.read()
-        file_size = len(file_content)
-        if file_size > 10 * 1024 * 1024:
-            raise HTTPException(status_code=400, detail="파일 크기는 10MB를 초과할 수 없습니다")
-        
-        # 파일 형식 검증
-        allowed_types = {
-            "profile": ["image/jpeg", "image/png", "image/webp"],
-            "evidence": ["image/jpeg", "image/png", "application/pdf"],
-            "document": ["application/pdf", "application/msword", "application/vnd.openxmlformats-officedocument.wordprocessingml.document"]
-        }
-        
-        if type not in allowed_types:
+        if type not in ALLOWED_TYPES:
             raise HTTPException(status_code=400, detail="잘못된 파일 타입입니다")
         
-        if file.content_type not in allowed_types[type]:
-            raise HTTPException(status_code=400, detail=f"허용되지 않는 파일 형식입니다. 허용: {', '.join(allowed_types[type])}")
-        
-        # TODO: Supabase Storage 업로드
-        # supabase = get_supabase()
-        # file_path = f"{type}/{x_user_id}/{file.filename}"
-        # upload_response = supabase.storage.from_("files").upload(file_path, file_content)
-        
-        # 임시 URL (실제로는 Supabase Storage URL)
-        file_url = f"https://supabase.co/storage/{type}/{x_user_id}/{file.filename}"
+        # 청크 단위 스트리밍 저장 (크기 초과 시 즉시 중단, 형식은 첫 바이트로 판별)
+        filename = safe_filename(file.filename)
+        stored = await stream_upload(
+            file,
+            get_storage(),
+            key_for=lambda digest, mime: f"{type}/{x_user_id}/{uuid.uuid4().hex}_{filename}",
+            allowed_types=ALLOWED_TYPES[type]
+        )
+        file_url = stored.url
+        file_size = stored.size
         
         return SuccessResponse(
             data={
                 "file_url": file_url,
                 "file_name": file.filename,
                 "file_size": file_size,
-                "mime_type": file.content_type
+                "mime_type": stored.mime_type,
+                "sha256": stored.sha256
             },
             message="파일이 업로드되었습니다",
             timestamp=datetime.now()
@@ -63,23 +69,33 @@ async def upload_evidence(
     evidence_type: str = Form(...),
     x_user_id: str = Header(..., alias="x-user-id")
 ):
-    """증명서 업로드 (OCR 포함)"""
+    """증명서 업로드 (텍스트 추출/썸네일은 비동기 처리)"""
     try:
         supabase = get_supabase()
         
-        # 파일 업로드
-        file_content = await file.read()
-        file_size = len(file_content)
-        
-        # TODO: Supabase Storage 업로드
-        file_url = f"https://supabase.co/storage/evidence/{x_user_id}/{file.filename}"
-        
-        # TODO: OCR 처리 (Google Vision API)
-        ocr_text = "수상증명서\n홍길동\n최우수상"
-        ocr_confidence = 0.95
+        # 파일 업로드 (청크 단위 스트리밍, 콘텐츠 해시 키로 한 번만 저장)
+        storage = get_storage()
+        stored = await stream_upload(
+            file,
+            storage,
+            key_for=lambda digest, mime: content_key(EVIDENCE_PREFIX, digest, mime),
+            allowed_types=ALLOWED_TYPES["evidence"],
+            skip_if_exists=True
+        )
+        file_url = stored.url
+        file_size = stored.size
         
-        # TODO: 키워드 자동 추출
-        verified_keywords = ["기획력", "리더십"]
+        # 같은 파일이 이미 처리된 적 있으면 OCR/썸네일 결과 재사용 (메타데이터만 추가)
+        derived = find_derived_artifacts(supabase, stored.sha256)
+        if derived is None:
+            # 텍스트 추출/썸네일은 응답 후 프로세스 풀에서 처리
+            derived = {
+                "ocr_text": None,
+                "ocr_confidence": None,
+                "thumbnail_url": None,
+                "verified_keywords": [],
+                "processing_status": "pending"
+            }
         
         # evidence 테이블에 저장
         response = supabase.table("evidence").insert({
@@ -89,21 +105,34 @@ async def upload_evidence(
             "file_name": file.filename,
             "file_url": file_url,
             "file_size": file_size,
-            "mime_type": file.content_type,
-            "ocr_text": ocr_text,
-            "ocr_confidence": ocr_confidence
+            "mime_type": stored.mime_type,
+            "content_hash": stored.sha256,
+            "storage_key": stored.key,
+            **derived
         }).execute()
         
+        # 같은 파일의 삭제와 겹쳤으면 저장 파일을 되살린다
+        if stored.deduplicated:
+            await ensure_blob(supabase, stored, file, storage)
+        
+        if derived["processing_status"] == "pending":
+            document_pipeline.submit_evidence(stored.sha256, stored.key, stored.mime_type)
+        
         return SuccessResponse(
             data={
                 "evidence_id": response.data[0]["id"],
                 "file_url": file_url,
-                "ocr_text": ocr_text,
-                "ocr_confidence": ocr_confidence,
-                "verified_keywords": verified_keywords
+                "ocr_text": derived["ocr_text"],
+                "ocr_confidence": derived["ocr_confidence"],
+                "thumbnail_url": derived["thumbnail_url"],
+                "verified_keywords": derived["verified_keywords"],
+                "processing_status": derived["processing_status"],
+                "deduplicated": stored.deduplicated
             },
             message="증명서가 업로드되었습니다",
             timestamp=datetime.now()
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
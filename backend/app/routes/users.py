@@ -4,6 +4,7 @@ from app.database import get_supabase
 from pydantic import BaseModel
 from typing import Optional
 from app.utils.auth import get_current_user_id
+from app.utils.streaks import get_streak
 
 router = APIRouter()
 
@@ -18,6 +19,24 @@ class BaselineMoodUpdate(BaseModel):
     """베이스라인 무드 설정 요청"""
     baseline_mood: str  # tired | neutral | positive
 
+def user_profile(user: dict, activities_count: int, logs_count: int, streak: int) -> dict:
+    """내 정보 응답 (/users/me, /api/dashboard/home 공용)"""
+    return {
+        "id": user["id"],
+        "email": user["email"],
+        "name": user["name"],
+        "university": user.get("university"),
+        "major": user.get("major"),
+        "profileImage": user.get("profile_image"),
+        "baselineMood": user.get("baseline_mood"),
+        "stats": {
+            "totalActivities": activities_count,
+            "totalLogs": logs_count,
+            "streak": streak
+        },
+        "createdAt": user["created_at"]
+    }
+
 @router.get("/me")
 async def get_current_user(user_id: str = Depends(get_current_user_id)):
     """내 정보 조회"""
@@ -43,27 +62,12 @@ async def get_current_user(user_id: str = Depends(get_current_user_id)):
         activities_count = supabase.table("projects").select("id", count="exact").eq("user_id", user_id).execute().count or 0
         logs_count = supabase.table("logs").select("id", count="exact").eq("user_id", user_id).execute().count or 0
         
-        # 연속 기록 계산 (streak)
-        # TODO: 실제 연속 기록 계산 로직 구현
-        streak = 0
+        # 연속 기록 (user_streaks 한 행)
+        streak = await get_streak(user_id)
         
         return {
             "success": True,
-            "data": {
-                "id": user["id"],
-                "email": user["email"],
-                "name": user["name"],
-                "university": user.get("university"),
-                "major": user.get("major"),
-                "profileImage": user.get("profile_image"),
-                "baselineMood": user.get("baseline_mood"),
-                "stats": {
-                    "totalActivities": activities_count,
-                    "totalLogs": logs_count,
-                    "streak": streak
-                },
-                "createdAt": user["created_at"]
-            },
+            "data": user_profile(user, activities_count, logs_count, streak["current"]),
             "error": None
         }
     except Exception as e:
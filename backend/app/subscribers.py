@@ -0,0 +1,41 @@
+"""
+쓰기 이벤트 구독자 등록
+
+app.main 에서 import 하면 app.events.bus 에 구독자가 등록된다.
+"""
+from app.cache import invalidate_tags
+from app.events import ActiveDayEvent, Event, NotificationCreated, NotificationEvent, bus
+from app.utils.notification_stream import NOTIFICATION, UNREAD_COUNT, notification_hub
+from app.utils.streaks import record_active_day
+from app.utils.unread_counter import count_unread
+
+
+@bus.on(Event, inline=True, name="cache_invalidation")
+async def invalidate_user_cache(event: Event) -> None:
+    """쓰기 이벤트의 리소스 태그(user:{id}:{resource}) 캐시 무효화"""
+    tags = event.cache_tags()
+    if tags:
+        await invalidate_tags(*tags)
+
+
+@bus.on(NotificationCreated, inline=True, name="notification_stream")
+async def push_notification(event: NotificationCreated) -> None:
+    """새 알림을 이 워커의 알림 스트림 연결에 전달"""
+    notification_hub.push(event.user_id, NOTIFICATION, event.notification)
+
+
+@bus.on(NotificationEvent, name="notification_unread_count")
+async def push_unread_count(event: NotificationEvent) -> None:
+    """알림 생성 / 읽음 후 읽지 않은 개수를 스트림에 전달 (연결이 있을 때만 조회)"""
+    if notification_hub.has_listeners(event.user_id):
+        notification_hub.push(event.user_id, UNREAD_COUNT, {"count": await count_unread(event.user_id)})
+
+
+@bus.on(ActiveDayEvent, inline=True, name="streaks")
+async def update_streak(event: ActiveDayEvent) -> None:
+    """회고 / 마이크로 로그 / 헬스체크를 쓴 날로 연속 기록 갱신
+
+    큐 구독자는 큐가 가득 차면 이벤트를 버리는데, 버려진 이벤트는 다음 백필까지 빠진 활동일이 된다.
+    RPC 한 번(O(1))이므로 inline 으로 실행해 쓰기마다 반드시 반영한다.
+    """
+    await record_active_day(event.user_id, event.active_date())
@@ -0,0 +1,121 @@
+"""
+부하 기반 요청 수용 제어 (load shedding)
+
+요청을 우선순위로 나누고 과부하 신호에 따라 낮은 우선순위부터 503 + Retry-After 로 거절한다.
+
+- critical: 핵심 쓰기 (마이크로 로그 / 회고 작성) - 거절하지 않음
+- low: 검색, 트렌딩, 스토리 등 - 먼저 거절
+- normal: 그 외 - 처리 중 요청이 최대치에 닿을 때만 거절
+- admission_exempt_paths: 알림 스트림처럼 오래 열려 있는 연결은 처리 중 요청 수에서 제외
+
+과부하 신호
+- 워커의 처리 중 요청 수
+- 이벤트 루프 지연 (loop_monitor EWMA)
+- Supabase 왕복 시간 (instrumented_supabase EWMA)
+"""
+import json
+import logging
+from typing import List, Optional, Tuple
+
+from app.config import settings
+from app.utils.instrumented_supabase import supabase_latency
+from app.utils.loop_monitor import loop_monitor
+from app.utils.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+CRITICAL = "critical"
+NORMAL = "normal"
+LOW = "low"
+
+http_requests_shed_total = registry.counter(
+    "http_requests_shed_total", "과부하로 거절한 요청 수", ("priority", "reason")
+)
+admission_in_flight = registry.gauge(
+    "admission_in_flight", "수용 제어 대상 처리 중 요청 수"
+)
+
+
+def _split(value: str) -> List[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _matches(path: str, pattern: str) -> bool:
+    # "*/trending" 은 접미사, 그 외는 접두사 일치
+    if pattern.startswith("*"):
+        return path.rstrip("/").endswith(pattern[1:])
+    return path == pattern or path.startswith(pattern.rstrip("/") + "/")
+
+
+def classify(method: str, path: str) -> str:
+    """요청 우선순위 판별"""
+    for entry in _split(settings.admission_critical_paths):
+        entry_method, _, entry_path = entry.rpartition(" ")
+        if (not entry_method or entry_method == method) and path.rstrip("/") == entry_path.rstrip("/"):
+            return CRITICAL
+    for pattern in _split(settings.admission_low_priority_paths):
+        if _matches(path, pattern):
+            return LOW
+    return NORMAL
+
+
+def shed_reason(priority: str, in_flight: int) -> Optional[str]:
+    """거절해야 하면 사유, 아니면 None"""
+    if priority == CRITICAL:
+        return None
+    if in_flight >= settings.admission_max_in_flight:
+        return "in_flight"
+    if priority != LOW:
+        return None
+    if in_flight >= settings.admission_low_priority_in_flight:
+        return "in_flight"
+    if loop_monitor.lag_ewma * 1000 >= settings.admission_loop_lag_ms:
+        return "loop_lag"
+    if supabase_latency.value * 1000 >= settings.admission_supabase_latency_ms:
+        return "supabase_latency"
+    return None
+
+
+class AdmissionControlMiddleware:
+    """과부하 시 낮은 우선순위 요청부터 503 으로 거절 (순수 ASGI)"""
+
+    def __init__(self, app):
+        self.app = app
+        self.in_flight = 0
+
+    async def _reject(self, send, reason: str) -> None:
+        body = json.dumps(
+            {"detail": "요청이 많아 잠시 후 다시 시도해주세요", "reason": reason},
+            ensure_ascii=False,
+        ).encode("utf-8")
+        headers: List[Tuple[bytes, bytes]] = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"retry-after", str(settings.admission_retry_after_seconds).encode()),
+        ]
+        await send({"type": "http.response.start", "status": 503, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.admission_enabled or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        if any(_matches(scope["path"], pattern) for pattern in _split(settings.admission_exempt_paths)):
+            await self.app(scope, receive, send)
+            return
+
+        priority = classify(scope["method"], scope["path"])
+        reason = shed_reason(priority, self.in_flight)
+        if reason is not None:
+            http_requests_shed_total.inc(priority=priority, reason=reason)
+            await self._reject(send, reason)
+            return
+
+        self.in_flight += 1
+        admission_in_flight.set(self.in_flight)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.in_flight -= 1
+            admission_in_flight.set(self.in_flight)
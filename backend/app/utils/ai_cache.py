@@ -0,0 +1,133 @@
+"""
+AI 분석 결과 캐시 (read-through)
+
+- 키: 정규화된 입력(답변/로그/모델)의 SHA-256 해시
+- 1차: 프로세스 내 LRU
+- 2차: reflection_ai_analysis 테이블 (expires_at 기준 만료, cleanup_expired_cache 가 정리)
+- 미스일 때만 모델 호출, 동일 키 동시 요청은 하나의 호출로 합침
+- cacheable=False (LLM 미설정 시 임시 결과) 는 캐시를 거치지 않는다
+"""
+import hashlib
+import json
+import logging
+import unicodedata
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app.config import settings
+from app.database import get_supabase
+from app.utils.lru import LRUCache
+from app.utils.singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+CACHE_TABLE = "reflection_ai_analysis"
+
+
+def normalize_input(value: Any) -> Any:
+    """해시 전에 입력 정규화 (공백/유니코드 정리, dict 키 정렬은 json.dumps 에서 처리)"""
+    if isinstance(value, str):
+        return " ".join(unicodedata.normalize("NFC", value).split())
+    if isinstance(value, dict):
+        return {str(k): normalize_input(v) for k, v in value.items() if v is not None}
+    if isinstance(value, (list, tuple)):
+        return [normalize_input(v) for v in value]
+    return value
+
+
+def make_cache_key(analysis_type: str, payload: Dict[str, Any], model: Optional[str] = None) -> str:
+    """분석 유형 + 정규화된 입력 + 모델명으로 캐시 키 생성"""
+    canonical = json.dumps(
+        {
+            "type": analysis_type,
+            "model": model or settings.openai_model,
+            "input": normalize_input(payload),
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class AIAnalysisCache:
+    """LRU → reflection_ai_analysis → 모델 호출 순서의 read-through 캐시"""
+
+    def __init__(self, maxsize: int, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._memory = LRUCache(maxsize=maxsize, ttl=ttl_seconds)
+        self._flight = SingleFlight()
+
+    async def get_or_compute(
+        self,
+        analysis_type: str,
+        user_id: str,
+        payload: Dict[str, Any],
+        compute: Callable[[], Awaitable[Dict[str, Any]]],
+        model: Optional[str] = None,
+        cacheable: bool = True,
+    ) -> Dict[str, Any]:
+        # 모델이 꺼져 있을 때의 임시 결과는 저장하지 않는다 (키 설정 후에도 임시 결과가 남지 않도록)
+        if not cacheable:
+            return await compute()
+
+        key = make_cache_key(analysis_type, payload, model)
+
+        cached = self._memory.get(key)
+        if cached is not None:
+            return cached
+
+        async def load() -> Dict[str, Any]:
+            stored = self._load_stored(key)
+            if stored is not None:
+                self._memory.set(key, stored)
+                return stored
+
+            result = await compute()
+            self._store(key, analysis_type, user_id, model or settings.openai_model, result)
+            self._memory.set(key, result)
+            return result
+
+        return await self._flight.do(key, load)
+
+    def invalidate(self, analysis_type: str, payload: Dict[str, Any], model: Optional[str] = None) -> None:
+        self._memory.delete(make_cache_key(analysis_type, payload, model))
+
+    def _load_stored(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            response = get_supabase().table(CACHE_TABLE)\
+                .select("result")\
+                .eq("cache_key", key)\
+                .gt("expires_at", datetime.now(timezone.utc).isoformat())\
+                .limit(1)\
+                .execute()
+        except Exception:
+            # 캐시 테이블 장애가 분석 자체를 막지 않도록 미스로 처리
+            logger.exception("AI 분석 캐시 조회 실패")
+            return None
+        if response.data and response.data[0].get("result") is not None:
+            return response.data[0]["result"]
+        return None
+
+    def _store(self, key: str, analysis_type: str, user_id: str, model: str, result: Dict[str, Any]) -> None:
+        now = datetime.now(timezone.utc)
+        try:
+            get_supabase().table(CACHE_TABLE).upsert({
+                "cache_key": key,
+                "user_id": user_id,
+                "analysis_type": analysis_type,
+                "model": model,
+                "result": result,
+                "summary": result.get("summary") or result.get("ai_summary") or result.get("feedback"),
+                "generated_at": now.isoformat(),
+                "expires_at": (now + timedelta(seconds=self.ttl_seconds)).isoformat(),
+            }, on_conflict="cache_key").execute()
+        except Exception:
+            logger.exception("AI 분석 캐시 저장 실패")
+
+
+ai_analysis_cache = AIAnalysisCache(
+    maxsize=settings.ai_cache_max_entries,
+    ttl_seconds=settings.ai_cache_ttl_hours * 3600,
+)
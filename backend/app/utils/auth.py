@@ -1,4 +1,4 @@
-from fastapi import Header, HTTPException, Depends
+from fastapi import Header, HTTPException, Depends, Query
 from typing import Optional
 
 async def get_current_user_id(
@@ -29,6 +29,35 @@ async def get_current_user_id(
         detail="인증이 필요합니다. Authorization 헤더 또는 x-user-id를 제공해주세요."
     )
 
+async def get_stream_user_id(
+    access_token: Optional[str] = Query(None),
+    authorization: Optional[str] = Header(None),
+    x_user_id: Optional[str] = Header(None, alias="x-user-id")
+) -> str:
+    """스트림(SSE) 사용자 ID: 브라우저 EventSource 는 헤더를 보낼 수 없으므로 ?access_token= 도 받는다"""
+    if access_token:
+        from app.utils.jwt import verify_token
+        payload = verify_token(access_token, "access")
+        if payload and "user_id" in payload:
+            return payload["user_id"]
+        raise HTTPException(status_code=401, detail="유효하지 않은 토큰입니다")
+    return await get_current_user_id(authorization=authorization, x_user_id=x_user_id)
+
 async def get_current_user(user_id: str = Depends(get_current_user_id)) -> dict:
     """현재 사용자 정보 가져오기"""
     return {"id": user_id}
+
+def is_valid_internal_token(token: Optional[str]) -> bool:
+    """내부 운영 토큰 확인 (토큰 미설정 시 development 환경에서만 허용)"""
+    import hmac
+    from app.config import settings
+    if not settings.internal_api_token:
+        return settings.environment == "development"
+    return bool(token) and hmac.compare_digest(token, settings.internal_api_token)
+
+async def require_internal_token(
+    x_internal_token: Optional[str] = Header(None, alias="x-internal-token")
+) -> None:
+    """내부 운영 엔드포인트 접근 검증"""
+    if not is_valid_internal_token(x_internal_token):
+        raise HTTPException(status_code=403, detail="내부 엔드포인트 접근 권한이 없습니다")
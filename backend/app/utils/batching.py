@@ -0,0 +1,66 @@
+"""
+/api/batch 일괄 처리용 bulk 핸들러 등록
+
+같은 라우트로 가는 하위 요청이 여러 개면 라우트 모듈이 등록한 bulk 핸들러가
+한 번의 Supabase 호출(in_ / 다건 insert)로 처리한다. 쓰기 전에 예외가 나면
+배치 엔드포인트가 하위 요청을 하나씩 다시 실행한다. 쓰기 뒤의 후속 처리(카운터, 이벤트 발행 등)는
+after_write 안에서 해서, 실패해도 이미 쓴 항목은 다시 실행하지 않고 그 결과를 그대로 돌려준다.
+
+    @bulk_handler(mark_notification_as_read)
+    async def mark_notifications_as_read_bulk(user_id, items):
+        ids = [item.path_params["notification_id"] for item in items]
+        response = ...  # UPDATE ... in_(ids)
+        written = {position: (200, {...}) for position, item in enumerate(items) if ...}
+        async with after_write(written):
+            await publish(...)
+        return [(200, {...}) or (404, {"detail": ...}) for item in items]
+"""
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+BulkResult = Tuple[int, Any]
+BulkHandler = Callable[[str, List["BatchItem"]], Awaitable[List[BulkResult]]]
+
+
+@dataclass
+class BatchItem:
+    """배치 안의 하위 요청 하나 (라우트 매칭 결과 포함)"""
+    index: int
+    method: str
+    path: str
+    path_params: Dict[str, Any]
+    body: Any = None
+
+
+# 라우트 엔드포인트 함수 -> bulk 핸들러
+BULK_HANDLERS: Dict[Callable, BulkHandler] = {}
+
+
+def bulk_handler(endpoint: Callable) -> Callable[[BulkHandler], BulkHandler]:
+    """endpoint 로 가는 하위 요청 묶음을 처리할 핸들러 등록"""
+    def decorator(handler: BulkHandler) -> BulkHandler:
+        BULK_HANDLERS[endpoint] = handler
+        return handler
+    return decorator
+
+
+class BulkWriteApplied(Exception):
+    """쓰기가 끝난 뒤 bulk 핸들러가 실패함
+
+    results 는 이미 처리한 항목(items 안의 위치 -> (status, body)). 배치 엔드포인트는 이 결과를 그대로 응답하고
+    results 에 없는 항목만 하나씩 다시 실행한다 (같은 쓰기나 부수 효과가 두 번 일어나지 않도록).
+    """
+
+    def __init__(self, results: Dict[int, BulkResult]):
+        super().__init__(f"{len(results)}개 항목 쓰기 후 실패")
+        self.results = results
+
+
+@asynccontextmanager
+async def after_write(results: Dict[int, BulkResult]):
+    """블록 안의 실패를 BulkWriteApplied(results) 로 바꾼다"""
+    try:
+        yield
+    except Exception as e:
+        raise BulkWriteApplied(results) from e
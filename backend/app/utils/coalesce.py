@@ -0,0 +1,60 @@
+"""
+인기 읽기 엔드포인트용 요청 합치기 + 짧은 TTL 캐시
+
+사용자와 무관하게 결과가 같은 GET(트렌딩, 마감 임박, 키워드 마스터, 템플릿 목록)은
+- TTL 안이면 캐시에서 바로 반환 (hit)
+- 같은 키로 진행 중인 조회가 있으면 그 결과를 함께 기다림 (coalesced)
+- 둘 다 아니면 한 번만 Supabase 조회 (miss)
+
+조회는 asyncio.to_thread 로 실행해야 이벤트 루프가 막히지 않고 동시 요청이 합쳐진다.
+"""
+from typing import Any, Awaitable, Callable, Hashable
+
+from app.config import settings
+from app.utils.lru import LRUCache
+from app.utils.metrics import registry
+from app.utils.singleflight import SingleFlight
+
+_MISSING = object()
+
+coalescing_cache_requests_total = registry.counter(
+    "coalescing_cache_requests_total", "읽기 캐시 조회 결과", ("cache", "result")
+)
+
+
+class CoalescingCache:
+    """single-flight + TTL LRU"""
+
+    def __init__(self, name: str, ttl: float, maxsize: int = 256):
+        self.name = name
+        self._memory = LRUCache(maxsize=maxsize, ttl=ttl)
+        self._flight = SingleFlight()
+
+    async def get(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        cached = self._memory.get(key, _MISSING)
+        if cached is not _MISSING:
+            coalescing_cache_requests_total.inc(cache=self.name, result="hit")
+            return cached
+
+        if self._flight.inflight(key):
+            coalescing_cache_requests_total.inc(cache=self.name, result="coalesced")
+        else:
+            coalescing_cache_requests_total.inc(cache=self.name, result="miss")
+
+        async def load() -> Any:
+            value = await loader()
+            self._memory.set(key, value)
+            return value
+
+        return await self._flight.do(key, load)
+
+    def invalidate(self, key: Hashable = None) -> None:
+        """키 하나 또는 전체 무효화"""
+        if key is None:
+            self._memory.clear()
+        else:
+            self._memory.delete(key)
+
+
+def coalescing_cache(name: str, ttl: float = None, maxsize: int = 256) -> CoalescingCache:
+    return CoalescingCache(name, ttl if ttl is not None else settings.hot_read_cache_ttl_seconds, maxsize)
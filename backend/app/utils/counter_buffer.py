@@ -0,0 +1,140 @@
+"""
+활동 조회수 / 북마크 수 write-behind 카운터
+
+상세 조회나 북마크마다 increment_* RPC 를 부르면 인기 활동 행에 UPDATE 가 몰리고
+요청마다 왕복이 하나씩 늘어난다. 대신 워커 메모리에 활동별 증감분을 모아 두고
+flush_interval 마다(그리고 종료 시) apply_activity_counter_deltas RPC 한 번으로 반영한다.
+
+- 반영 실패 시 증감분을 버퍼에 되돌려 다음 주기에 다시 보낸다 (at-least-once)
+  RPC 가 DB 에 반영된 뒤 응답만 실패한 경우 같은 증감분이 한 번 더 더해질 수 있다
+- 프로세스가 비정상 종료되면 마지막 주기의 증감분은 유실된다
+- 버퍼에 쌓인 활동 수가 max_keys 에 닿으면 주기를 기다리지 않고 바로 반영한다
+"""
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from app.config import settings
+from app.database import get_supabase
+from app.utils.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+VIEW = "view_delta"
+BOOKMARK = "bookmark_delta"
+
+counter_buffer_pending = registry.gauge(
+    "counter_buffer_pending_activities", "반영 대기 중인 활동 수"
+)
+counter_buffer_flush_total = registry.counter(
+    "counter_buffer_flush_total", "카운터 반영 횟수", ("result",)
+)
+counter_buffer_flushed_rows_total = registry.counter(
+    "counter_buffer_flushed_rows_total", "반영한 활동 행 수"
+)
+
+
+class CounterBuffer:
+    """활동별 증감분 버퍼 + 주기적 일괄 반영"""
+
+    def __init__(self, flush_interval: float, max_keys: int):
+        self.flush_interval = flush_interval
+        self.max_keys = max_keys
+        self._pending: Dict[str, Dict[str, int]] = defaultdict(lambda: {VIEW: 0, BOOKMARK: 0})
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+
+    def add(self, activity_id: str, field: str, delta: int = 1) -> None:
+        """증감분 기록 (DB 왕복 없음)"""
+        self._pending[activity_id][field] += delta
+        counter_buffer_pending.set(len(self._pending))
+        if len(self._pending) >= self.max_keys and self._wakeup is not None:
+            self._wakeup.set()
+
+    def pending(self, activity_id: str, field: str) -> int:
+        """아직 반영되지 않은 증감분 (응답에 보정해서 보여줄 때 사용)"""
+        deltas = self._pending.get(activity_id)
+        return deltas[field] if deltas else 0
+
+    def _merge_back(self, rows: List[dict]) -> None:
+        for row in rows:
+            deltas = self._pending[row["activity_id"]]
+            deltas[VIEW] += row[VIEW]
+            deltas[BOOKMARK] += row[BOOKMARK]
+        counter_buffer_pending.set(len(self._pending))
+
+    async def flush(self) -> int:
+        """버퍼를 비우고 한 번의 RPC 로 반영. 반영한 활동 수 반환"""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            pending, self._pending = self._pending, defaultdict(lambda: {VIEW: 0, BOOKMARK: 0})
+            counter_buffer_pending.set(0)
+            rows = [
+                {"activity_id": activity_id, **deltas}
+                for activity_id, deltas in sorted(pending.items())
+                if deltas[VIEW] or deltas[BOOKMARK]
+            ]
+            if not rows:
+                return 0
+
+            try:
+                await asyncio.to_thread(
+                    lambda: get_supabase().rpc("apply_activity_counter_deltas", {"deltas": rows}).execute()
+                )
+            except asyncio.CancelledError:
+                # 종료 중 취소되면 stop() 의 마지막 flush 에서 다시 보낸다
+                self._merge_back(rows)
+                raise
+            except Exception:
+                counter_buffer_flush_total.inc(result="error")
+                logger.exception(f"카운터 반영 실패, 다음 주기에 재시도: {len(rows)}개 활동")
+                self._merge_back(rows)
+                return 0
+
+            counter_buffer_flush_total.inc(result="ok")
+            counter_buffer_flushed_rows_total.inc(len(rows))
+            return len(rows)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def stop(self) -> None:
+        """주기 작업을 멈추고 남은 증감분 반영 (종료 시 호출)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+        self._wakeup = None
+        self._flush_lock = None
+
+
+counter_buffer = CounterBuffer(
+    flush_interval=settings.counter_flush_interval_seconds,
+    max_keys=settings.counter_buffer_max_keys,
+)
@@ -0,0 +1,198 @@
+"""
+증빙 문서 처리 파이프라인
+
+- PDF 텍스트 추출 (pypdfium2, 텍스트 레이어 기준)
+- 이미지 / PDF 첫 페이지 미리보기 썸네일 (Pillow)
+- CPU 작업은 프로세스 풀에서 실행 (이벤트 루프 차단 방지). 풀은 웹 워커마다 하나이므로
+  기본 크기는 코어 수 / 웹 워커 수(WEB_CONCURRENCY)이고, 스레드가 도는 워커를 fork 하지 않도록
+  forkserver(없으면 spawn)로 자식 프로세스를 만든다
+- 결과(ocr_text / ocr_confidence / thumbnail_url / verified_keywords)는
+  같은 content_hash 를 가진 evidence 행에 비동기로 채움
+"""
+import asyncio
+import io
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from app.config import settings
+from app.database import get_supabase
+from app.utils.evidence_blobs import THUMBNAIL_PREFIX
+from app.utils.storage import get_storage
+from app.utils.uploads import content_key
+
+logger = logging.getLogger(__name__)
+
+PDF_MIME = "application/pdf"
+IMAGE_MIMES = {"image/jpeg", "image/png", "image/webp", "image/gif"}
+
+
+# ===== 프로세스 풀에서 실행되는 함수 (pickle 가능한 최상위 함수) =====
+
+def _thumbnail_png(image, size: int) -> bytes:
+    image.thumbnail((size, size))
+    if image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
+
+
+def _process_pdf(path: str, thumbnail_size: int, max_pages: int) -> Dict[str, Any]:
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(path)
+    thumbnail = None
+    try:
+        page_count = len(pdf)
+        texts = []
+        pages_with_text = 0
+        for index in range(min(page_count, max_pages)):
+            page = pdf[index]
+            textpage = page.get_textpage()
+            text = textpage.get_text_range().strip()
+            textpage.close()
+            if text:
+                pages_with_text += 1
+                texts.append(text)
+            if index == 0:
+                # 썸네일 크기에 맞춰 렌더링 배율 결정
+                width, height = page.get_size()
+                scale = thumbnail_size / max(width, height, 1)
+                thumbnail = _thumbnail_png(page.render(scale=scale).to_pil(), thumbnail_size)
+            page.close()
+    finally:
+        pdf.close()
+
+    scanned = min(page_count, max_pages)
+    return {
+        "text": "\n".join(texts),
+        # 텍스트 레이어가 있는 페이지 비율 (스캔 이미지 PDF 는 0)
+        "confidence": round(pages_with_text / scanned, 2) if scanned else 0.0,
+        "thumbnail": thumbnail,
+        "pages": page_count,
+    }
+
+
+def _process_image(path: str, thumbnail_size: int) -> Dict[str, Any]:
+    from PIL import Image
+
+    with Image.open(path) as image:
+        image.load()
+        thumbnail = _thumbnail_png(image, thumbnail_size)
+    return {"text": None, "confidence": None, "thumbnail": thumbnail, "pages": 1}
+
+
+def process_document(path: str, mime_type: str, thumbnail_size: int = 320, max_pages: int = 50) -> Dict[str, Any]:
+    """문서 1건 처리 (텍스트 + 썸네일)"""
+    if mime_type == PDF_MIME:
+        return _process_pdf(path, thumbnail_size, max_pages)
+    if mime_type in IMAGE_MIMES:
+        return _process_image(path, thumbnail_size)
+    return {"text": None, "confidence": None, "thumbnail": None, "pages": 0}
+
+
+# ===== 이벤트 루프 쪽 =====
+
+def match_keywords(text: Optional[str], keyword_names: List[str]) -> List[str]:
+    """추출된 텍스트에 등장하는 키워드 마스터 이름"""
+    if not text:
+        return []
+    compact = "".join(text.split())
+    return [name for name in keyword_names if name and "".join(name.split()) in compact]
+
+
+class DocumentPipeline:
+    """프로세스 풀 기반 문서 처리기"""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._tasks: set = set()
+
+    def pool_size(self) -> int:
+        """DOCUMENT_WORKERS, 없으면 웹 워커끼리 코어를 나눈 수 (워커마다 풀을 따로 만든다)"""
+        if self.max_workers:
+            return self.max_workers
+        web_workers = int(os.getenv("WEB_CONCURRENCY") or 1)
+        return max(1, (os.cpu_count() or 1) // max(1, web_workers))
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # 워커에는 루프 감시 / to_thread 스레드가 돌고 있으므로 fork 대신 깨끗한 프로세스에서 시작
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.pool_size(),
+                mp_context=multiprocessing.get_context(method),
+            )
+        return self._pool
+
+    async def process(self, path: str, mime_type: str) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_pool(),
+            process_document,
+            path,
+            mime_type,
+            settings.document_thumbnail_size,
+            settings.document_max_pages,
+        )
+
+    async def process_evidence(self, content_hash: str, storage_key: str, mime_type: str) -> Dict[str, Any]:
+        """저장된 증빙 파일을 처리하고 같은 content_hash 의 evidence 행 갱신"""
+        storage = get_storage()
+        async with storage.local_copy(storage_key) as path:
+            result = await self.process(path, mime_type)
+
+        thumbnail_url = None
+        if result["thumbnail"]:
+            thumbnail_url = await storage.put_bytes(
+                content_key(THUMBNAIL_PREFIX, content_hash, "image/png"),
+                result["thumbnail"],
+                "image/png",
+            )
+
+        supabase = get_supabase()
+        keyword_names = [k["name"] for k in supabase.table("keywords").select("name").execute().data or []]
+        verified_keywords = match_keywords(result["text"], keyword_names)
+
+        update = {
+            "ocr_text": result["text"],
+            "ocr_confidence": result["confidence"],
+            "thumbnail_url": thumbnail_url,
+            "verified_keywords": verified_keywords,
+            "processing_status": "done",
+        }
+        supabase.table("evidence").update(update).eq("content_hash", content_hash).execute()
+        return update
+
+    def submit_evidence(self, content_hash: str, storage_key: str, mime_type: str) -> None:
+        """요청 경로 밖에서 처리하도록 백그라운드 작업 등록"""
+        task = asyncio.create_task(self._run_background(content_hash, storage_key, mime_type))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_background(self, content_hash: str, storage_key: str, mime_type: str) -> None:
+        try:
+            await self.process_evidence(content_hash, storage_key, mime_type)
+        except Exception:
+            logger.exception(f"증빙 문서 처리 실패: {storage_key}")
+            try:
+                get_supabase().table("evidence")\
+                    .update({"processing_status": "failed"})\
+                    .eq("content_hash", content_hash)\
+                    .execute()
+            except Exception:
+                logger.exception("증빙 처리 상태 갱신 실패")
+
+    async def shutdown(self) -> None:
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+
+document_pipeline = DocumentPipeline(settings.document_workers or None)
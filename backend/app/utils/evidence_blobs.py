@@ -0,0 +1,111 @@
+"""
+증빙 파일 콘텐츠 주소 저장 / 중복 제거
+
+- 파일은 SHA-256 기반 키(evidence/sha256/ab/abcd...)에 한 번만 저장
+- evidence.content_hash 가 같은 행의 수가 참조 카운트
+- 같은 바이트를 다시 올리면 메타데이터만 추가하고 OCR/썸네일 결과를 재사용
+- 삭제와 중복 업로드가 겹치는 경우: 삭제 쪽은 evidence_blob_releases 에 해시를 기록한 뒤 참조를 세고 파일을 지우며,
+  쓰기를 건너뛴 업로드 쪽은 행을 넣은 뒤 진행 중인 삭제가 끝나길 기다렸다가 파일이 없으면 다시 저장한다
+  (참조를 센 뒤에 들어간 행은 반드시 삭제 기록을 보게 된다)
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from fastapi import UploadFile
+
+from app.utils.storage import StorageBackend, get_storage
+from app.utils.uploads import StoredUpload, content_key, stream_upload
+
+logger = logging.getLogger(__name__)
+
+EVIDENCE_PREFIX = "evidence"
+THUMBNAIL_PREFIX = "thumbnails"
+
+RELEASE_TABLE = "evidence_blob_releases"
+# 진행 중인 삭제를 기다리는 최대 시간 / 이보다 오래된 삭제 기록은 중단된 것으로 보고 무시
+_RELEASE_WAIT_SECONDS = 10
+_RELEASE_STALE_SECONDS = 60
+
+# 같은 content_hash 의 기존 행에서 재사용할 파생 결과 컬럼
+DERIVED_COLUMNS = ["ocr_text", "ocr_confidence", "thumbnail_url", "verified_keywords", "processing_status"]
+
+
+def find_derived_artifacts(supabase, content_hash: str) -> Optional[Dict[str, Any]]:
+    """같은 내용의 기존 증빙에서 계산된 파생 결과 조회 (없으면 None)"""
+    response = supabase.table("evidence")\
+        .select(", ".join(DERIVED_COLUMNS))\
+        .eq("content_hash", content_hash)\
+        .eq("processing_status", "done")\
+        .limit(1)\
+        .execute()
+    if not response.data:
+        return None
+    return {column: response.data[0].get(column) for column in DERIVED_COLUMNS}
+
+
+def count_references(supabase, content_hash: str) -> int:
+    """content_hash 를 참조하는 evidence 행 수"""
+    response = supabase.table("evidence")\
+        .select("id", count="exact")\
+        .eq("content_hash", content_hash)\
+        .execute()
+    return response.count or 0
+
+
+async def release_blob(supabase, content_hash: Optional[str], storage_key: Optional[str]) -> bool:
+    """evidence 행 삭제 후 호출: 더 이상 참조가 없으면 저장된 파일과 썸네일 삭제"""
+    if not content_hash or not storage_key:
+        return False
+    try:
+        # 참조를 세기 전에 삭제 의도를 기록 (이후 같은 파일로 중복 업로드한 요청이 기다렸다가 다시 저장하도록)
+        supabase.table(RELEASE_TABLE).upsert({
+            "content_hash": content_hash,
+            "started_at": datetime.now(timezone.utc).isoformat(),
+        }, on_conflict="content_hash").execute()
+    except Exception:
+        logger.exception(f"증빙 파일 삭제 기록 실패, 파일은 남겨 둡니다: {storage_key}")
+        return False
+    try:
+        if count_references(supabase, content_hash) > 0:
+            return False
+        storage = get_storage()
+        await storage.delete(storage_key)
+        await storage.delete(content_key(THUMBNAIL_PREFIX, content_hash, "image/png"))
+    except Exception:
+        logger.exception(f"증빙 파일 삭제 실패: {storage_key}")
+        return False
+    finally:
+        try:
+            supabase.table(RELEASE_TABLE).delete().eq("content_hash", content_hash).execute()
+        except Exception:
+            logger.exception(f"증빙 파일 삭제 기록 정리 실패: {content_hash}")
+    return True
+
+
+def _release_in_progress(supabase, content_hash: str) -> bool:
+    since = datetime.now(timezone.utc) - timedelta(seconds=_RELEASE_STALE_SECONDS)
+    response = supabase.table(RELEASE_TABLE)\
+        .select("content_hash")\
+        .eq("content_hash", content_hash)\
+        .gt("started_at", since.isoformat())\
+        .limit(1)\
+        .execute()
+    return bool(response.data)
+
+
+async def ensure_blob(supabase, stored: StoredUpload, file: UploadFile, storage: StorageBackend) -> None:
+    """중복이라 쓰기를 건너뛴 업로드의 evidence 행을 넣은 뒤 호출
+
+    그 사이 같은 파일의 삭제가 진행 중이었으면 끝날 때까지 기다렸다가, 파일이 지워졌으면 받은 파일로 다시 저장한다.
+    """
+    deadline = time.monotonic() + _RELEASE_WAIT_SECONDS
+    while _release_in_progress(supabase, stored.sha256) and time.monotonic() < deadline:
+        await asyncio.sleep(0.2)
+    if await storage.exists(stored.key):
+        return
+    logger.warning(f"중복 업로드 중 저장 파일이 삭제되어 다시 저장합니다: {stored.key}")
+    await file.seek(0)
+    await stream_upload(file, storage, key_for=lambda digest, mime: stored.key)
@@ -0,0 +1,287 @@
+"""
+조건부 GET(ETag / 304) + 응답 압축 (순수 ASGI 미들웨어)
+
+ConditionalGetMiddleware
+- GET/HEAD 200 응답 본문으로 강한 ETag 를 만들고, If-None-Match 가 같으면 본문 없이 304
+  (SuccessResponse / success_response 봉투의 응답 시각 timestamp 는 해시에서 뺀다)
+- 라우트가 ETag 를 직접 붙였으면 그대로 사용 (versioned_etag 참고)
+- 스트리밍 응답(파일, text/event-stream)은 건드리지 않음
+
+CompressionMiddleware
+- Accept-Encoding 에 따라 brotli(설치된 경우) 또는 gzip
+- compression_min_size 미만, 이미 압축된 형식, 스트리밍 응답은 그대로 전송
+- 압축한 표현의 ETag 에는 -br / -gzip 접미사를 붙인다 (표현마다 강한 ETag 가 달라야 함)
+
+versioned_etag
+- 사용자별 데이터 버전(app.cache 태그 버전)으로 ETag 를 만들어 DB 조회 전에 304 를 돌려준다
+- 태그 버전이 워커 사이에 공유될 때(CACHE_BACKEND=sqlite/redis)만 사용한다.
+  memory 백엔드는 워커마다 버전이 달라 오래된 데이터에 304 를 줄 수 있으므로 본문 ETag 로 대체된다
+"""
+import gzip
+import hashlib
+import logging
+import re
+from typing import List, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from app.cache import cache
+from app.config import settings
+from app.utils.metrics import registry, route_template
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+http_not_modified_total = registry.counter(
+    "http_not_modified_total", "If-None-Match 일치로 304 응답한 수", ("route", "source")
+)
+http_compressed_bytes_total = registry.counter(
+    "http_compressed_bytes_total", "압축 전후 응답 바이트", ("encoding", "stage")
+)
+
+# SuccessResponse / success_response 봉투의 마지막 최상위 필드 (요청마다 달라지는 응답 시각)
+_ENVELOPE_TIMESTAMP = re.compile(rb',"timestamp":"[^"]*"\}\s*$')
+
+_COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "image/svg+xml")
+_ENCODING_SUFFIXES = ("-br", "-gzip")
+
+
+def _header(headers: List[Tuple[bytes, bytes]], name: bytes) -> Optional[bytes]:
+    for key, value in headers:
+        if key.lower() == name:
+            return value
+    return None
+
+
+def _without(headers: List[Tuple[bytes, bytes]], *names: bytes) -> List[Tuple[bytes, bytes]]:
+    return [(key, value) for key, value in headers if key.lower() not in names]
+
+
+def _strip_etag(tag: str) -> str:
+    """W/ 접두사와 압축 접미사를 뗀 비교용 값"""
+    tag = tag.strip()
+    if tag.startswith("W/"):
+        tag = tag[2:]
+    tag = tag.strip('"')
+    for suffix in _ENCODING_SUFFIXES:
+        if tag.endswith(suffix):
+            return tag[: -len(suffix)]
+    return tag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 비교 (약한 비교, RFC 9110 13.1.2)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    target = _strip_etag(etag)
+    return any(_strip_etag(candidate) == target for candidate in if_none_match.split(","))
+
+
+def body_etag(body: bytes) -> bytes:
+    """본문 해시 ETag (봉투의 응답 시각은 제외해 같은 데이터면 같은 값)"""
+    digest = hashlib.blake2b(_ENVELOPE_TIMESTAMP.sub(b"}", body), digest_size=16).hexdigest()
+    return f'"{digest}"'.encode()
+
+
+def _not_modified_headers(headers: List[Tuple[bytes, bytes]]) -> List[Tuple[bytes, bytes]]:
+    # 304 에는 본문 관련 헤더를 보내지 않는다
+    return _without(headers, b"content-length", b"content-type", b"content-encoding")
+
+
+class ConditionalGetMiddleware:
+    """GET 응답에 강한 ETag 부여 + If-None-Match 일치 시 304"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD") or not settings.etag_enabled:
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = _header(scope["headers"], b"if-none-match")
+        if_none_match = if_none_match.decode("latin-1") if if_none_match else None
+        start_message = None
+
+        async def send_wrapper(message):
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                if message["status"] != 200:
+                    await send(message)
+                    return
+                start_message = message
+                return
+
+            if start_message is None:
+                await send(message)
+                return
+
+            start, start_message = start_message, None
+            headers = list(start.get("headers", []))
+            body = message.get("body", b"")
+            if message.get("more_body", False):
+                # 스트리밍 응답은 전체 본문을 모을 수 없으므로 그대로 전달
+                await send(start)
+                await send(message)
+                return
+
+            etag = _header(headers, b"etag")
+            if etag is None:
+                etag = body_etag(body)
+                headers.append((b"etag", etag))
+                source = "body"
+            else:
+                source = "route"
+            if _header(headers, b"cache-control") is None:
+                # 브라우저가 저장하되 매번 재검증하도록 (304 로 본문 전송 절약)
+                headers.append((b"cache-control", b"private, no-cache"))
+
+            if etag_matches(if_none_match, etag.decode("latin-1")):
+                http_not_modified_total.inc(route=route_template(scope), source=source)
+                await send({"type": "http.response.start", "status": 304, "headers": _not_modified_headers(headers)})
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            await send({**start, "headers": headers})
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def _choose_encoding(accept_encoding: Optional[bytes]) -> Optional[str]:
+    if not accept_encoding:
+        return None
+    accepted = {}
+    for part in accept_encoding.decode("latin-1").split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+    if brotli is not None and accepted.get("br", 0) > 0:
+        return "br"
+    if accepted.get("gzip", 0) > 0:
+        return "gzip"
+    return None
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.compression_brotli_quality)
+    return gzip.compress(body, compresslevel=settings.compression_gzip_level)
+
+
+def _compressible(headers: List[Tuple[bytes, bytes]]) -> bool:
+    if _header(headers, b"content-encoding") is not None:
+        return False
+    content_type = (_header(headers, b"content-type") or b"").decode("latin-1").lower()
+    if content_type.startswith("text/event-stream"):
+        return False
+    return content_type.startswith(_COMPRESSIBLE_TYPES)
+
+
+class CompressionMiddleware:
+    """min_size 이상 응답을 brotli / gzip 으로 압축 (단일 본문 응답만)"""
+
+    def __init__(self, app, min_size: Optional[int] = None):
+        self.app = app
+        self.min_size = min_size if min_size is not None else settings.compression_min_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.compression_enabled:
+            await self.app(scope, receive, send)
+            return
+        encoding = _choose_encoding(_header(scope["headers"], b"accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+
+        async def send_wrapper(message):
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                if message["status"] < 200 or message["status"] in (204, 304) or not _compressible(message.get("headers", [])):
+                    await send(message)
+                    return
+                start_message = message
+                return
+
+            if start_message is None:
+                await send(message)
+                return
+
+            start, start_message = start_message, None
+            body = message.get("body", b"")
+            if message.get("more_body", False) or len(body) < self.min_size:
+                await send(start)
+                await send(message)
+                return
+
+            compressed = _compress(body, encoding)
+            http_compressed_bytes_total.inc(len(body), encoding=encoding, stage="in")
+            http_compressed_bytes_total.inc(len(compressed), encoding=encoding, stage="out")
+
+            headers = _without(list(start.get("headers", [])), b"content-length", b"etag")
+            headers.append((b"content-encoding", encoding.encode()))
+            headers.append((b"content-length", str(len(compressed)).encode()))
+            vary = _header(headers, b"vary")
+            if vary is None:
+                headers.append((b"vary", b"Accept-Encoding"))
+            elif b"accept-encoding" not in vary.lower():
+                headers = _without(headers, b"vary") + [(b"vary", vary + b", Accept-Encoding")]
+            etag = _header(start.get("headers", []), b"etag")
+            if etag is not None and etag.endswith(b'"'):
+                headers.append((b"etag", etag[:-1] + f"-{encoding}".encode() + b'"'))
+
+            await send({**start, "headers": headers})
+            await send({**message, "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
+
+
+async def versioned_etag(request: Request, *tags: str) -> Tuple[Optional[str], Optional[Response]]:
+    """태그 버전 기반 ETag 와 (일치하면) 304 응답
+
+        etag, not_modified = await versioned_etag(request, f"user:{user_id}:logs")
+        if not_modified:
+            return not_modified
+        ...
+        return with_etag(success_response(data), etag)
+
+    공유 캐시 백엔드가 없으면 (None, None) 을 돌려주고 미들웨어의 본문 ETag 를 쓴다.
+    """
+    if not settings.etag_enabled or cache.shared is None:
+        return None, None
+    try:
+        versions = await cache.tag_versions(*tags)
+    except Exception:
+        logger.exception("태그 버전 조회 실패, 본문 ETag 로 대체")
+        return None, None
+
+    seed = "|".join([
+        request.url.path,
+        str(request.url.query),
+        *(f"{tag}={versions.get(tag, 0)}" for tag in sorted(tags)),
+    ])
+    etag = f'"v-{hashlib.blake2b(seed.encode(), digest_size=16).hexdigest()}"'
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        http_not_modified_total.inc(route=route_template(request.scope), source="version")
+        return etag, Response(status_code=304, headers={"etag": etag, "cache-control": "private, no-cache"})
+    return etag, None
+
+
+def with_etag(response: Response, etag: Optional[str]) -> Response:
+    if etag:
+        response.headers["etag"] = etag
+    return response
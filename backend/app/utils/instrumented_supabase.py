@@ -0,0 +1,115 @@
+"""
+Supabase 클라이언트 계측 래퍼
+
+supabase.table("logs").select(...).eq(...).execute() 체인을 그대로 통과시키면서
+execute() 시점에 테이블 / 작업(select, insert, update, upsert, delete, rpc)별
+호출 수와 왕복 시간을 기록한다.
+
+체인에서 쓰인 select 컬럼과 필터 컬럼(값 제외)을 모아 쿼리 "모양"을 만들고
+요청 단위 추적기(app.utils.query_tracer)에 넘겨 N+1 을 감지한다.
+"""
+import time
+from typing import Any, Tuple
+
+from app.utils.metrics import supabase_request_duration_seconds, supabase_requests_total
+from app.utils.query_tracer import record_query_shape
+
+OPERATIONS = {"select", "insert", "update", "upsert", "delete"}
+
+# 첫 인자가 컬럼 이름인 필터 / 정렬 메서드
+FILTER_METHODS = {
+    "eq", "neq", "gt", "gte", "lt", "lte", "like", "ilike", "is_", "in_",
+    "contains", "contained_by", "overlaps", "text_search", "order",
+}
+
+
+class LatencyEWMA:
+    """최근 왕복 시간 지수 이동 평균 (부하 판단용)"""
+
+    def __init__(self, alpha: float = 0.2):
+        self.alpha = alpha
+        self.value = 0.0
+
+    def observe(self, duration: float) -> None:
+        self.value = self.alpha * duration + (1 - self.alpha) * self.value
+
+
+supabase_latency = LatencyEWMA()
+
+
+def record_query(table: str, operation: str, duration: float, ok: bool) -> None:
+    supabase_latency.observe(duration)
+    supabase_request_duration_seconds.observe(duration, table=table, operation=operation)
+    supabase_requests_total.inc(table=table, operation=operation, outcome="ok" if ok else "error")
+
+
+class InstrumentedQuery:
+    """postgrest 쿼리 빌더 프록시"""
+
+    __slots__ = ("_builder", "_table", "_operation", "_parts")
+
+    def __init__(self, builder: Any, table: str, operation: str = "unknown", parts: Tuple[str, ...] = ()):
+        self._builder = builder
+        self._table = table
+        self._operation = operation
+        self._parts = parts
+
+    def _wrap(self, result: Any, operation: str, parts: Tuple[str, ...]) -> Any:
+        # 체인 중간 결과(빌더)만 다시 감싼다
+        if hasattr(result, "execute"):
+            return InstrumentedQuery(result, self._table, operation, parts)
+        return result
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._builder, name)
+        operation = name if name in OPERATIONS else self._operation
+        if not callable(attr):
+            return self._wrap(attr, operation, self._parts)
+
+        def call(*args, **kwargs):
+            parts = self._parts
+            if name == "select" and args:
+                parts += (f"select({' '.join(str(args[0]).split())})",)
+            elif name in FILTER_METHODS and args:
+                parts += (f"{name.rstrip('_')}:{args[0]}",)
+            elif name == "match" and args and isinstance(args[0], dict):
+                parts += tuple(f"eq:{column}" for column in sorted(args[0]))
+            return self._wrap(attr(*args, **kwargs), operation, parts)
+
+        return call
+
+    @property
+    def shape(self) -> str:
+        return " ".join((self._operation, self._table) + self._parts)
+
+    def execute(self) -> Any:
+        started = time.perf_counter()
+        ok = False
+        try:
+            response = self._builder.execute()
+            ok = True
+            return response
+        finally:
+            duration = time.perf_counter() - started
+            record_query(self._table, self._operation, duration, ok)
+            record_query_shape(self.shape, duration)
+
+
+class InstrumentedClient:
+    """supabase Client 프록시 (table / from_ / rpc 만 계측, 나머지는 그대로 위임)"""
+
+    def __init__(self, client: Any):
+        self._client = client
+
+    def table(self, table_name: str) -> InstrumentedQuery:
+        return InstrumentedQuery(self._client.table(table_name), table_name)
+
+    def from_(self, table_name: str) -> InstrumentedQuery:
+        return InstrumentedQuery(self._client.from_(table_name), table_name)
+
+    def rpc(self, fn: str, params: Any = None, *args, **kwargs) -> InstrumentedQuery:
+        builder = self._client.rpc(fn, params if params is not None else {}, *args, **kwargs)
+        return InstrumentedQuery(builder, f"rpc:{fn}", "rpc")
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
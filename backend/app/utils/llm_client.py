@@ -0,0 +1,396 @@
+"""
+비동기 LLM 클라이언트 (OpenAI Chat Completions 호환)
+
+- aiohttp 세션 재사용 (커넥션 풀)
+- 전역 / 사용자별 동시 실행 한도
+- 요청 데드라인 (asyncio.timeout)
+- 스트리밍 응답 (SSE data: 라인)
+- 짧은 키워드 추출 프롬프트 마이크로 배칭
+- 토큰 / 지연시간 메트릭
+
+settings.openai_base_url 을 로컬 mock 서버(scripts/mock_llm_server.py)로
+바꾸면 실제 API 없이 테스트할 수 있다.
+"""
+import asyncio
+import json
+import logging
+import time
+from collections import defaultdict
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import aiohttp
+
+from app.config import settings
+from app.utils.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+
+class LLMError(Exception):
+    """LLM 호출 실패"""
+
+
+class LLMTimeoutError(LLMError):
+    """데드라인 초과"""
+
+
+@dataclass
+class LLMMetrics:
+    """토큰 사용량 / 지연시간 누적 값"""
+    requests: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    batches: int = 0
+    batched_prompts: int = 0
+    latency_seconds_total: float = 0.0
+    latency_seconds_max: float = 0.0
+    by_operation: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+    def observe(self, operation: str, latency: float, usage: Optional[Dict[str, Any]] = None) -> None:
+        self.requests += 1
+        self.by_operation[operation] += 1
+        self.latency_seconds_total += latency
+        self.latency_seconds_max = max(self.latency_seconds_max, latency)
+        if usage:
+            self.prompt_tokens += usage.get("prompt_tokens", 0) or 0
+            self.completion_tokens += usage.get("completion_tokens", 0) or 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "batches": self.batches,
+            "batched_prompts": self.batched_prompts,
+            "avg_latency_seconds": round(self.latency_seconds_total / self.requests, 4) if self.requests else 0,
+            "max_latency_seconds": round(self.latency_seconds_max, 4),
+            "by_operation": dict(self.by_operation),
+        }
+
+    def collect(self):
+        """/metrics 출력용 (Prometheus collector)"""
+        return [
+            ("llm_requests_total", "counter", "LLM 호출 수",
+             [({"operation": op}, count) for op, count in self.by_operation.items()]),
+            ("llm_errors_total", "counter", "LLM 호출 실패 수", [({}, self.errors)]),
+            ("llm_timeouts_total", "counter", "LLM 데드라인 초과 수", [({}, self.timeouts)]),
+            ("llm_tokens_total", "counter", "LLM 토큰 사용량",
+             [({"kind": "prompt"}, self.prompt_tokens), ({"kind": "completion"}, self.completion_tokens)]),
+            ("llm_latency_seconds_total", "counter", "LLM 호출 누적 지연시간(초)", [({}, self.latency_seconds_total)]),
+            ("llm_batches_total", "counter", "키워드 배치 호출 수", [({}, self.batches)]),
+            ("llm_batched_prompts_total", "counter", "배치로 묶인 프롬프트 수", [({}, self.batched_prompts)]),
+        ]
+
+
+class _UserBudget:
+    """사용자별 세마포어 (사용 중인 사용자만 유지)"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._holders: Dict[str, int] = defaultdict(int)
+
+    @asynccontextmanager
+    async def acquire(self, user_id: str):
+        semaphore = self._semaphores.setdefault(user_id, asyncio.Semaphore(self.limit))
+        self._holders[user_id] += 1
+        try:
+            async with semaphore:
+                yield
+        finally:
+            self._holders[user_id] -= 1
+            if self._holders[user_id] <= 0:
+                self._holders.pop(user_id, None)
+                self._semaphores.pop(user_id, None)
+
+
+class LLMClient:
+    """OpenAI 호환 Chat Completions 비동기 클라이언트"""
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        base_url: str,
+        max_concurrency: int = 16,
+        per_user_concurrency: int = 2,
+        timeout_seconds: float = 30.0,
+    ):
+        self.api_key = api_key
+        self.model = model
+        self.base_url = base_url.rstrip("/")
+        self.timeout_seconds = timeout_seconds
+        self.metrics = LLMMetrics()
+        self._max_concurrency = max_concurrency
+        self._global: Optional[asyncio.Semaphore] = None
+        self._per_user = _UserBudget(per_user_concurrency)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._keyword_batcher: Optional["KeywordBatcher"] = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.api_key)
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._max_concurrency,
+                keepalive_timeout=60,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json",
+                },
+            )
+        if self._global is None:
+            self._global = asyncio.Semaphore(self._max_concurrency)
+        return self._session
+
+    async def close(self) -> None:
+        if self._keyword_batcher is not None:
+            await self._keyword_batcher.close()
+            self._keyword_batcher = None
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    @asynccontextmanager
+    async def _budget(self, user_id: Optional[str]):
+        session = await self._get_session()
+        # 사용자 한도를 먼저 잡는다 (자기 한도를 기다리는 요청이 전역 슬롯을 붙잡아 다른 사용자를 막지 않도록)
+        if user_id:
+            async with self._per_user.acquire(user_id):
+                async with self._global:
+                    yield session
+        else:
+            async with self._global:
+                yield session
+
+    def _payload(self, messages: List[Dict[str, str]], stream: bool = False, **options) -> Dict[str, Any]:
+        payload = {"model": options.pop("model", None) or self.model, "messages": messages, "stream": stream}
+        payload.update(options)
+        return payload
+
+    async def chat(
+        self,
+        messages: List[Dict[str, str]],
+        user_id: Optional[str] = None,
+        timeout: Optional[float] = None,
+        operation: str = "chat",
+        **options,
+    ) -> str:
+        """단일 응답 (전체 텍스트 반환)"""
+        deadline = timeout or self.timeout_seconds
+        started = time.perf_counter()
+        try:
+            async with asyncio.timeout(deadline):
+                async with self._budget(user_id) as session:
+                    async with session.post(
+                        f"{self.base_url}/chat/completions",
+                        json=self._payload(messages, **options),
+                    ) as response:
+                        if response.status >= 400:
+                            raise LLMError(f"LLM 응답 오류 {response.status}: {await response.text()}")
+                        body = await response.json()
+        except TimeoutError as e:
+            self.metrics.timeouts += 1
+            raise LLMTimeoutError(f"LLM 요청이 {deadline}초 안에 끝나지 않았습니다") from e
+        except aiohttp.ClientError as e:
+            self.metrics.errors += 1
+            raise LLMError(str(e)) from e
+        except LLMError:
+            self.metrics.errors += 1
+            raise
+
+        self.metrics.observe(operation, time.perf_counter() - started, body.get("usage"))
+        return body["choices"][0]["message"]["content"] or ""
+
+    async def chat_json(self, messages: List[Dict[str, str]], **kwargs) -> Any:
+        """JSON 형식 응답을 파싱해서 반환"""
+        content = await self.chat(messages, response_format={"type": "json_object"}, **kwargs)
+        try:
+            return json.loads(content)
+        except json.JSONDecodeError as e:
+            raise LLMError(f"LLM 응답을 JSON 으로 해석할 수 없습니다: {content[:200]}") from e
+
+    async def stream_chat(
+        self,
+        messages: List[Dict[str, str]],
+        user_id: Optional[str] = None,
+        timeout: Optional[float] = None,
+        operation: str = "chat_stream",
+        **options,
+    ) -> AsyncIterator[str]:
+        """스트리밍 응답 (텍스트 조각 단위로 yield)
+
+        시간 제한은 시작 시각 기준 고정 마감으로, 연결 / 한도 대기 / 업스트림 한 줄 읽기마다 건다.
+        yield 하는 동안에는 제한 범위를 열어 두지 않는다 (소비자의 느린 send() 가 취소되지 않고,
+        마감이 지나면 다음 읽기에서 LLMTimeoutError 로 끝나 한도를 돌려준다).
+        """
+        deadline = timeout or self.timeout_seconds
+        started = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        expires = loop.time() + deadline
+        usage = None
+        try:
+            async with AsyncExitStack() as stack:
+                async with asyncio.timeout_at(expires):
+                    session = await stack.enter_async_context(self._budget(user_id))
+                    response = await stack.enter_async_context(session.post(
+                        f"{self.base_url}/chat/completions",
+                        json=self._payload(messages, stream=True, stream_options={"include_usage": True}, **options),
+                    ))
+                    if response.status >= 400:
+                        raise LLMError(f"LLM 응답 오류 {response.status}: {await response.text()}")
+                while True:
+                    # 이미 받아 둔 줄은 기다리지 않고 읽히므로 마감을 직접 확인한다
+                    if loop.time() >= expires:
+                        raise TimeoutError
+                    async with asyncio.timeout_at(expires):
+                        raw_line = await response.content.readline()
+                    if not raw_line:
+                        break
+                    line = raw_line.decode("utf-8").strip()
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[len("data:"):].strip()
+                    if data == "[DONE]":
+                        break
+                    chunk = json.loads(data)
+                    usage = chunk.get("usage") or usage
+                    for choice in chunk.get("choices") or []:
+                        delta = (choice.get("delta") or {}).get("content")
+                        if delta:
+                            yield delta
+        except TimeoutError as e:
+            self.metrics.timeouts += 1
+            raise LLMTimeoutError(f"LLM 스트리밍이 {deadline}초 안에 끝나지 않았습니다") from e
+        except aiohttp.ClientError as e:
+            self.metrics.errors += 1
+            raise LLMError(str(e)) from e
+        except LLMError:
+            self.metrics.errors += 1
+            raise
+
+        self.metrics.observe(operation, time.perf_counter() - started, usage)
+
+    async def extract_keywords(self, content: str, user_id: Optional[str] = None) -> List[str]:
+        """짧은 텍스트는 마이크로 배칭으로 묶어서 한 번에 추출"""
+        if len(content) > settings.llm_batch_max_chars:
+            result = await self.chat_json(
+                [
+                    {"role": "system", "content": KEYWORD_SYSTEM_PROMPT},
+                    {"role": "user", "content": json.dumps({"texts": [content]}, ensure_ascii=False)},
+                ],
+                user_id=user_id,
+                operation="extract_keywords",
+            )
+            return _parse_keyword_result(result, 1)[0]
+
+        if self._keyword_batcher is None:
+            self._keyword_batcher = KeywordBatcher(
+                self,
+                max_batch=settings.llm_batch_max_size,
+                window_seconds=settings.llm_batch_window_ms / 1000,
+            )
+        return await self._keyword_batcher.submit(content, user_id=user_id)
+
+
+KEYWORD_SYSTEM_PROMPT = (
+    "상경계열 학생의 경험 기록에서 역량 키워드를 추출합니다. "
+    "입력 JSON 의 texts 배열 순서대로 각 텍스트의 키워드(최대 5개)를 "
+    '{"keywords": [["키워드", ...], ...]} 형식의 JSON 으로만 응답하세요.'
+)
+
+
+def _parse_keyword_result(result: Any, expected: int) -> List[List[str]]:
+    keywords = result.get("keywords") if isinstance(result, dict) else None
+    if not isinstance(keywords, list) or len(keywords) != expected:
+        raise LLMError("키워드 추출 응답 형식이 올바르지 않습니다")
+    return [[str(k) for k in item][:5] if isinstance(item, list) else [] for item in keywords]
+
+
+class KeywordBatcher:
+    """짧은 키워드 추출 요청을 window 동안 모아서 한 번의 호출로 처리"""
+
+    def __init__(self, client: LLMClient, max_batch: int, window_seconds: float):
+        self.client = client
+        self.max_batch = max_batch
+        self.window_seconds = window_seconds
+        self._pending: List[tuple] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: set = set()
+
+    async def submit(self, content: str, user_id: Optional[str] = None) -> List[str]:
+        """배치 호출은 여러 사용자의 텍스트를 묶으므로, 사용자 한도는 결과를 받을 때까지 텍스트마다 잡아 둔다"""
+        if user_id:
+            async with self.client._per_user.acquire(user_id):
+                return await self._submit(content)
+        return await self._submit(content)
+
+    async def _submit(self, content: str) -> List[str]:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((content, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.window_seconds, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[tuple]) -> None:
+        texts = [content for content, _ in batch]
+        self.client.metrics.batches += 1
+        self.client.metrics.batched_prompts += len(texts)
+        try:
+            result = await self.client.chat_json(
+                [
+                    {"role": "system", "content": KEYWORD_SYSTEM_PROMPT},
+                    {"role": "user", "content": json.dumps({"texts": texts}, ensure_ascii=False)},
+                ],
+                operation="extract_keywords_batch",
+            )
+            keywords = _parse_keyword_result(result, len(texts))
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), item in zip(batch, keywords):
+            if not future.done():
+                future.set_result(item)
+
+    async def close(self) -> None:
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+llm_client = LLMClient(
+    api_key=settings.openai_api_key,
+    model=settings.openai_model,
+    base_url=settings.openai_base_url,
+    max_concurrency=settings.llm_max_concurrency,
+    per_user_concurrency=settings.llm_per_user_concurrency,
+    timeout_seconds=settings.llm_timeout_seconds,
+)
+
+registry.register_collector(llm_client.metrics.collect)
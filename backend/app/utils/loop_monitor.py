@@ -0,0 +1,138 @@
+"""
+이벤트 루프 지연 모니터 / 블로킹 호출 감지
+
+- 모니터 코루틴: interval 마다 깨어나 예정 시각과의 차이(루프 지연)를 측정해 메트릭으로 기록
+- 감시 스레드: 모니터의 하트비트가 block_threshold 이상 멈추면 루프 스레드의 스택을
+  sys._current_frames() 로 잡아 app/ 아래 첫 호출 지점(routes 등)을 기록
+
+동기 Supabase 호출, bcrypt, 파일 읽기처럼 async 핸들러 안에서 루프를 막는 코드를
+찾는 용도. 최근 보고는 /internal/blocking 에서 확인한다.
+"""
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+
+from app.config import settings
+from app.utils.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+event_loop_lag_seconds = registry.gauge(
+    "event_loop_lag_seconds", "최근 측정한 이벤트 루프 지연(초)"
+)
+event_loop_lag_histogram = registry.histogram(
+    "event_loop_lag_distribution_seconds", "이벤트 루프 지연 분포(초)",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+event_loop_blocked_total = registry.counter(
+    "event_loop_blocked_total", "임계값 이상 루프를 막은 호출 수", ("site",)
+)
+
+APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# 감지 지점에서 제외할 계측 모듈 (실제 호출 지점은 그 바깥)
+_SKIP_FILES = {os.path.abspath(__file__)}
+
+
+def _blocking_site(frames: List[traceback.FrameSummary]) -> str:
+    """스택에서 가장 안쪽의 app/ 코드 위치 (routes 우선)"""
+    app_frames = [f for f in frames if f.filename.startswith(APP_ROOT) and f.filename not in _SKIP_FILES]
+    route_frames = [f for f in app_frames if f"{os.sep}routes{os.sep}" in f.filename]
+    frame = (route_frames or app_frames or frames or [None])[-1]
+    if frame is None:
+        return "unknown"
+    return f"{os.path.relpath(frame.filename, os.path.dirname(APP_ROOT))}:{frame.lineno} {frame.name}"
+
+
+class LoopMonitor:
+    """루프 지연 측정 코루틴 + 블로킹 감시 스레드"""
+
+    def __init__(self, interval: float, block_threshold: float, max_reports: int = 50):
+        self.interval = interval
+        self.block_threshold = block_threshold
+        self.lag = 0.0
+        self.lag_ewma = 0.0
+        self.reports: Deque[Dict[str, Any]] = deque(maxlen=max_reports)
+        self._heartbeat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self._heartbeat = now
+            self.lag = max(0.0, now - expected)
+            self.lag_ewma = 0.8 * self.lag_ewma + 0.2 * self.lag
+            event_loop_lag_seconds.set(self.lag)
+            event_loop_lag_histogram.observe(self.lag)
+
+    def _watch(self) -> None:
+        captured_for = None
+        poll = min(self.block_threshold / 2, 0.05)
+        while not self._stop.wait(poll):
+            heartbeat = self._heartbeat
+            stalled = time.monotonic() - heartbeat - self.interval
+            if stalled < self.block_threshold:
+                continue
+            if captured_for == heartbeat:
+                continue  # 같은 정지 구간은 한 번만 기록
+            captured_for = heartbeat
+            self._capture(stalled)
+
+    def _capture(self, stalled: float) -> None:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return
+        frames = traceback.extract_stack(frame)
+        site = _blocking_site(frames)
+        event_loop_blocked_total.inc(site=site)
+        leaf = frames[-1]
+        report = {
+            "site": site,
+            "leaf": f"{leaf.filename}:{leaf.lineno} {leaf.name}",
+            "blocked_ms": int(stalled * 1000),
+            "detected_at": datetime.now().isoformat(),
+            "stack": traceback.format_list(frames[-15:]),
+        }
+        self.reports.append(report)
+        logger.warning(f"이벤트 루프 블로킹 {report['blocked_ms']}ms 이상: {site}")
+
+
+loop_monitor = LoopMonitor(
+    interval=settings.loop_monitor_interval,
+    block_threshold=settings.loop_block_threshold_ms / 1000,
+)
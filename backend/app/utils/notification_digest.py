@@ -0,0 +1,61 @@
+"""
+알림 다이제스트 대기열 (notification_digest_queue)
+
+다이제스트 타입(NOTIFICATION_DIGEST_TYPES) 알림은 notification_frequency 가 daily / weekly / monthly 인
+사용자에게 notifications 로 바로 넣지 않고 대기열에 모은다. 주기 작업
+(python -m app.batch.notification_jobs send_digests <주기>)이 사용자당 한 건으로 넣으므로
+notifications INSERT / 읽지 않은 수 갱신 / 스트림 전달이 알림마다가 아니라 다이제스트마다 한 번이 된다.
+
+- 설정 행이 없는 사용자는 API 기본값(weekly)을 따른다
+- 그 밖의 주기(예: immediate)면 지금처럼 바로 넣는다
+"""
+import asyncio
+from typing import Any, Dict, List, Set
+
+from app.config import settings
+from app.database import get_supabase
+
+DIGEST_FREQUENCIES = ("daily", "weekly", "monthly")
+DEFAULT_FREQUENCY = "weekly"
+
+
+def digest_types() -> Set[str]:
+    return {t.strip() for t in settings.notification_digest_types.split(",") if t.strip()}
+
+
+async def digest_users(user_ids: List[str]) -> Set[str]:
+    """알림을 다이제스트로 모아 받는 사용자 (user_preferences 한 번 조회)"""
+    if not user_ids:
+        return set()
+    supabase = get_supabase()
+    response = await asyncio.to_thread(
+        lambda: supabase.table("user_preferences")
+        .select("user_id, notification_frequency")
+        .in_("user_id", list(set(user_ids)))
+        .execute()
+    )
+    frequencies = {row["user_id"]: row.get("notification_frequency") for row in response.data or []}
+    return {
+        user_id for user_id in set(user_ids)
+        if (frequencies.get(user_id) or DEFAULT_FREQUENCY) in DIGEST_FREQUENCIES
+    }
+
+
+async def defer_digest_notifications(notifications: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """다이제스트로 보낼 알림은 대기열에 넣고, notifications 에 바로 넣을 알림만 돌려준다"""
+    types = digest_types()
+    candidates = [n for n in notifications if n.get("type") in types]
+    if not candidates:
+        return notifications
+
+    deferred_users = await digest_users([n["user_id"] for n in candidates])
+    deferred = [n for n in candidates if n["user_id"] in deferred_users]
+    if deferred:
+        supabase = get_supabase()
+        await asyncio.to_thread(
+            lambda: supabase.table("notification_digest_queue").insert([
+                {key: n.get(key) for key in ("user_id", "type", "title", "content", "link")}
+                for n in deferred
+            ]).execute()
+        )
+    return [n for n in notifications if not (n.get("type") in types and n["user_id"] in deferred_users)]
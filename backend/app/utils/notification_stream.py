@@ -0,0 +1,281 @@
+"""
+알림 실시간 전송 (Server-Sent Events)
+
+클라이언트가 /unread-count 와 목록을 주기적으로 조회하는 대신 GET /notifications/stream 을 열어 두면
+새 알림(notification)과 읽지 않은 개수 변화(unread_count)를 서버가 밀어 준다.
+
+- NotificationHub: 워커 안의 사용자별 연결(큐) 목록. 알림 이벤트 구독자(app/subscribers.py)가 push 한다
+- 연결 수 제한: 워커 전체 notification_stream_max_connections, 사용자당 notification_stream_max_per_user
+- 재연결: 사용자별 최근 이벤트를 notification_stream_replay_size 개까지 보관하고
+  Last-Event-ID 이후 이벤트를 다시 보낸다. 이벤트 ID 에 워커 pid 가 들어 있어서
+  다른 워커에서 받은 ID 이거나 버퍼에서 밀려난 경우에는 DB 에서 그 시각 이후 알림을 다시 읽는다
+- 다른 워커 / 배치 작업에서 만든 알림: 이벤트는 워커 밖으로 전달되지 않으므로
+  heartbeat 주기마다 공유 캐시의 user:{id}:notifications 태그 버전을 확인하고, 바뀌었으면 DB 에서 새 알림을 읽는다
+  (CACHE_BACKEND=sqlite/redis 일 때만. memory 백엔드에서는 재연결 시에만 따라잡는다)
+
+이벤트 ID 형식: {밀리초}-{pid}-{순번}. 재전송 구간에서 같은 알림이 두 번 올 수 있으므로 클라이언트는 알림 id 로 중복을 걸러야 한다.
+"""
+import asyncio
+import itertools
+import logging
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Set
+
+from app.cache import cache
+from app.config import settings
+from app.database import get_supabase
+from app.utils.lru import LRUCache
+from app.utils.metrics import registry
+from app.utils.query_tracer import trace_queries
+from app.utils.responses import dumps
+from app.utils.unread_counter import count_unread
+
+logger = logging.getLogger(__name__)
+
+NOTIFICATION = "notification"
+UNREAD_COUNT = "unread_count"
+
+# 연결마다 쌓아 둘 수 있는 이벤트 수 (느린 클라이언트는 연결을 끊고 재연결 시 재전송)
+_CONNECTION_QUEUE_SIZE = 100
+# 최근 이벤트를 보관할 사용자 수
+_REPLAY_USERS = 5000
+# DB 에서 다시 읽을 때 이벤트 ID 시각보다 앞당기는 폭 (삽입 ~ 전송 사이 지연 보정)
+_RESUME_SLACK_SECONDS = 5
+# 연결이 끊겼을 때 클라이언트가 재연결까지 기다릴 시간 (SSE retry 필드)
+_RETRY_MS = 3000
+
+notification_stream_connections = registry.gauge(
+    "notification_stream_connections", "열려 있는 알림 스트림 연결 수"
+)
+notification_stream_events_total = registry.counter(
+    "notification_stream_events_total", "알림 스트림으로 보낸 이벤트 수", ("event",)
+)
+notification_stream_rejected_total = registry.counter(
+    "notification_stream_rejected_total", "연결 수 제한으로 거절한 스트림 수", ("reason",)
+)
+
+
+class StreamLimitExceeded(Exception):
+    """연결 수 제한 초과 (reason: worker / user)"""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+@dataclass(frozen=True)
+class StreamEvent:
+    id: str
+    seq: int
+    event: str
+    data: Any
+
+    def encode(self) -> str:
+        notification_stream_events_total.inc(event=self.event)
+        return f"id: {self.id}\nevent: {self.event}\ndata: {dumps(self.data).decode()}\n\n"
+
+
+class _Connection:
+    def __init__(self, user_id: str):
+        self.user_id = user_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=_CONNECTION_QUEUE_SIZE)
+        # 큐가 넘쳤거나 서버가 닫는 중 (스트림을 끝내고 클라이언트 재연결에 맡긴다)
+        self.closed = False
+
+
+class NotificationHub:
+    """사용자별 알림 스트림 연결과 최근 이벤트 버퍼 (워커 단위)"""
+
+    def __init__(self, max_connections: int, max_per_user: int, replay_size: int):
+        self.max_connections = max_connections
+        self.max_per_user = max_per_user
+        self.replay_size = replay_size
+        self._connections: Dict[str, Set[_Connection]] = {}
+        self._recent = LRUCache(maxsize=_REPLAY_USERS)
+        self._seq = itertools.count(1)
+        self._total = 0
+
+    def next_event(self, event: str, data: Any) -> StreamEvent:
+        seq = next(self._seq)
+        # preload_app 으로 마스터에서 만들어지므로 pid 는 fork 뒤 매번 읽는다
+        return StreamEvent(f"{int(time.time() * 1000)}-{os.getpid()}-{seq}", seq, event, data)
+
+    def connect(self, user_id: str) -> _Connection:
+        if self._total >= self.max_connections:
+            notification_stream_rejected_total.inc(reason="worker")
+            raise StreamLimitExceeded("worker")
+        connections = self._connections.setdefault(user_id, set())
+        if len(connections) >= self.max_per_user:
+            notification_stream_rejected_total.inc(reason="user")
+            raise StreamLimitExceeded("user")
+        connection = _Connection(user_id)
+        connections.add(connection)
+        self._total += 1
+        notification_stream_connections.set(self._total)
+        return connection
+
+    def disconnect(self, connection: _Connection) -> None:
+        connections = self._connections.get(connection.user_id)
+        if not connections or connection not in connections:
+            return
+        connections.discard(connection)
+        if not connections:
+            del self._connections[connection.user_id]
+        self._total -= 1
+        notification_stream_connections.set(self._total)
+
+    def has_listeners(self, user_id: str) -> bool:
+        return bool(self._connections.get(user_id))
+
+    def push(self, user_id: str, event: str, data: Any) -> StreamEvent:
+        """사용자의 모든 연결에 이벤트 전달 (대기 없음) + 재전송 버퍼에 보관"""
+        stream_event = self.next_event(event, data)
+        recent: Optional[Deque[StreamEvent]] = self._recent.get(user_id)
+        if recent is None:
+            recent = deque(maxlen=self.replay_size)
+            self._recent.set(user_id, recent)
+        recent.append(stream_event)
+
+        for connection in self._connections.get(user_id, ()):
+            try:
+                connection.queue.put_nowait(stream_event)
+            except asyncio.QueueFull:
+                logger.warning(f"알림 스트림 큐가 가득 차 연결을 닫습니다: {user_id}")
+                connection.closed = True
+        return stream_event
+
+    def replay(self, user_id: str, last_event_id: str) -> Optional[List[StreamEvent]]:
+        """Last-Event-ID 이후 이벤트. 이 워커의 버퍼로 이어 갈 수 없으면 None (DB 에서 다시 읽기)"""
+        try:
+            _, pid, seq = (int(part) for part in last_event_id.split("-"))
+        except ValueError:
+            return None
+        recent: Optional[Deque[StreamEvent]] = self._recent.get(user_id)
+        # 버퍼에는 이 사용자에게 push 한 이벤트가 빠짐없이 들어 있으므로
+        # 가장 오래된 이벤트보다 뒤의 ID 면 그 이후 이벤트만 보내면 된다
+        if pid != os.getpid() or not recent or recent[0].seq > seq:
+            return None
+        return [event for event in recent if event.seq > seq]
+
+    def close(self) -> None:
+        """서버 종료 시 열린 스트림을 모두 끝낸다 (graceful shutdown 이 스트림에 묶이지 않도록)"""
+        for connections in self._connections.values():
+            for connection in connections:
+                connection.closed = True
+                try:
+                    connection.queue.put_nowait(None)
+                except asyncio.QueueFull:
+                    pass
+
+
+def event_time(event_id: str) -> Optional[datetime]:
+    """이벤트 ID 의 발행 시각 (형식이 다르면 None)"""
+    try:
+        millis = int(event_id.split("-", 1)[0])
+    except ValueError:
+        return None
+    return datetime.fromtimestamp(millis / 1000 - _RESUME_SLACK_SECONDS, tz=timezone.utc)
+
+
+async def fetch_notifications_since(user_id: str, since: datetime, limit: int = 50) -> List[Dict[str, Any]]:
+    """since 이후에 만들어진 알림 (오래된 순)"""
+    supabase = get_supabase()
+    response = await asyncio.to_thread(
+        lambda: supabase.table("notifications").select("*")
+        .eq("user_id", user_id)
+        .gt("created_at", since.isoformat())
+        .order("created_at")
+        .limit(limit)
+        .execute()
+    )
+    return response.data or []
+
+
+async def _notification_version(user_id: str) -> Optional[Dict[str, int]]:
+    """다른 워커 / 배치 작업의 알림 변경을 알 수 있는 공유 태그 버전 (공유 백엔드가 없으면 None)"""
+    if cache.shared is None:
+        return None
+    try:
+        return await cache.tag_versions(f"user:{user_id}:notifications")
+    except Exception:
+        logger.exception("알림 태그 버전 조회 실패")
+        return None
+
+
+def _created_at(row: Dict[str, Any]) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(row["created_at"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+async def event_stream(hub: "NotificationHub", connection: _Connection, last_event_id: Optional[str]) -> AsyncIterator[str]:
+    """연결 하나의 SSE 본문 (재전송 -> 현재 읽지 않은 개수 -> 실시간 이벤트 + heartbeat)"""
+    user_id = connection.user_id
+    sent_ids: Deque[str] = deque(maxlen=200)
+    since = datetime.now(timezone.utc)
+    last_seq = 0
+
+    def render(event: StreamEvent) -> str:
+        nonlocal since, last_seq
+        last_seq = max(last_seq, event.seq)
+        if event.event == NOTIFICATION:
+            sent_ids.append(event.data.get("id"))
+            created_at = _created_at(event.data)
+            if created_at is not None and created_at.tzinfo is not None:
+                since = max(since, created_at)
+        return event.encode()
+
+    async def from_db(after: Optional[datetime]) -> List[StreamEvent]:
+        if after is None:
+            return []
+        with trace_queries("notification_stream"):
+            rows = await fetch_notifications_since(user_id, after)
+        return [hub.next_event(NOTIFICATION, row) for row in rows if row.get("id") not in sent_ids]
+
+    async def unread_event() -> StreamEvent:
+        with trace_queries("notification_stream"):
+            return hub.next_event(UNREAD_COUNT, {"count": await count_unread(user_id)})
+
+    try:
+        yield f"retry: {_RETRY_MS}\n\n"
+
+        if last_event_id:
+            replayed = hub.replay(user_id, last_event_id)
+            if replayed is None:
+                replayed = await from_db(event_time(last_event_id))
+            for event in replayed:
+                yield render(event)
+
+        yield render(await unread_event())
+        version = await _notification_version(user_id)
+
+        while not connection.closed:
+            try:
+                event = await asyncio.wait_for(connection.queue.get(), timeout=settings.notification_stream_heartbeat_seconds)
+            except asyncio.TimeoutError:
+                current = await _notification_version(user_id)
+                if current != version:
+                    version = current
+                    for event in await from_db(since):
+                        yield render(event)
+                    yield render(await unread_event())
+                yield ": ping\n\n"
+                continue
+            if event is None:
+                break
+            if event.seq > last_seq:
+                yield render(event)
+    finally:
+        hub.disconnect(connection)
+
+
+notification_hub = NotificationHub(
+    max_connections=settings.notification_stream_max_connections,
+    max_per_user=settings.notification_stream_max_per_user,
+    replay_size=settings.notification_stream_replay_size,
+)
@@ -0,0 +1,148 @@
+"""
+요청 단위 샘플링 프로파일러 (pyinstrument, 선택 의존성)
+
+- 트리거: x-profile: 1 헤더 + 유효한 x-internal-token, 또는 profiling_sample_rate 확률
+- 한 프로세스에서 동시에 하나의 요청만 프로파일링 (나머지는 그대로 통과)
+- 결과는 speedscope JSON 으로 profiling_dir 에 저장하고 최근 profiling_max_files 개만 유지
+- 응답에 x-profile-id 헤더로 프로파일 ID 를 돌려줌 (/internal/profiles/{id} 로 다운로드)
+
+pyinstrument 가 설치되어 있지 않으면 미들웨어는 아무 것도 하지 않는다.
+"""
+import asyncio
+import logging
+import random
+import re
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from app.config import settings
+from app.utils.auth import is_valid_internal_token
+from app.utils.metrics import route_template
+
+logger = logging.getLogger(__name__)
+
+try:
+    from pyinstrument import Profiler
+    from pyinstrument.renderers import SpeedscopeRenderer
+except ImportError:  # pragma: no cover - 선택 의존성
+    Profiler = None
+    SpeedscopeRenderer = None
+
+PROFILE_SUFFIX = ".speedscope.json"
+_PROFILE_ID = re.compile(r"^[0-9A-Za-z_\-]+$")
+
+
+def _slug(value: str) -> str:
+    return re.sub(r"[^0-9A-Za-z]+", "-", value).strip("-")[:60] or "root"
+
+
+class ProfileStore:
+    """프로파일 파일 저장소 (개수 제한)"""
+
+    def __init__(self, directory: str, max_files: int):
+        self.directory = Path(directory).resolve()
+        self.max_files = max_files
+
+    def path_for(self, profile_id: str) -> Optional[Path]:
+        if not _PROFILE_ID.match(profile_id):
+            return None
+        matches = list(self.directory.glob(f"{profile_id}_*ms{PROFILE_SUFFIX}"))
+        return matches[0] if matches else None
+
+    def save(self, profile_id: str, duration_ms: int, content: str) -> Path:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{profile_id}_{duration_ms}ms{PROFILE_SUFFIX}"
+        path.write_text(content, encoding="utf-8")
+        self._prune()
+        return path
+
+    def _files(self) -> List[Path]:
+        if not self.directory.exists():
+            return []
+        return sorted(self.directory.glob(f"*{PROFILE_SUFFIX}"), key=lambda p: p.stat().st_mtime, reverse=True)
+
+    def _prune(self) -> None:
+        for stale in self._files()[self.max_files:]:
+            try:
+                stale.unlink()
+            except FileNotFoundError:
+                pass
+
+    def list(self) -> List[Dict[str, Any]]:
+        profiles = []
+        for path in self._files():
+            # 파일 이름: {시각}_{메서드}_{라우트}_{소요ms}ms.speedscope.json
+            stem = path.name[:-len(PROFILE_SUFFIX)]
+            profile_id, _, duration = stem.rpartition("_")
+            parts = profile_id.split("_", 2)
+            if len(parts) != 3:
+                continue
+            stat = path.stat()
+            profiles.append({
+                "id": profile_id,
+                "method": parts[1],
+                "route": parts[2],
+                "duration_ms": int(duration[:-2]) if duration[:-2].isdigit() else None,
+                "size_bytes": stat.st_size,
+                "created_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+            })
+        return profiles
+
+
+profile_store = ProfileStore(settings.profiling_dir, settings.profiling_max_files)
+
+
+class ProfilingMiddleware:
+    """요청 하나를 샘플링 프로파일링 (순수 ASGI)"""
+
+    def __init__(self, app):
+        self.app = app
+        self._active = False
+        if Profiler is None and settings.profiling_enabled:
+            logger.warning("pyinstrument 가 설치되어 있지 않아 요청 프로파일링을 사용할 수 없습니다")
+
+    def _should_profile(self, scope) -> bool:
+        if Profiler is None or not settings.profiling_enabled or self._active:
+            return False
+        headers = dict(scope["headers"])
+        if headers.get(b"x-profile") == b"1":
+            token = headers.get(b"x-internal-token", b"").decode("latin-1")
+            return is_valid_internal_token(token)
+        return settings.profiling_sample_rate > 0 and random.random() < settings.profiling_sample_rate
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        self._active = True
+        started_at = datetime.now().strftime("%Y%m%dT%H%M%S%f")
+        profile_id = None
+
+        def make_id() -> str:
+            return f"{started_at}_{scope['method']}_{_slug(route_template(scope))}"
+
+        async def send_wrapper(message):
+            nonlocal profile_id
+            if message["type"] == "http.response.start":
+                # 라우트 매칭이 끝난 시점에 ID 확정
+                profile_id = make_id()
+                message["headers"] = list(message.get("headers", [])) + [(b"x-profile-id", profile_id.encode())]
+            await send(message)
+
+        profiler = Profiler(interval=settings.profiling_interval, async_mode="enabled")
+        started = time.perf_counter()
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            profiler.stop()
+            self._active = False
+            duration_ms = int((time.perf_counter() - started) * 1000)
+            try:
+                content = profiler.output(renderer=SpeedscopeRenderer())
+                await asyncio.to_thread(profile_store.save, profile_id or make_id(), duration_ms, content)
+            except Exception:
+                logger.exception("프로파일 저장 실패")
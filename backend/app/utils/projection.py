@@ -0,0 +1,117 @@
+"""
+목록 조회용 컬럼 프로젝션 (sparse fieldsets)
+
+목록 엔드포인트가 select("*") 로 answers / competency_analysis / ocr_text 같은 큰 컬럼까지
+가져오지 않도록 테이블별로
+- columns: fields= 로 요청할 수 있는 컬럼 (화이트리스트)
+- list_default: fields= 가 없을 때 목록에서 쓰는 기본 컬럼 (큰 JSONB / TEXT 제외)
+를 정의한다. 전체 행은 상세 엔드포인트에서만 돌려준다.
+
+    @router.get("")
+    async def list_evidence(columns: str = Depends(fields_query("evidence"))):
+        supabase.table("evidence").select(columns)...
+
+    GET /api/evidence?fields=id,file_name,thumbnail_url
+"""
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from fastapi import HTTPException, Query
+
+
+@dataclass(frozen=True)
+class Projection:
+    columns: Tuple[str, ...]
+    list_default: Tuple[str, ...]
+
+    def select(self, fields: Optional[str] = None) -> str:
+        """fields= 값을 검증해 Supabase select 문자열로 변환 (id 는 항상 포함)"""
+        if not fields:
+            return ",".join(self.list_default)
+        requested = [name.strip() for name in fields.split(",") if name.strip()]
+        unknown = [name for name in requested if name not in self.columns]
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"알 수 없는 필드: {', '.join(unknown)} (사용 가능: {', '.join(self.columns)})",
+            )
+        selected = ["id"] + [name for name in dict.fromkeys(requested) if name != "id"]
+        return ",".join(selected)
+
+
+PROJECTIONS: Dict[str, Projection] = {
+    "reflections": Projection(
+        columns=(
+            "id", "user_id", "template_id", "template_name", "space_id", "answers",
+            "competencies", "competency_scores", "competency_analysis", "mood", "progress_score",
+            "reflection_date", "created_at", "updated_at",
+        ),
+        # competency_analysis 는 상세(GET /reflections/{id})에서만
+        # (mood / progress_score / reflection_date 는 회고 홈, 스페이스 상세 목록이 그린다)
+        list_default=(
+            "id", "user_id", "template_id", "template_name", "space_id", "answers",
+            "competencies", "competency_scores", "mood", "progress_score", "reflection_date",
+            "created_at",
+        ),
+    ),
+    "micro_logs": Projection(
+        columns=(
+            "id", "user_id", "activity_type", "memo", "mood_compare", "reason", "tags", "date",
+            "space_id", "created_at", "updated_at",
+        ),
+        list_default=(
+            "id", "user_id", "activity_type", "memo", "mood_compare", "reason", "tags", "date",
+            "space_id", "created_at",
+        ),
+    ),
+    "reflection_spaces": Projection(
+        columns=(
+            "id", "user_id", "name", "type", "description", "start_date", "end_date",
+            "reflection_cycle", "reminder_enabled", "next_reflection_date", "total_reflections",
+            "expected_reflections", "status", "created_at", "updated_at",
+        ),
+        # 목록 응답 모델(ReflectionSpaceResponse)이 요구하는 컬럼 전체
+        list_default=(
+            "id", "user_id", "name", "type", "description", "start_date", "end_date",
+            "reflection_cycle", "reminder_enabled", "next_reflection_date", "total_reflections",
+            "expected_reflections", "status", "created_at", "updated_at",
+        ),
+    ),
+    "evidence": Projection(
+        columns=(
+            "id", "user_id", "project_id", "type", "file_name", "file_url", "file_size", "mime_type",
+            "thumbnail_url", "ocr_text", "ocr_confidence", "verified_keywords", "processing_status",
+            "content_hash", "verified_at", "created_at",
+        ),
+        # ocr_text / verified_keywords 는 상세에서만
+        list_default=(
+            "id", "user_id", "project_id", "type", "file_name", "file_url", "file_size", "mime_type",
+            "thumbnail_url", "processing_status", "verified_at", "created_at",
+        ),
+    ),
+    "portfolios": Projection(
+        columns=(
+            "id", "user_id", "title", "target_job", "template", "settings", "pdf_url", "web_url",
+            "status", "generated_at", "created_at", "updated_at",
+        ),
+        # settings(JSONB) 는 상세에서만
+        list_default=(
+            "id", "user_id", "title", "target_job", "template", "pdf_url", "web_url",
+            "status", "generated_at", "created_at", "updated_at",
+        ),
+    ),
+}
+
+
+def fields_query(table: str) -> Callable[..., str]:
+    """fields= 쿼리 파라미터를 select 문자열로 바꾸는 의존성"""
+    projection = PROJECTIONS[table]
+
+    def dependency(
+        fields: Optional[str] = Query(
+            None, description=f"쉼표로 구분한 컬럼 ({', '.join(projection.columns)})"
+        ),
+    ) -> str:
+        return projection.select(fields)
+
+    return dependency
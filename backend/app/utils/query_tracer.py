@@ -0,0 +1,185 @@
+"""
+요청 단위 Supabase 쿼리 추적 / N+1 감지
+
+- QueryTraceMiddleware: 요청마다 추적기를 열고 쿼리 수를 메트릭으로 기록
+- 같은 "모양"(테이블 + 작업 + select 컬럼 + 필터 컬럼, 값 제외)의 쿼리가
+  settings.query_nplus1_threshold 번 이상 반복되면 N+1 로 보고
+- @query_budget(n): 라우트별 쿼리 예산 선언 (초과 시 경고 또는 예외)
+- trace_queries(...) / @traced(...): 배치 작업 등 요청 밖에서 쓰는 컨텍스트 매니저 / 데코레이터
+
+settings.query_budget_mode
+- off: 기록만
+- warn: 로그 경고 (기본)
+- raise: QueryBudgetExceeded 예외 (로컬 테스트에서 회귀 잡기용)
+"""
+import asyncio
+import functools
+import logging
+import threading
+from collections import Counter as CounterDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, List, Optional
+
+from app.config import settings
+from app.utils.metrics import registry, route_template
+
+logger = logging.getLogger(__name__)
+
+http_request_db_queries = registry.histogram(
+    "http_request_db_queries", "요청당 Supabase 호출 수", ("route",),
+    buckets=(1, 2, 3, 5, 8, 13, 21, 34, 55, 89),
+)
+db_query_violations_total = registry.counter(
+    "db_query_violations_total", "쿼리 예산 초과 / N+1 감지 수", ("route", "kind")
+)
+
+
+class QueryBudgetExceeded(Exception):
+    """쿼리 예산 초과 또는 N+1 감지 (query_budget_mode=raise)"""
+
+
+class QueryTrace:
+    """한 요청(또는 배치 작업) 동안의 쿼리 기록"""
+
+    def __init__(self, name: str, budget: Optional[int] = None):
+        self.name = name
+        self.budget = budget
+        self.shapes: "CounterDict[str]" = CounterDict()
+        self.duration = 0.0
+        self.reported = False
+        self._lock = threading.Lock()
+
+    @property
+    def count(self) -> int:
+        return sum(self.shapes.values())
+
+    def record(self, shape: str, duration: float) -> None:
+        # 동기 의존성 / to_thread 안의 호출도 같은 객체에 기록된다
+        with self._lock:
+            self.shapes[shape] += 1
+            self.duration += duration
+
+    def repeated_shapes(self, threshold: Optional[int] = None) -> Dict[str, int]:
+        threshold = threshold or settings.query_nplus1_threshold
+        return {shape: n for shape, n in self.shapes.items() if n >= threshold}
+
+    def violations(self) -> List[str]:
+        problems = []
+        if self.budget is not None and self.count > self.budget:
+            problems.append(f"쿼리 예산 초과: {self.count} > {self.budget}")
+        for shape, n in self.repeated_shapes().items():
+            problems.append(f"N+1 의심: {shape} x{n}")
+        return problems
+
+    def report(self, mode: Optional[str] = None) -> None:
+        """예산 / N+1 검사 결과를 모드에 따라 처리"""
+        mode = mode or settings.query_budget_mode
+        self.reported = True
+        if mode == "off":
+            return
+        problems = self.violations()
+        if not problems:
+            return
+        for problem in problems:
+            kind = "budget" if problem.startswith("쿼리 예산") else "nplus1"
+            db_query_violations_total.inc(route=self.name, kind=kind)
+        message = f"[{self.name}] " + "; ".join(problems)
+        if mode == "raise":
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
+
+
+_current_trace: ContextVar[Optional[QueryTrace]] = ContextVar("query_trace", default=None)
+
+
+def current_trace() -> Optional[QueryTrace]:
+    return _current_trace.get()
+
+
+def record_query_shape(shape: str, duration: float) -> None:
+    """instrumented_supabase 에서 execute() 마다 호출"""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.record(shape, duration)
+
+
+@contextmanager
+def trace_queries(name: str, budget: Optional[int] = None, mode: Optional[str] = None) -> Iterator[QueryTrace]:
+    """요청 밖(배치 작업, 크롤러)에서 쿼리 추적 (동기/비동기 코드 모두 with 로 사용)"""
+    trace = QueryTrace(name, budget)
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+    trace.report(mode)
+
+
+def traced(name: str, budget: Optional[int] = None) -> Callable:
+    """함수 실행 전체를 trace_queries 로 감싸는 데코레이터 (동기/비동기 함수 모두 지원)"""
+    def decorator(func: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with trace_queries(name, budget):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with trace_queries(name, budget):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+def query_budget(max_queries: int) -> Callable:
+    """라우트 핸들러의 요청당 최대 Supabase 호출 수 선언
+
+    QueryTraceMiddleware 가 연 요청 추적기(의존성에서 한 호출 포함)에 예산을 걸고
+    핸들러가 끝나는 시점에 검사한다. raise 모드면 응답 전에 500 으로 실패한다.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            trace = _current_trace.get()
+            if trace is None:
+                with trace_queries(func.__qualname__, max_queries):
+                    return await func(*args, **kwargs)
+            trace.name = func.__qualname__
+            trace.budget = max_queries
+            result = await func(*args, **kwargs)
+            trace.report()
+            return result
+
+        wrapper.__query_budget__ = max_queries
+        return wrapper
+
+    return decorator
+
+
+class QueryTraceMiddleware:
+    """요청마다 쿼리 추적기를 열고 종료 시 쿼리 수 기록 / N+1 경고 (순수 ASGI)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        trace = QueryTrace(scope["path"])
+        token = _current_trace.set(trace)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_trace.reset(token)
+            trace.name = route_template(scope)
+            if trace.count:
+                http_request_db_queries.observe(trace.count, route=trace.name)
+                if not trace.reported:
+                    # 응답은 이미 전송됐으므로 여기서는 예외 대신 경고만
+                    trace.report("off" if settings.query_budget_mode == "off" else "warn")
@@ -0,0 +1,79 @@
+"""
+빠른 JSON 응답 (orjson)
+
+- FastJSONResponse: 앱 기본 응답 클래스 (main.py default_response_class). 핸들러가 dict 를 반환하면
+  FastAPI 가 jsonable_encoder 를 거친 뒤 이 클래스로 직렬화한다
+- success_response / envelope: 큰 목록 응답용. response_model 검증과 jsonable_encoder 를 건너뛰고
+  data 만 orjson 으로 한 번 직렬화해 미리 만들어 둔 봉투 바이트 사이에 끼워 넣는다
+
+    return success_response({"bookmarks": bookmarks, "total": len(bookmarks)})
+    # {"success":true,"data":{...},"message":null,"timestamp":"..."}  (SuccessResponse 와 같은 모양)
+
+    return envelope({"reflections": rows})
+    # {"success":true,"data":{...},"error":null}
+
+orjson 이 없으면 표준 json 으로 동작한다 (느리지만 결과는 같다).
+"""
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Optional
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - requirements 에 포함
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """orjson 이 직접 처리하지 못하는 타입"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        jsonable_encoder(content), ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+_SUCCESS_PREFIX = b'{"success":true,"data":'
+_MESSAGE_KEY = b',"message":'
+_TIMESTAMP_KEY = b',"timestamp":'
+_ERROR_SUFFIX = b',"error":null}'
+
+
+def _json_response(body: bytes, status_code: int) -> Response:
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+
+def success_response(data: Any, message: Optional[str] = None, status_code: int = 200) -> Response:
+    """SuccessResponse(data, message, timestamp) 와 같은 JSON 을 검증 없이 직렬화"""
+    body = b"".join((
+        _SUCCESS_PREFIX, dumps(data),
+        _MESSAGE_KEY, dumps(message),
+        _TIMESTAMP_KEY, dumps(datetime.now()),
+        b"}",
+    ))
+    return _json_response(body, status_code)
+
+
+def envelope(data: Any, status_code: int = 200) -> Response:
+    """{success, data, error} 봉투 (reflections 계열 응답 모양)"""
+    return _json_response(b"".join((_SUCCESS_PREFIX, dumps(data), _ERROR_SUFFIX)), status_code)
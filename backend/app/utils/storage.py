@@ -0,0 +1,204 @@
+"""
+파일 저장소 백엔드
+
+- local: 로컬 파일시스템 (개발용 Supabase Storage 대체)
+- supabase: Supabase Storage 버킷
+
+두 백엔드 모두 청크 단위로 임시 파일에 기록한 뒤 commit 시점에 최종 키로
+옮기므로 파일 전체를 메모리에 올리지 않는다.
+"""
+import asyncio
+import logging
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class StorageWriter(ABC):
+    """청크 단위 쓰기 핸들"""
+
+    @abstractmethod
+    async def write(self, chunk: bytes) -> None:
+        ...
+
+    @abstractmethod
+    async def commit(self, key: str, content_type: Optional[str] = None) -> str:
+        """최종 키로 저장하고 접근 URL 반환"""
+
+    @abstractmethod
+    async def abort(self) -> None:
+        """임시 데이터 폐기"""
+
+
+class StorageBackend(ABC):
+    """저장소 백엔드 인터페이스"""
+
+    @abstractmethod
+    def open_writer(self) -> StorageWriter:
+        ...
+
+    @abstractmethod
+    def url_for(self, key: str) -> str:
+        ...
+
+    @abstractmethod
+    async def exists(self, key: str) -> bool:
+        ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def local_copy(self, key: str) -> "AsyncIterator[str]":
+        """로컬 파일 경로로 접근 (async with 로 사용)"""
+
+    async def put_bytes(self, key: str, data: bytes, content_type: Optional[str] = None) -> str:
+        """작은 파일(썸네일 등)을 한 번에 저장"""
+        writer = self.open_writer()
+        try:
+            await writer.write(data)
+            return await writer.commit(key, content_type)
+        except BaseException:
+            await writer.abort()
+            raise
+
+
+class _TempFileWriter(StorageWriter):
+    """임시 파일에 청크를 쌓는 공통 writer"""
+
+    def __init__(self, tmp_dir: Optional[str] = None):
+        fd, self.tmp_path = tempfile.mkstemp(prefix="upload-", dir=tmp_dir)
+        self._fp = os.fdopen(fd, "wb")
+
+    async def write(self, chunk: bytes) -> None:
+        await asyncio.to_thread(self._fp.write, chunk)
+
+    async def _close(self) -> None:
+        if not self._fp.closed:
+            await asyncio.to_thread(self._fp.close)
+
+    async def abort(self) -> None:
+        await self._close()
+        try:
+            os.remove(self.tmp_path)
+        except FileNotFoundError:
+            pass
+
+
+class LocalStorageBackend(StorageBackend):
+    """로컬 파일시스템 저장소"""
+
+    def __init__(self, root: str, public_base_url: str):
+        self.root = Path(root).resolve()
+        self.tmp_dir = self.root / ".tmp"
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+        self.public_base_url = public_base_url.rstrip("/")
+
+    def _path(self, key: str) -> Path:
+        path = (self.root / key).resolve()
+        if self.root not in path.parents:
+            raise ValueError(f"잘못된 저장소 키입니다: {key}")
+        return path
+
+    def open_writer(self) -> StorageWriter:
+        backend = self
+
+        class _LocalWriter(_TempFileWriter):
+            async def commit(self, key: str, content_type: Optional[str] = None) -> str:
+                await self._close()
+                target = backend._path(key)
+                target.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(self.tmp_path, target)
+                return backend.url_for(key)
+
+        return _LocalWriter(str(self.tmp_dir))
+
+    def url_for(self, key: str) -> str:
+        return f"{self.public_base_url}/{key}"
+
+    async def exists(self, key: str) -> bool:
+        return self._path(key).exists()
+
+    async def delete(self, key: str) -> None:
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    @asynccontextmanager
+    async def local_copy(self, key: str) -> AsyncIterator[str]:
+        yield str(self._path(key))
+
+
+class SupabaseStorageBackend(StorageBackend):
+    """Supabase Storage 버킷 저장소 (임시 파일 경로로 업로드)"""
+
+    def __init__(self, bucket: str):
+        self.bucket = bucket
+
+    def _bucket(self):
+        from app.database import get_supabase
+        return get_supabase().storage.from_(self.bucket)
+
+    def open_writer(self) -> StorageWriter:
+        backend = self
+
+        class _SupabaseWriter(_TempFileWriter):
+            async def commit(self, key: str, content_type: Optional[str] = None) -> str:
+                await self._close()
+                try:
+                    options = {"content-type": content_type} if content_type else None
+                    await asyncio.to_thread(backend._bucket().upload, key, self.tmp_path, options)
+                finally:
+                    await self.abort()
+                return backend.url_for(key)
+
+        return _SupabaseWriter()
+
+    def url_for(self, key: str) -> str:
+        return self._bucket().get_public_url(key)
+
+    async def exists(self, key: str) -> bool:
+        directory, _, name = key.rpartition("/")
+        files = await asyncio.to_thread(self._bucket().list, directory, {"search": name})
+        return any(f.get("name") == name for f in files or [])
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self._bucket().remove, [key])
+
+    @asynccontextmanager
+    async def local_copy(self, key: str) -> AsyncIterator[str]:
+        data = await asyncio.to_thread(self._bucket().download, key)
+        fd, tmp_path = tempfile.mkstemp(prefix="download-")
+        try:
+            with os.fdopen(fd, "wb") as fp:
+                await asyncio.to_thread(fp.write, data)
+            del data
+            yield tmp_path
+        finally:
+            os.remove(tmp_path)
+
+
+_storage: Optional[StorageBackend] = None
+
+
+def get_storage() -> StorageBackend:
+    """설정된 저장소 백엔드 반환 (싱글톤)"""
+    global _storage
+    if _storage is None:
+        if settings.storage_backend == "supabase":
+            _storage = SupabaseStorageBackend(settings.storage_bucket)
+        elif settings.storage_backend == "local":
+            _storage = LocalStorageBackend(settings.storage_local_dir, settings.storage_public_base_url)
+        else:
+            raise ValueError(f"알 수 없는 저장소 백엔드: {settings.storage_backend}")
+        logger.info(f"저장소 백엔드: {settings.storage_backend}")
+    return _storage
@@ -0,0 +1,228 @@
+"""
+회고 스토리 뷰 (GET /v1/reflections/story)
+
+기간(week 7일 / month 30일 / quarter 90일)의 마이크로 로그로 활동 요약, 긍정 / 부정 패턴, 강점 태그를 만든다.
+
+- 결과: (사용자, 기간, 오늘) 단위로 캐시 (user:{id}:micro_logs 태그 - 마이크로 로그 쓰기마다 무효화)
+- 주간 집계: 월요일 기준 주마다 날짜별 카운터(활동 유형, 긍정 / 부정 reason, 긍정 로그 태그)를 캐시
+  (user:{id}:micro_logs:{월요일} 태그 - 그 주 날짜의 로그가 추가 / 삭제될 때만 무효화)
+- 결과를 다시 만들 때는 주간 집계를 기간에 맞게 합치고, 캐시에 없는 주만 한 번의 조회로 다시 읽는다
+  (오늘 로그를 하나 쓴 뒤 분기 뷰를 열면 이번 주 로그만 읽는다)
+- 공유 백엔드가 없으면(CACHE_BACKEND=memory) 다른 워커의 쓰기로 무효화되지 않으므로
+  결과 캐시 TTL 을 cache_local_ttl_seconds 로 줄이고 주간 집계는 캐시하지 않는다
+"""
+import asyncio
+from collections import Counter
+from datetime import date, timedelta
+from typing import Any, Dict, List
+
+from app.cache import cache, cached
+from app.config import settings
+from app.database import get_supabase
+from app.events import micro_log_week_tag
+
+# 기간 -> (일수, 라벨)
+PERIODS = {
+    "week": (7, "이번 주"),
+    "month": (30, "이번 달"),
+    "quarter": (90, "이번 분기"),
+}
+
+ACTIVITY_ICONS = {
+    "contest": "🏆",
+    "club": "👥",
+    "project": "💼",
+    "internship": "💼",
+    "study": "📚",
+    "etc": "✨"
+}
+ACTIVITY_LABELS = {
+    "contest": "공모전/대외활동",
+    "club": "학회/동아리",
+    "project": "프로젝트",
+    "internship": "인턴/아르바이트",
+    "study": "자격증/공부",
+    "etc": "기타"
+}
+POSITIVE_REASONS = {
+    "positive_001": "사람들과 의견 주고받는 활동에서 에너지를 얻어요",
+    "positive_002": "새로운 것을 배우는 과정을 즐겨요",
+    "positive_003": "자신의 강점을 발휘할 수 있는 활동에서 빛나요",
+    "positive_004": "누군가에게 도움이 되는 일에서 보람을 느껴요",
+    "positive_005": "일이 술술 풀릴 때 기분이 좋아져요",
+    "positive_006": "성과를 인정받을 때 뿌듯함을 느껴요"
+}
+NEGATIVE_REASONS = {
+    "negative_001": "생각보다 잘 안 풀리는 상황에서 스트레스를 받아요",
+    "negative_002": "사람들과 의견이 안 맞을 때 어려움을 느껴요",
+    "negative_003": "시간이 오래 걸리는 작업에서 지쳐요",
+    "negative_004": "자신이 못하는 부분이 드러날 때 힘들어해요",
+    "negative_005": "하기 싫은 일을 억지로 할 때 에너지가 떨어져요",
+    "negative_006": "결과가 기대에 못 미칠 때 실망해요"
+}
+
+# 날짜별 카운터 종류: 활동 유형 / 긍정 reason / 부정 reason / 긍정 로그 태그
+_COUNTERS = ("activity", "positive", "negative", "tags")
+_COLUMNS = "date, activity_type, mood_compare, reason, tags"
+
+DayCounters = Dict[str, Dict[str, int]]
+
+
+def week_start(day: date) -> date:
+    return day - timedelta(days=day.weekday())
+
+
+def aggregate_days(rows: List[Dict[str, Any]]) -> Dict[str, DayCounters]:
+    """마이크로 로그 행 -> {날짜: {카운터 종류: {값: 개수}}} (행 순서대로 키가 들어간다)"""
+    days: Dict[str, DayCounters] = {}
+    for row in rows:
+        counters = days.setdefault(str(row["date"])[:10], {kind: {} for kind in _COUNTERS})
+        _add(counters["activity"], row.get("activity_type"))
+        if row.get("mood_compare") == "better":
+            _add(counters["positive"], row.get("reason"))
+            for tag in row.get("tags") or ():
+                _add(counters["tags"], tag)
+        elif row.get("mood_compare") == "worse":
+            _add(counters["negative"], row.get("reason"))
+    return days
+
+
+def _add(counts: Dict[str, int], value: Any) -> None:
+    if value:
+        counts[value] = counts.get(value, 0) + 1
+
+
+def merge_days(weeks: Dict[date, Dict[str, DayCounters]], start: date, end: date) -> Dict[str, Counter]:
+    """주간 집계에서 start ~ end 날짜만 합친다 (날짜 순으로 합쳐 동점 순서가 원본 순회와 같다)"""
+    totals = {kind: Counter() for kind in _COUNTERS}
+    for week in sorted(weeks):
+        for day, counters in sorted(weeks[week].items()):
+            if start <= date.fromisoformat(day) <= end:
+                for kind in _COUNTERS:
+                    totals[kind].update(counters.get(kind) or {})
+    return totals
+
+
+async def _fetch_logs(user_id: str, start: date, end: date) -> List[Dict[str, Any]]:
+    supabase = get_supabase()
+    response = await asyncio.to_thread(
+        lambda: supabase.table("micro_logs").select(_COLUMNS)
+        .eq("user_id", user_id)
+        .gte("date", start.isoformat())
+        .lte("date", end.isoformat())
+        .order("date")
+        .order("created_at")
+        .execute()
+    )
+    return response.data or []
+
+
+async def _read_weeks(user_id: str, weeks: List[date]) -> Dict[date, Dict[str, DayCounters]]:
+    """첫 주 월요일 ~ 마지막 주 일요일을 한 번에 읽어 주별로 나눈다"""
+    days = aggregate_days(await _fetch_logs(user_id, weeks[0], weeks[-1] + timedelta(days=6)))
+    return {
+        week: {day: counters for day, counters in days.items() if week_start(date.fromisoformat(day)) == week}
+        for week in weeks
+    }
+
+
+async def weekly_aggregates(user_id: str, weeks: List[date]) -> Dict[date, Dict[str, DayCounters]]:
+    """주(월요일)별 날짜 카운터. 캐시에 없는 주만 한 번의 조회로 읽어 채운다"""
+    if cache.shared is None:
+        return await _read_weeks(user_id, weeks)
+
+    ttl = settings.story_week_cache_ttl_seconds
+    keys = {week: f"story_week:{user_id}:{week.isoformat()}" for week in weeks}
+    found = await asyncio.gather(*(cache.get(keys[week], ttl=ttl, name="story_week") for week in weeks))
+    aggregates = {week: value for week, value in zip(weeks, found) if value is not None}
+
+    missing = sorted(week for week in weeks if week not in aggregates)
+    if missing:
+        tags = {week: micro_log_week_tag(user_id, week) for week in missing}
+        # 조회 전에 버전을 읽어 두어 조회 중 쓰기가 있으면 저장한 집계가 바로 무효가 되게 한다
+        versions = await cache.tag_versions(*tags.values())
+        aggregates.update(await _read_weeks(user_id, missing))
+        for week in missing:
+            await cache.set(
+                keys[week], aggregates[week], ttl=ttl, tags=[tags[week]], versions=versions, name="story_week"
+            )
+    return aggregates
+
+
+def build_story(totals: Dict[str, Counter], days: int, period_label: str) -> Dict[str, Any]:
+    """합친 카운터 -> 스토리 뷰 응답 데이터"""
+    if not totals["activity"]:
+        return {
+            "period_label": period_label,
+            "total_days": days,
+            "activity_summary": [],
+            "positive_patterns": [],
+            "negative_patterns": [],
+            "strength_analysis": "아직 기록이 부족해요. 더 많은 경험을 기록해보세요!",
+            "suggested_tracks": [],
+            "next_suggestion": None
+        }
+
+    activity_summary = [
+        {
+            "type": act_type,
+            "count": count,
+            "icon": ACTIVITY_ICONS.get(act_type, "✨"),
+            "label": ACTIVITY_LABELS.get(act_type, "기타")
+        }
+        for act_type, count in totals["activity"].most_common()
+    ]
+    positive_patterns = [
+        POSITIVE_REASONS.get(reason, "긍정적인 경험을 많이 하고 있어요")
+        for reason, _ in totals["positive"].most_common(3)
+    ]
+    negative_patterns = [
+        NEGATIVE_REASONS.get(reason, "어려운 경험도 있었어요")
+        for reason, _ in totals["negative"].most_common(2)
+    ]
+
+    # 강점 분석 (긍정 로그에서 빈도 높은 태그 기반)
+    strength_analysis = "아직 패턴이 명확하지 않아요. 더 많은 경험을 기록해보세요!"
+    if totals["tags"]:
+        top_tags = [tag for tag, _ in totals["tags"].most_common(3)]
+        strength_analysis = f"**{', '.join(top_tags)}** 분야에서 강점을 보이고 있어요."
+
+    return {
+        "period_label": period_label,
+        "total_days": days,
+        "activity_summary": activity_summary,
+        "positive_patterns": positive_patterns,
+        "negative_patterns": negative_patterns,
+        "strength_analysis": strength_analysis,
+        # 추천 진로 트랙 (간단 버전 - AI 통합 시 개선)
+        "suggested_tracks": [
+            {
+                "track": "기획/전략",
+                "score": 75,
+                "reason": "체계적인 활동 기록과 분석 능력"
+            }
+        ],
+        # 다음 행동 제안
+        "next_suggestion": {
+            "title": "더 다양한 경험 쌓기",
+            "description": "지금까지의 경험을 바탕으로, 새로운 분야에도 도전해보세요.",
+            "action": "추천 활동 보러가기",
+            "recommended_activities": []
+        }
+    }
+
+
+def _story_ttl() -> float:
+    if cache.shared is None:
+        return min(settings.story_cache_ttl_seconds, settings.cache_local_ttl_seconds)
+    return settings.story_cache_ttl_seconds
+
+
+@cached(ttl=_story_ttl(), tags=["user:{user_id}:micro_logs"])
+async def get_story(user_id: str, period: str, today: date) -> Dict[str, Any]:
+    """기간 스토리 뷰 (today 가 키에 들어가 날짜가 바뀌면 기간도 새로 잡힌다)"""
+    days, period_label = PERIODS[period]
+    start = today - timedelta(days=days)
+    weeks = [week_start(start) + timedelta(weeks=i) for i in range((week_start(today) - week_start(start)).days // 7 + 1)]
+    totals = merge_days(await weekly_aggregates(user_id, weeks), start, today)
+    return build_story(totals, days, period_label)
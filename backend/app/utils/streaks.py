@@ -0,0 +1,81 @@
+"""
+사용자별 연속 기록 (user_streaks)
+
+회고 / 마이크로 로그 / 헬스체크를 쓴 날을 "활동한 날"로 보고 사용자당 한 행
+(current_streak, longest_streak, last_active_date)을 유지한다.
+
+- 쓰기: ActiveDayEvent 구독자(app/subscribers.py)가 record_streak_activity RPC 로 O(1) 갱신
+  (같은 날은 그대로, 다음 날이면 +1, 하루 이상 비면 1 로 다시 시작)
+- 읽기: 마지막 활동일이 오늘이나 어제면 current_streak, 그보다 오래됐으면 0
+- 지난 날짜로 쓴 기록이나 삭제는 증분 갱신에 반영되지 않으므로
+  python -m app.batch.streak_jobs backfill 이 전체 기록으로 다시 계산한다
+"""
+import asyncio
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.database import get_supabase
+
+
+def compute_streak(days: Iterable[date], today: Optional[date] = None) -> Tuple[int, int, Optional[date]]:
+    """활동한 날짜들 -> (current_streak, longest_streak, last_active_date) 를 한 번의 순회로
+
+    current_streak 은 마지막 활동일에서 끝나는 연속 일수 (오늘 기준으로 끊겼는지는 current_streak() 가 판단)
+    """
+    today = today or date.today()
+    current = longest = 0
+    previous: Optional[date] = None
+    # 미래 날짜로 기록된 값은 연속 기록에 넣지 않는다
+    for day in sorted({day for day in days if day <= today}):
+        current = current + 1 if previous is not None and day == previous + timedelta(days=1) else 1
+        longest = max(longest, current)
+        previous = day
+    return current, longest, previous
+
+
+def current_streak(row: Optional[Dict[str, Any]], today: Optional[date] = None) -> int:
+    """user_streaks 행 -> 오늘 기준 연속 기록 (어제까지 이어졌으면 아직 유지)"""
+    if not row or not row.get("last_active_date"):
+        return 0
+    today = today or date.today()
+    last_active = date.fromisoformat(str(row["last_active_date"])[:10])
+    return row.get("current_streak") or 0 if last_active >= today - timedelta(days=1) else 0
+
+
+def streak_from_rows(rows: Optional[List[Dict[str, Any]]]) -> Dict[str, Any]:
+    """user_streaks 조회 결과 -> 응답용 {current, longest, last_active_date}"""
+    row = rows[0] if rows else None
+    return {
+        "current": current_streak(row),
+        "longest": (row or {}).get("longest_streak") or 0,
+        "last_active_date": (row or {}).get("last_active_date"),
+    }
+
+
+async def record_active_day(user_id: str, day: date, today: Optional[date] = None) -> None:
+    """활동한 날 반영 (RPC 한 번)
+
+    compute_streak 처럼 오늘 이후 날짜는 반영하지 않는다 (클라이언트가 고른 미래 날짜로
+    마지막 활동일이 앞당겨지면 그 뒤 실제 활동이 모두 "지난 날짜"로 묻힌다).
+    RPC 도 p_today 로 같은 검사를 한다.
+    """
+    today = today or date.today()
+    if day > today:
+        return
+    await asyncio.to_thread(
+        lambda: get_supabase().rpc(
+            "record_streak_activity",
+            {"p_user_id": user_id, "p_date": day.isoformat(), "p_today": today.isoformat()},
+        ).execute()
+    )
+
+
+async def get_streak(user_id: str) -> Dict[str, Any]:
+    """사용자의 연속 기록 (행 하나 조회)"""
+    supabase = get_supabase()
+    response = await asyncio.to_thread(
+        lambda: supabase.table("user_streaks")
+        .select("current_streak, longest_streak, last_active_date")
+        .eq("user_id", user_id).limit(1).execute()
+    )
+    return streak_from_rows(response.data)
@@ -0,0 +1,73 @@
+"""
+사용자별 읽지 않은 알림 수 (notification_unread_counts)
+
+배지 숫자를 notifications 전체에 대한 count="exact" 대신 사용자당 한 행 조회로 읽는다.
+
+- 알림 생성: +1 (adjust_unread)
+- 읽음 처리: 실제로 읽지 않음 -> 읽음으로 바뀐 행 수만큼 -1
+- 모두 읽음: mark_all_notifications_read RPC 가 UPDATE 와 카운터 차감을 한 트랜잭션으로 처리
+- 카운터 갱신은 알림 쓰기와 별도 호출이라 실패하면 값이 어긋날 수 있다.
+  실패는 로그만 남기고(쓰기는 이미 성공), app.batch.notification_jobs 의 주기 작업이 실제 개수로 맞춘다
+"""
+import asyncio
+import logging
+from typing import Dict
+
+from app.database import get_supabase
+from app.utils.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+unread_counter_errors_total = registry.counter(
+    "unread_counter_errors_total", "읽지 않은 알림 수 갱신 실패 수", ("operation",)
+)
+
+
+async def count_unread(user_id: str) -> int:
+    """읽지 않은 알림 개수 (카운터 행 하나 조회, 행이 없으면 0)"""
+    supabase = get_supabase()
+    response = await asyncio.to_thread(
+        lambda: supabase.table("notification_unread_counts").select("unread_count")
+        .eq("user_id", user_id).limit(1).execute()
+    )
+    return unread_from_rows(response.data)
+
+
+def unread_from_rows(rows) -> int:
+    """notification_unread_counts 조회 결과 -> 개수 (어긋나 음수가 된 값은 0 으로)"""
+    return max(rows[0].get("unread_count") or 0, 0) if rows else 0
+
+
+async def adjust_unread(deltas: Dict[str, int]) -> None:
+    """사용자별 증감분을 한 번의 RPC 로 반영 ({user_id: delta})"""
+    rows = [{"user_id": user_id, "delta": delta} for user_id, delta in deltas.items() if delta]
+    if not rows:
+        return
+    try:
+        await asyncio.to_thread(
+            lambda: get_supabase().rpc("adjust_unread_notification_counts", {"deltas": rows}).execute()
+        )
+    except Exception:
+        unread_counter_errors_total.inc(operation="adjust")
+        logger.exception(f"읽지 않은 알림 수 갱신 실패 (주기 작업에서 보정): {len(rows)}명")
+
+
+async def mark_all_read(user_id: str) -> int:
+    """사용자의 읽지 않은 알림을 모두 읽음 처리하고 읽음으로 바뀐 개수 반환"""
+    response = await asyncio.to_thread(
+        lambda: get_supabase().rpc("mark_all_notifications_read", {"p_user_id": user_id}).execute()
+    )
+    return response.data or 0
+
+
+async def reconcile_unread_counts(settle_seconds: int = 60) -> int:
+    """카운터를 notifications 의 실제 개수로 맞추고 고친 사용자 수 반환
+
+    최근 settle_seconds 안에 갱신된 카운터는 진행 중인 쓰기와 겹칠 수 있어 다음 주기로 미룬다.
+    """
+    response = await asyncio.to_thread(
+        lambda: get_supabase().rpc(
+            "reconcile_unread_notification_counts", {"p_settle_seconds": settle_seconds}
+        ).execute()
+    )
+    return response.data or 0
@@ -0,0 +1,203 @@
+"""
+스트리밍 업로드 처리
+
+- 청크 단위로 읽으면서 크기 제한 초과 시 즉시 중단 (수신 자체는 UploadSizeLimitMiddleware 가 제한)
+- SHA-256 증분 해싱
+- 첫 바이트(매직 넘버)로 실제 파일 형식 판별
+"""
+import hashlib
+import json
+import mimetypes
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional
+
+from fastapi import HTTPException, UploadFile
+
+from app.config import settings
+from app.utils.storage import StorageBackend
+
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+# (매직 넘버, 오프셋, MIME)
+_SIGNATURES = [
+    (b"%PDF-", 0, "application/pdf"),
+    (b"\x89PNG\r\n\x1a\n", 0, "image/png"),
+    (b"\xff\xd8\xff", 0, "image/jpeg"),
+    (b"GIF87a", 0, "image/gif"),
+    (b"GIF89a", 0, "image/gif"),
+    (b"WEBP", 8, "image/webp"),
+    (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1", 0, "application/msword"),
+    (b"PK\x03\x04", 0, "application/zip"),
+]
+
+SNIFF_BYTES = 16
+
+
+def sniff_content_type(head: bytes, declared: Optional[str] = None) -> Optional[str]:
+    """첫 바이트로 MIME 판별 (docx 는 zip 컨테이너이므로 선언값으로 보완)"""
+    for magic, offset, mime in _SIGNATURES:
+        if head[offset:offset + len(magic)] == magic:
+            if mime == "image/webp" and head[:4] != b"RIFF":
+                continue
+            if mime == "application/zip" and declared == DOCX_MIME:
+                return DOCX_MIME
+            return mime
+    return None
+
+
+@dataclass
+class StoredUpload:
+    """저장 완료된 업로드 정보"""
+    key: str
+    url: str
+    size: int
+    sha256: str
+    mime_type: str
+    deduplicated: bool = False
+
+
+def _too_large() -> HTTPException:
+    limit_mb = settings.upload_max_bytes // (1024 * 1024)
+    return HTTPException(status_code=400, detail=f"파일 크기는 {limit_mb}MB를 초과할 수 없습니다")
+
+
+async def stream_upload(
+    file: UploadFile,
+    storage: StorageBackend,
+    key_for: Callable[[str, str], str],
+    allowed_types: Optional[Iterable[str]] = None,
+    skip_if_exists: bool = False,
+) -> StoredUpload:
+    """UploadFile 을 청크 단위로 저장소에 기록
+
+    key_for 는 완성된 SHA-256 과 판별된 MIME 을 받아 최종 저장 키를 돌려준다.
+    skip_if_exists 면 (콘텐츠 주소 키처럼) 같은 키가 이미 있을 때 다시 쓰지 않는다.
+    """
+    max_bytes = settings.upload_max_bytes
+    chunk_size = settings.upload_chunk_size
+    hasher = hashlib.sha256()
+    size = 0
+
+    head = await file.read(max(chunk_size, SNIFF_BYTES))
+    mime_type = sniff_content_type(head, file.content_type)
+    if allowed_types is not None:
+        allowed = list(allowed_types)
+        if mime_type not in allowed:
+            raise HTTPException(status_code=400, detail=f"허용되지 않는 파일 형식입니다. 허용: {', '.join(allowed)}")
+    mime_type = mime_type or file.content_type or "application/octet-stream"
+
+    writer = storage.open_writer()
+    try:
+        chunk = head
+        while chunk:
+            size += len(chunk)
+            if size > max_bytes:
+                raise _too_large()
+            hasher.update(chunk)
+            await writer.write(chunk)
+            chunk = await file.read(chunk_size)
+
+        digest = hasher.hexdigest()
+        key = key_for(digest, mime_type)
+        if skip_if_exists and await storage.exists(key):
+            await writer.abort()
+            return StoredUpload(
+                key=key, url=storage.url_for(key), size=size,
+                sha256=digest, mime_type=mime_type, deduplicated=True
+            )
+        url = await writer.commit(key, mime_type)
+    except BaseException:
+        await writer.abort()
+        raise
+
+    return StoredUpload(key=key, url=url, size=size, sha256=digest, mime_type=mime_type)
+
+
+def content_key(prefix: str, digest: str, mime_type: Optional[str] = None) -> str:
+    """콘텐츠 주소 저장 키 (sha256 앞 2자리로 디렉터리 분산, 확장자는 MIME 기준)"""
+    extension = (mimetypes.guess_extension(mime_type) or "") if mime_type else ""
+    return f"{prefix}/sha256/{digest[:2]}/{digest}{extension}"
+
+
+class _BodyTooLarge(Exception):
+    """수신 중인 요청 본문이 제한을 넘음"""
+
+
+class UploadSizeLimitMiddleware:
+    """업로드 요청 본문 크기 제한 (413)
+
+    - Content-Length 가 제한을 넘으면 본문을 읽기 전에 거절
+    - Content-Length 가 없거나(chunked) 실제 본문이 더 길면 받은 바이트를 세다가 제한을 넘는 즉시
+      수신을 멈추고 거절 (multipart 파서가 파일 전체를 받아 스풀하기 전에)
+    """
+
+    # multipart 경계/폼 필드 여유분
+    OVERHEAD_BYTES = 64 * 1024
+
+    def __init__(self, app, path_prefixes: Iterable[str]):
+        self.app = app
+        self.path_prefixes = tuple(path_prefixes)
+
+    async def __call__(self, scope, receive, send):
+        if not (scope["type"] == "http" and scope["method"] == "POST" and scope["path"].startswith(self.path_prefixes)):
+            await self.app(scope, receive, send)
+            return
+
+        limit = settings.upload_max_bytes + self.OVERHEAD_BYTES
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                try:
+                    if int(value) > limit:
+                        await self._reject(send)
+                        return
+                except ValueError:
+                    pass
+                break
+
+        received = 0
+        exceeded = False
+        response_started = False
+
+        async def limited_receive():
+            nonlocal received, exceeded
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    exceeded = True
+                    raise _BodyTooLarge()
+            return message
+
+        async def guarded_send(message):
+            nonlocal response_started
+            # 제한을 넘은 뒤 앱이 만든 오류 응답(본문 파싱 실패 400 등)은 413 으로 대체
+            if exceeded and not response_started:
+                return
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except _BodyTooLarge:
+            pass
+        if exceeded and not response_started:
+            await self._reject(send)
+
+    @staticmethod
+    async def _reject(send) -> None:
+        limit_mb = settings.upload_max_bytes // (1024 * 1024)
+        body = json.dumps(
+            {"detail": f"파일 크기는 {limit_mb}MB를 초과할 수 없습니다"},
+            ensure_ascii=False,
+        ).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"connection", b"close"),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
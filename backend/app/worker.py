@@ -0,0 +1,40 @@
+"""
+gunicorn 용 uvicorn 워커 (gunicorn.conf.py 의 worker_class)
+
+기본 UvicornWorker 는 loop/http 를 auto 로 고르므로 uvloop / httptools 가 빠져 있으면
+조용히 asyncio / h11 로 떨어진다. 프로덕션에서는 명시해서 설치 누락을 기동 시점에 드러낸다.
+
+uvicorn 은 열린 응답이 모두 끝나야 graceful shutdown 을 마치므로, 종료가 시작되면
+먼저 알림 스트림(SSE)을 닫아 클라이언트가 다른 워커로 재연결하게 한다.
+"""
+import sys
+
+from gunicorn.arbiter import Arbiter
+from uvicorn.server import Server
+from uvicorn.workers import UvicornWorker as _BaseUvicornWorker
+
+
+class _Server(Server):
+    async def shutdown(self, sockets=None) -> None:
+        from app.utils.notification_stream import notification_hub
+
+        notification_hub.close()
+        await super().shutdown(sockets=sockets)
+
+
+class UvicornWorker(_BaseUvicornWorker):
+    CONFIG_KWARGS = {
+        "loop": "uvloop",
+        "http": "httptools",
+        # Render / nginx 뒤에서 X-Forwarded-* 로 실제 클라이언트 주소 사용
+        "proxy_headers": True,
+        "forwarded_allow_ips": "*",
+    }
+
+    async def _serve(self) -> None:
+        self.config.app = self.wsgi
+        server = _Server(config=self.config)
+        self._install_sigquit_handler()
+        await server.serve(sockets=self.sockets)
+        if not server.started:
+            sys.exit(Arbiter.WORKER_BOOT_ERROR)
@@ -0,0 +1,63 @@
+"""
+ProoF Backend API 프로덕션 서버 설정 (gunicorn + uvicorn 워커)
+
+실행:
+    gunicorn -c gunicorn.conf.py app.main:app
+
+환경변수로 조정:
+    WEB_CONCURRENCY         워커 수 (기본: CPU 코어 수, 최소 2)
+    PORT / HOST             바인드 주소 (기본: settings.port / settings.host)
+    GUNICORN_TIMEOUT        응답 없는 워커를 재시작할 때까지 시간(초)
+    GUNICORN_MAX_REQUESTS   워커 재활용 주기 (요청 수, 0 이면 재활용 안 함)
+
+워커 하나가 이벤트 루프 하나다. 요청 처리는 대부분 Supabase 왕복을 기다리는 I/O 이고
+CPU 작업(문서 처리)은 별도 프로세스 풀로 보내므로 코어당 워커 1개를 기본으로 한다.
+문서 처리 풀은 워커마다 하나씩 생기므로 워커 수를 WEB_CONCURRENCY 로 넘겨
+풀 크기를 코어 수 / 워커 수로 나눈다 (DOCUMENT_WORKERS 를 주면 그 값).
+"""
+import multiprocessing
+import os
+
+from app.config import settings
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+bind = f"{os.getenv('HOST', settings.host)}:{os.getenv('PORT', settings.port)}"
+
+# 워커 모델: uvloop + httptools 를 쓰는 uvicorn 워커 (app/worker.py)
+worker_class = "app.worker.UvicornWorker"
+workers = _env_int("WEB_CONCURRENCY", max(2, multiprocessing.cpu_count()))
+# 워커 안의 DocumentPipeline.pool_size() 가 읽는다 (워커는 마스터의 환경변수를 물려받음)
+os.environ["WEB_CONCURRENCY"] = str(workers)
+
+# 마스터에서 앱을 한 번 import 한 뒤 fork (모듈 / 설정 / 정적 데이터를 copy-on-write 로 공유)
+# 루프·소켓·DB 커넥션은 fork 뒤 워커 안에서 만들어야 한다 (post_fork 참고)
+preload_app = True
+
+# 앞단 프록시(Render, nginx)의 keep-alive(보통 60초 이상)보다 길게 잡아 끊긴 커넥션 재사용으로 인한 502 방지
+keepalive = _env_int("GUNICORN_KEEPALIVE", 75)
+# 응답 없는 워커 재시작 / 종료 신호 후 처리 중 요청을 마무리할 시간
+timeout = _env_int("GUNICORN_TIMEOUT", 60)
+graceful_timeout = _env_int("GUNICORN_GRACEFUL_TIMEOUT", 30)
+
+# 메모리 조각화·누수 대비 워커 재활용 (jitter 로 모든 워커가 동시에 재시작되지 않게)
+max_requests = _env_int("GUNICORN_MAX_REQUESTS", 10000)
+max_requests_jitter = _env_int("GUNICORN_MAX_REQUESTS_JITTER", 1000)
+
+# 워커 하트비트 파일을 tmpfs 에 (컨테이너 디스크 I/O 로 인한 오탐 재시작 방지)
+worker_tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+accesslog = "-" if os.getenv("GUNICORN_ACCESS_LOG") else None
+errorlog = "-"
+loglevel = os.getenv("GUNICORN_LOG_LEVEL", "info")
+
+
+def post_fork(server, worker):
+    """마스터에서 열린 공유 캐시 커넥션(SQLite)을 워커마다 새로 연다"""
+    from app.cache import cache
+
+    cache.reopen_shared()
@@ -0,0 +1,14 @@
+-- Migration: 활동 조회수 / 북마크 수 일괄 반영
+-- Description: 워커가 모아 둔 활동별 증감분을 한 번의 UPDATE 로 반영 (app/utils/counter_buffer.py)
+-- deltas 예: [{"activity_id": "...", "view_delta": 12, "bookmark_delta": -1}, ...]
+
+CREATE OR REPLACE FUNCTION apply_activity_counter_deltas(deltas JSONB)
+RETURNS void AS $$
+    UPDATE activities AS a
+    SET view_count = COALESCE(a.view_count, 0) + d.view_delta,
+        bookmark_count = GREATEST(COALESCE(a.bookmark_count, 0) + d.bookmark_delta, 0)
+    FROM jsonb_to_recordset(deltas) AS d(activity_id TEXT, view_delta INTEGER, bookmark_delta INTEGER)
+    WHERE a.id = d.activity_id;
+$$ LANGUAGE sql;
+
+COMMENT ON FUNCTION apply_activity_counter_deltas(JSONB) IS '활동별 조회수/북마크 수 증감분 일괄 반영 (write-behind 카운터)';
@@ -0,0 +1,25 @@
+-- Migration: AI 분석 결과 캐시
+-- Description: reflection_ai_analysis 테이블을 입력 해시 기반 캐시로 사용
+
+-- 1. 캐시 키 / 결과 컬럼 추가
+ALTER TABLE reflection_ai_analysis ADD COLUMN IF NOT EXISTS cache_key TEXT;
+ALTER TABLE reflection_ai_analysis ADD COLUMN IF NOT EXISTS analysis_type VARCHAR(50);
+ALTER TABLE reflection_ai_analysis ADD COLUMN IF NOT EXISTS model VARCHAR(100);
+ALTER TABLE reflection_ai_analysis ADD COLUMN IF NOT EXISTS result JSONB;
+
+-- 2. 캐시 행은 대시보드용 분석 컬럼을 채우지 않으므로 NOT NULL 해제
+ALTER TABLE reflection_ai_analysis ALTER COLUMN summary DROP NOT NULL;
+ALTER TABLE reflection_ai_analysis ALTER COLUMN metrics DROP NOT NULL;
+ALTER TABLE reflection_ai_analysis ALTER COLUMN strengths DROP NOT NULL;
+ALTER TABLE reflection_ai_analysis ALTER COLUMN improvements DROP NOT NULL;
+ALTER TABLE reflection_ai_analysis ALTER COLUMN next_steps DROP NOT NULL;
+ALTER TABLE reflection_ai_analysis ALTER COLUMN charts DROP NOT NULL;
+
+-- 3. 인덱스
+CREATE UNIQUE INDEX IF NOT EXISTS idx_ai_analysis_cache_key ON reflection_ai_analysis(cache_key);
+CREATE INDEX IF NOT EXISTS idx_ai_analysis_expires ON reflection_ai_analysis(expires_at);
+
+-- 4. 코멘트
+COMMENT ON COLUMN reflection_ai_analysis.cache_key IS '정규화된 입력(답변/로그/모델)의 SHA-256 해시';
+COMMENT ON COLUMN reflection_ai_analysis.analysis_type IS '분석 유형: reflection_feedback, project_analysis';
+COMMENT ON COLUMN reflection_ai_analysis.result IS '모델 응답 원본 (캐시 값)';
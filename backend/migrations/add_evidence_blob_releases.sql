@@ -0,0 +1,13 @@
+-- Migration: 증빙 파일 삭제 진행 기록
+-- Description: 참조가 없어진 저장 파일을 지우는 동안 같은 파일의 중복 업로드가 끼어들면
+--              업로드 쪽이 삭제가 끝나길 기다렸다가 파일을 다시 저장할 수 있도록 진행 중인 삭제를 기록
+
+-- 1. 테이블
+CREATE TABLE IF NOT EXISTS evidence_blob_releases (
+  content_hash CHAR(64) PRIMARY KEY,
+  started_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- 2. 코멘트
+COMMENT ON TABLE evidence_blob_releases IS '진행 중인 증빙 파일 삭제 (release_blob 이 참조를 세기 전에 기록하고 끝나면 지움)';
+COMMENT ON COLUMN evidence_blob_releases.started_at IS '삭제 시작 시각 (오래된 기록은 중단된 삭제로 보고 무시)';
@@ -0,0 +1,22 @@
+-- Migration: 증빙 파일 콘텐츠 주소 저장 / 중복 제거
+-- Description: evidence 테이블에 콘텐츠 해시와 저장 키, 썸네일 URL 추가
+
+-- 1. 컬럼 추가
+ALTER TABLE evidence ADD COLUMN IF NOT EXISTS content_hash CHAR(64);
+ALTER TABLE evidence ADD COLUMN IF NOT EXISTS storage_key TEXT;
+ALTER TABLE evidence ADD COLUMN IF NOT EXISTS thumbnail_url TEXT;
+
+-- 2. 인덱스 (참조 카운트 / 파생 결과 재사용 조회)
+CREATE INDEX IF NOT EXISTS idx_evidence_content_hash ON evidence(content_hash);
+
+-- 3. 코멘트
+COMMENT ON COLUMN evidence.content_hash IS '파일 내용 SHA-256 (같은 값의 행 수가 저장 파일의 참조 카운트)';
+COMMENT ON COLUMN evidence.storage_key IS '저장소 키 (evidence/sha256/ab/<hash>.<ext>)';
+COMMENT ON COLUMN evidence.thumbnail_url IS '미리보기 썸네일 URL';
+
+-- 4. 문서 처리 결과 (텍스트 추출 / 썸네일은 업로드 후 비동기 처리)
+ALTER TABLE evidence ADD COLUMN IF NOT EXISTS verified_keywords JSONB DEFAULT '[]'::jsonb;
+ALTER TABLE evidence ADD COLUMN IF NOT EXISTS processing_status VARCHAR(20) DEFAULT 'done'
+  CHECK (processing_status IN ('pending', 'done', 'failed'));
+COMMENT ON COLUMN evidence.verified_keywords IS '추출된 텍스트에서 찾은 키워드 마스터 이름';
+COMMENT ON COLUMN evidence.processing_status IS '문서 처리 상태: pending, done, failed';
@@ -0,0 +1,71 @@
+-- Migration: 알림 다이제스트 대기열
+-- Description: 다이제스트 타입(NOTIFICATION_DIGEST_TYPES) 알림을 notification_frequency 가 daily / weekly / monthly 인
+-- 사용자에게는 notifications 에 바로 넣지 않고 대기열에 모았다가, 주기 작업이 사용자당 한 건으로 넣는다
+-- (app/utils/notification_digest.py, python -m app.batch.notification_jobs send_digests <주기>)
+-- 선행: add_notification_retention.sql (이미 넣은 알림을 합치던 collapse_notification_digests 를 대신한다)
+
+CREATE TABLE IF NOT EXISTS notification_digest_queue (
+  id BIGSERIAL PRIMARY KEY,
+  user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+  type VARCHAR(50) NOT NULL,
+  title TEXT,
+  content TEXT,
+  link TEXT,
+  created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_notification_digest_queue_user ON notification_digest_queue(user_id, created_at);
+
+DROP FUNCTION IF EXISTS collapse_notification_digests(TEXT, TEXT[], TIMESTAMP WITH TIME ZONE, INTEGER, INTEGER);
+
+-- notification_frequency = p_frequency 인 사용자의 대기열을 비우고 알림으로 넣는다
+-- 모인 알림이 p_min_count 개 이상이면 다이제스트 한 건, 그보다 적으면 원래 알림 그대로.
+-- 주기를 즉시 받기로 바꾼 사용자의 남은 대기열은 daily 실행 때 함께 비운다.
+-- 한 번에 p_limit 명까지 처리하고 넣은 알림마다 (사용자, 모인 수, 알림 행) 을 반환한다.
+-- 설정 행이 없는 사용자는 API 기본값(weekly)을 따른다
+CREATE OR REPLACE FUNCTION flush_notification_digests(
+  p_frequency TEXT,
+  p_before TIMESTAMP WITH TIME ZONE,
+  p_min_count INTEGER DEFAULT 2,
+  p_limit INTEGER DEFAULT 500
+)
+RETURNS TABLE(user_id UUID, collapsed INTEGER, notification JSONB) AS $$
+  WITH targets AS (
+    SELECT q.user_id,
+           array_agg(q.id) AS ids,
+           (array_agg(q.title ORDER BY q.created_at DESC))[1:5] AS titles,
+           COUNT(*)::INTEGER AS cnt
+    FROM notification_digest_queue q
+    LEFT JOIN user_preferences p ON p.user_id = q.user_id::TEXT
+    WHERE q.created_at < p_before
+      AND (
+        COALESCE(p.notification_frequency, 'weekly') = p_frequency
+        OR (p_frequency = 'daily' AND COALESCE(p.notification_frequency, 'weekly') NOT IN ('daily', 'weekly', 'monthly'))
+      )
+    GROUP BY q.user_id
+    LIMIT p_limit
+  ),
+  deleted AS (
+    DELETE FROM notification_digest_queue q USING targets t
+    WHERE q.user_id = t.user_id AND q.id = ANY(t.ids)
+    RETURNING 1
+  ),
+  inserted AS (
+    INSERT INTO notifications (user_id, type, title, content, link)
+    SELECT t.user_id, 'digest', format('새 알림 %s건', t.cnt), array_to_string(t.titles, E'\n'), '/notifications'
+    FROM targets t
+    WHERE t.cnt >= p_min_count
+    UNION ALL
+    SELECT q.user_id, q.type, q.title, q.content, q.link
+    FROM notification_digest_queue q
+    JOIN targets t ON t.user_id = q.user_id AND q.id = ANY(t.ids)
+    WHERE t.cnt < p_min_count
+    RETURNING *
+  )
+  SELECT t.user_id, t.cnt, to_jsonb(i)
+  FROM targets t
+  JOIN inserted i ON i.user_id = t.user_id;
+$$ LANGUAGE sql;
+
+COMMENT ON TABLE notification_digest_queue IS '다이제스트로 보낼 때까지 모아 두는 알림';
+COMMENT ON FUNCTION flush_notification_digests(TEXT, TIMESTAMP WITH TIME ZONE, INTEGER, INTEGER) IS '주기별 다이제스트 대기열을 사용자당 알림 한 건으로';
@@ -0,0 +1,105 @@
+-- Migration: 알림 보관 기간 / 다이제스트
+-- Description: 오래된 읽은 알림을 notifications_archive 로 옮기고, 읽지 않은 알림을 사용자 설정
+-- (user_preferences.notification_frequency) 주기마다 다이제스트 한 건으로 합친다 (app/batch/notification_jobs.py)
+-- 선행: add_notification_unread_counts.sql
+
+CREATE TABLE IF NOT EXISTS notifications_archive (
+  LIKE notifications INCLUDING DEFAULTS,
+  archived_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+  archive_reason VARCHAR(20) NOT NULL DEFAULT 'retention'
+);
+
+CREATE INDEX IF NOT EXISTS idx_notifications_archive_user ON notifications_archive(user_id, created_at DESC);
+
+-- 보관 기간이 지난 읽은 알림을 p_limit 개씩 옮긴다 (옮긴 수 반환, p_limit 보다 작으면 끝)
+-- SKIP LOCKED: 읽음 처리 등 진행 중인 쓰기와 잠금 경쟁하지 않고 다음 청크로 넘긴다
+CREATE OR REPLACE FUNCTION archive_read_notifications(
+  p_before TIMESTAMP WITH TIME ZONE,
+  p_limit INTEGER DEFAULT 1000,
+  p_archive BOOLEAN DEFAULT TRUE
+)
+RETURNS INTEGER AS $$
+DECLARE
+  moved INTEGER;
+BEGIN
+  WITH doomed AS (
+    SELECT id FROM notifications
+    WHERE read_at IS NOT NULL AND read_at < p_before
+    ORDER BY read_at
+    LIMIT p_limit
+    FOR UPDATE SKIP LOCKED
+  ),
+  deleted AS (
+    DELETE FROM notifications n USING doomed d
+    WHERE n.id = d.id
+    RETURNING n.*
+  ),
+  archived AS (
+    INSERT INTO notifications_archive
+    SELECT deleted.*, NOW(), 'retention' FROM deleted WHERE p_archive
+    RETURNING 1
+  )
+  SELECT COUNT(*) INTO moved FROM deleted;
+  RETURN moved;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 다이제스트: notification_frequency = p_frequency 인 사용자의 읽지 않은 p_types 알림이 p_min_count 개 이상이면
+-- 다이제스트 알림 한 건으로 합치고 원본은 보관함으로 옮긴다. 한 번에 p_limit 명까지 처리하고
+-- 사용자별 (합친 수, 다이제스트 알림 행) 을 반환한다. 설정 행이 없는 사용자는 API 기본값(weekly, 알림 켬)을 따른다
+CREATE OR REPLACE FUNCTION collapse_notification_digests(
+  p_frequency TEXT,
+  p_types TEXT[],
+  p_before TIMESTAMP WITH TIME ZONE,
+  p_min_count INTEGER DEFAULT 2,
+  p_limit INTEGER DEFAULT 500
+)
+RETURNS TABLE(user_id UUID, collapsed INTEGER, notification JSONB) AS $$
+  WITH targets AS (
+    SELECT n.user_id,
+           array_agg(n.id) AS ids,
+           (array_agg(n.title ORDER BY n.created_at DESC))[1:5] AS titles,
+           COUNT(*)::INTEGER AS cnt
+    FROM notifications n
+    LEFT JOIN user_preferences p ON p.user_id = n.user_id::TEXT
+    WHERE n.read_at IS NULL
+      AND n.type = ANY(p_types)
+      AND n.created_at < p_before
+      AND COALESCE(p.notification_frequency, 'weekly') = p_frequency
+      AND COALESCE(p.notification_enabled, TRUE)
+    GROUP BY n.user_id
+    HAVING COUNT(*) >= p_min_count
+    LIMIT p_limit
+  ),
+  deleted AS (
+    DELETE FROM notifications n USING targets t
+    WHERE n.user_id = t.user_id AND n.id = ANY(t.ids)
+    RETURNING n.*
+  ),
+  archived AS (
+    INSERT INTO notifications_archive
+    SELECT deleted.*, NOW(), 'digest' FROM deleted
+    RETURNING 1
+  ),
+  inserted AS (
+    INSERT INTO notifications (user_id, type, title, content, link)
+    SELECT t.user_id, 'digest', format('읽지 않은 알림 %s건', t.cnt), array_to_string(t.titles, E'\n'), '/notifications'
+    FROM targets t
+    RETURNING *
+  ),
+  -- N 건을 1 건으로 합쳤으므로 읽지 않은 수는 N - 1 만큼 줄어든다
+  adjusted AS (
+    UPDATE notification_unread_counts c
+    SET unread_count = GREATEST(c.unread_count - t.cnt + 1, 0), updated_at = NOW()
+    FROM targets t
+    WHERE c.user_id = t.user_id
+    RETURNING 1
+  )
+  SELECT t.user_id, t.cnt, to_jsonb(i)
+  FROM targets t
+  JOIN inserted i ON i.user_id = t.user_id;
+$$ LANGUAGE sql;
+
+COMMENT ON TABLE notifications_archive IS '보관 기간이 지났거나 다이제스트로 합쳐진 알림';
+COMMENT ON FUNCTION archive_read_notifications(TIMESTAMP WITH TIME ZONE, INTEGER, BOOLEAN) IS '오래된 읽은 알림 청크 단위 보관/삭제';
+COMMENT ON FUNCTION collapse_notification_digests(TEXT, TEXT[], TIMESTAMP WITH TIME ZONE, INTEGER, INTEGER) IS '읽지 않은 알림을 사용자 주기별 다이제스트로 합침';
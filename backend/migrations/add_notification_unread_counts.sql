@@ -0,0 +1,83 @@
+-- Migration: 사용자별 읽지 않은 알림 수 카운터
+-- Description: 배지 숫자를 notifications 전체 count 대신 사용자당 한 행으로 조회 (app/utils/unread_counter.py)
+-- 카운터는 알림 생성 / 읽음 처리 때 앱이 증감하고, reconcile_unread_notification_counts 를
+-- 주기적으로 실행해(python -m app.batch.notification_jobs reconcile_unread_counts) 실제 개수로 맞춘다.
+
+CREATE TABLE IF NOT EXISTS notification_unread_counts (
+  user_id UUID PRIMARY KEY REFERENCES users(id) ON DELETE CASCADE,
+  unread_count INTEGER NOT NULL DEFAULT 0,
+  updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+-- 읽지 않은 알림만 담는 부분 인덱스 (보정 작업의 집계용)
+CREATE INDEX IF NOT EXISTS idx_notifications_unread ON notifications(user_id) WHERE read_at IS NULL;
+
+-- 기존 데이터로 초기값 채우기
+INSERT INTO notification_unread_counts (user_id, unread_count)
+SELECT user_id, COUNT(*)
+FROM notifications
+WHERE read_at IS NULL
+GROUP BY user_id
+ON CONFLICT (user_id) DO UPDATE SET unread_count = EXCLUDED.unread_count, updated_at = NOW();
+
+-- deltas 예: [{"user_id": "...", "delta": 1}, {"user_id": "...", "delta": -3}]
+-- 같은 사용자의 증감분은 합쳐서 반영한다. 어긋나 음수가 된 값은 앱이 0 으로 읽고 보정 작업이 고친다
+CREATE OR REPLACE FUNCTION adjust_unread_notification_counts(deltas JSONB)
+RETURNS void AS $$
+    INSERT INTO notification_unread_counts AS c (user_id, unread_count, updated_at)
+    SELECT d.user_id, SUM(d.delta), NOW()
+    FROM jsonb_to_recordset(deltas) AS d(user_id UUID, delta INTEGER)
+    GROUP BY d.user_id
+    ON CONFLICT (user_id) DO UPDATE
+    SET unread_count = GREATEST(c.unread_count + EXCLUDED.unread_count, 0),
+        updated_at = NOW();
+$$ LANGUAGE sql;
+
+-- 모두 읽음: 읽음으로 바뀐 수만큼 같은 트랜잭션에서 차감 (동시에 생성된 알림의 +1 은 보존)
+CREATE OR REPLACE FUNCTION mark_all_notifications_read(p_user_id UUID)
+RETURNS INTEGER AS $$
+DECLARE
+  updated INTEGER;
+BEGIN
+  UPDATE notifications SET read_at = NOW()
+  WHERE user_id = p_user_id AND read_at IS NULL;
+  GET DIAGNOSTICS updated = ROW_COUNT;
+
+  UPDATE notification_unread_counts
+  SET unread_count = GREATEST(unread_count - updated, 0), updated_at = NOW()
+  WHERE user_id = p_user_id;
+
+  RETURN updated;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 보정: 실제 개수와 다른 카운터만 고치고 고친 수 반환
+-- p_settle_seconds 안에 갱신된 카운터는 진행 중인 쓰기와 겹칠 수 있어 다음 주기로 미룬다
+CREATE OR REPLACE FUNCTION reconcile_unread_notification_counts(p_settle_seconds INTEGER DEFAULT 60)
+RETURNS INTEGER AS $$
+  WITH actual AS (
+    SELECT user_id, COUNT(*)::INTEGER AS unread_count
+    FROM notifications
+    WHERE read_at IS NULL
+    GROUP BY user_id
+  ),
+  drifted AS (
+    SELECT COALESCE(a.user_id, c.user_id) AS user_id, COALESCE(a.unread_count, 0) AS unread_count
+    FROM actual a
+    FULL OUTER JOIN notification_unread_counts c ON c.user_id = a.user_id
+    WHERE (c.user_id IS NULL OR c.unread_count IS DISTINCT FROM COALESCE(a.unread_count, 0))
+      AND (c.updated_at IS NULL OR c.updated_at < NOW() - make_interval(secs => p_settle_seconds))
+  ),
+  fixed AS (
+    INSERT INTO notification_unread_counts AS c (user_id, unread_count, updated_at)
+    SELECT user_id, unread_count, NOW() FROM drifted
+    ON CONFLICT (user_id) DO UPDATE SET unread_count = EXCLUDED.unread_count, updated_at = NOW()
+    RETURNING 1
+  )
+  SELECT COUNT(*)::INTEGER FROM fixed;
+$$ LANGUAGE sql;
+
+COMMENT ON TABLE notification_unread_counts IS '사용자별 읽지 않은 알림 수 (주기 보정)';
+COMMENT ON FUNCTION adjust_unread_notification_counts(JSONB) IS '읽지 않은 알림 수 증감분 일괄 반영';
+COMMENT ON FUNCTION mark_all_notifications_read(UUID) IS '사용자의 알림 모두 읽음 + 카운터 차감';
+COMMENT ON FUNCTION reconcile_unread_notification_counts(INTEGER) IS '읽지 않은 알림 수를 실제 개수로 보정';
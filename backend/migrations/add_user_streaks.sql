@@ -0,0 +1,69 @@
+-- Migration: 사용자별 연속 기록
+-- Description: 회고 / 마이크로 로그 / 헬스체크를 쓴 날 기준 연속 기록을 사용자당 한 행으로 유지 (app/utils/streaks.py)
+-- 기존 기록으로 채우기: python -m app.batch.streak_jobs backfill
+
+CREATE TABLE IF NOT EXISTS user_streaks (
+  user_id UUID PRIMARY KEY REFERENCES users(id) ON DELETE CASCADE,
+  current_streak INTEGER NOT NULL DEFAULT 0,
+  longest_streak INTEGER NOT NULL DEFAULT 0,
+  last_active_date DATE NOT NULL,
+  updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+-- 활동한 날 하나 반영 (O(1))
+-- 마지막 활동일 다음 날이면 +1, 이틀 이상 지났으면 1 로 다시 시작, 같은 날이나 지난 날짜면 그대로
+-- (지난 날짜로 빈 날을 메운 경우는 백필 작업이 다시 계산한다)
+-- p_today 보다 뒤의 날짜는 반영하지 않는다 (백필의 compute_streak 과 같은 규칙,
+-- 미래 날짜 하나가 마지막 활동일을 앞당겨 이후 기록을 모두 묻어 버리지 않도록)
+DROP FUNCTION IF EXISTS record_streak_activity(UUID, DATE);
+CREATE OR REPLACE FUNCTION record_streak_activity(p_user_id UUID, p_date DATE, p_today DATE DEFAULT CURRENT_DATE)
+RETURNS void AS $$
+  INSERT INTO user_streaks AS s (user_id, current_streak, longest_streak, last_active_date, updated_at)
+  SELECT p_user_id, 1, 1, p_date, NOW()
+  WHERE p_date <= p_today
+  ON CONFLICT (user_id) DO UPDATE SET
+    current_streak = CASE
+      WHEN p_date = s.last_active_date + 1 THEN s.current_streak + 1
+      WHEN p_date > s.last_active_date + 1 THEN 1
+      ELSE s.current_streak
+    END,
+    longest_streak = GREATEST(s.longest_streak, CASE
+      WHEN p_date = s.last_active_date + 1 THEN s.current_streak + 1
+      WHEN p_date > s.last_active_date + 1 THEN 1
+      ELSE s.current_streak
+    END),
+    last_active_date = GREATEST(s.last_active_date, p_date),
+    updated_at = NOW();
+$$ LANGUAGE sql;
+
+-- 백필 결과 한 사용자 저장 (streak_jobs backfill)
+-- p_read_at 은 백필이 그 사용자의 기록을 읽기 시작한 시각이다. 그 뒤에 record_streak_activity 가
+-- 행을 갱신했으면 백필 결과가 마지막 활동일을 되돌리지 않을 때만 덮어쓴다.
+-- p_last_active 가 NULL 이면 기록이 없는 사용자이므로 읽은 뒤 갱신되지 않은 행만 지운다.
+CREATE OR REPLACE FUNCTION apply_streak_backfill(
+  p_user_id UUID,
+  p_current INTEGER,
+  p_longest INTEGER,
+  p_last_active DATE,
+  p_read_at TIMESTAMP WITH TIME ZONE
+)
+RETURNS void AS $$
+BEGIN
+  IF p_last_active IS NULL THEN
+    DELETE FROM user_streaks WHERE user_id = p_user_id AND updated_at < p_read_at;
+    RETURN;
+  END IF;
+  INSERT INTO user_streaks AS s (user_id, current_streak, longest_streak, last_active_date, updated_at)
+  VALUES (p_user_id, p_current, p_longest, p_last_active, NOW())
+  ON CONFLICT (user_id) DO UPDATE SET
+    current_streak = EXCLUDED.current_streak,
+    longest_streak = EXCLUDED.longest_streak,
+    last_active_date = EXCLUDED.last_active_date,
+    updated_at = NOW()
+  WHERE s.updated_at < p_read_at OR s.last_active_date <= EXCLUDED.last_active_date;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON TABLE user_streaks IS '사용자별 연속 기록 (현재 / 최장 / 마지막 활동일)';
+COMMENT ON FUNCTION record_streak_activity(UUID, DATE, DATE) IS '활동한 날 하나를 연속 기록에 반영';
+COMMENT ON FUNCTION apply_streak_backfill(UUID, INTEGER, INTEGER, DATE, TIMESTAMP WITH TIME ZONE) IS '백필로 다시 계산한 연속 기록을 그 사이 실시간 갱신을 되돌리지 않고 저장';
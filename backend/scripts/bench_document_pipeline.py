@@ -0,0 +1,130 @@
+"""
+증빙 문서 처리 벤치마크 (직렬 vs 프로세스 풀)
+
+실행:
+    python scripts/bench_document_pipeline.py --docs 40 --pages 5
+    python scripts/bench_document_pipeline.py --corpus ./fixtures --workers 4
+
+--corpus 를 주지 않으면 임시 디렉터리에 텍스트 레이어가 있는 PDF 와 PNG 를 생성한다.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.utils.documents import process_document  # noqa: E402
+
+MIME_BY_SUFFIX = {
+    ".pdf": "application/pdf",
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".webp": "image/webp",
+}
+
+
+def _pdf_bytes(pages: int, lines_per_page: int = 40) -> bytes:
+    """Helvetica 텍스트 페이지로 구성된 최소 PDF"""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # Pages (kids 확정 후 채움)
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids = []
+    for page_no in range(pages):
+        lines = [f"Evidence page {page_no + 1} line {i}: volunteer leadership project" for i in range(lines_per_page)]
+        stream = "BT /F1 10 Tf 14 TL 40 800 Td " + " ".join(f"({line}) '" for line in lines) + " ET"
+        stream_bytes = stream.encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream_bytes), stream_bytes))
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id
+        )
+        kids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % k for k in kids), len(kids)
+    )
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+def build_corpus(directory: Path, docs: int, pages: int) -> None:
+    from PIL import Image
+
+    for i in range(docs):
+        if i % 4 == 3:
+            Image.effect_noise((1600, 1200), 64).convert("RGB").save(directory / f"doc{i:03d}.png")
+        else:
+            (directory / f"doc{i:03d}.pdf").write_bytes(_pdf_bytes(pages))
+
+
+def load_corpus(directory: Path):
+    return [
+        (str(path), MIME_BY_SUFFIX[path.suffix.lower()])
+        for path in sorted(directory.iterdir())
+        if path.suffix.lower() in MIME_BY_SUFFIX
+    ]
+
+
+def run_serial(corpus, thumbnail_size: int, max_pages: int) -> float:
+    started = time.perf_counter()
+    for path, mime in corpus:
+        process_document(path, mime, thumbnail_size, max_pages)
+    return time.perf_counter() - started
+
+
+def run_pool(corpus, workers: int, thumbnail_size: int, max_pages: int) -> float:
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # 워커 기동 비용은 측정에서 제외
+        list(pool.map(abs, range(workers)))
+        started = time.perf_counter()
+        futures = [pool.submit(process_document, path, mime, thumbnail_size, max_pages) for path, mime in corpus]
+        for future in futures:
+            future.result()
+        return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--corpus", help="기존 문서 디렉터리 (없으면 합성 코퍼스 생성)")
+    parser.add_argument("--docs", type=int, default=40)
+    parser.add_argument("--pages", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--thumbnail-size", type=int, default=320)
+    parser.add_argument("--max-pages", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(args.corpus) if args.corpus else Path(tmp)
+        if not args.corpus:
+            build_corpus(directory, args.docs, args.pages)
+        corpus = load_corpus(directory)
+        if not corpus:
+            parser.error("처리할 문서가 없습니다")
+
+        serial = run_serial(corpus, args.thumbnail_size, args.max_pages)
+        pooled = run_pool(corpus, args.workers, args.thumbnail_size, args.max_pages)
+
+    print(f"documents: {len(corpus)}  workers: {args.workers}")
+    print(f"serial : {serial:.2f}s  {len(corpus) / serial:.1f} docs/sec")
+    print(f"pool   : {pooled:.2f}s  {len(corpus) / pooled:.1f} docs/sec  (x{serial / pooled:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+응답 직렬화 벤치마크 (엔드포인트별 대표 페이로드)
+
+FastAPI 기본 경로와 app.utils.responses 경로의 직렬화 시간을 비교한다.
+
+- model:    response_model=SuccessResponse 검증 + 직렬화 (기존 SuccessResponse 반환 경로)
+- encoder:  jsonable_encoder + 표준 json (dict 반환 + 기본 JSONResponse)
+- fast:     jsonable_encoder + FastJSONResponse (dict 반환 + 새 기본 응답 클래스)
+- envelope: success_response / envelope (검증·인코더 없이 orjson 한 번)
+
+실행:
+    python scripts/bench_serialization.py
+    python scripts/bench_serialization.py --rows 100 --repeat 200
+"""
+import argparse
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+for key in ("SUPABASE_URL", "SUPABASE_ANON_KEY", "SUPABASE_SERVICE_KEY"):
+    os.environ.setdefault(key, "http://localhost" if key == "SUPABASE_URL" else "bench")
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+
+from app.schemas import SuccessResponse  # noqa: E402
+from app.utils.responses import FastJSONResponse, envelope, success_response  # noqa: E402
+
+
+def _activity(i: int) -> dict:
+    return {
+        "id": str(uuid.uuid4()),
+        "title": f"2025 대학생 마케팅 공모전 {i}",
+        "organization": "한국마케팅협회",
+        "category": "contest",
+        "type": "공모전",
+        "description": "브랜드 캠페인 기획안을 제출하는 공모전입니다. " * 8,
+        "fields": ["마케팅", "기획"],
+        "tags": ["공모전", "마케팅", "브랜딩", "SNS"],
+        "keywords": ["마케팅", "캠페인", "브랜드", "콘텐츠기획"],
+        "recommended_majors": ["경영학", "광고홍보학", "전공무관"],
+        "application_end_date": (datetime.now() + timedelta(days=i % 30)).date().isoformat(),
+        "prize_money": 3000000,
+        "view_count": 1200 + i,
+        "bookmark_count": 40 + i,
+        "url": f"https://example.com/activities/{i}",
+        "status": "active",
+        "created_at": datetime.now().isoformat(),
+        "days_left": i % 30,
+        "is_bookmarked": True,
+    }
+
+
+def _reflection(i: int) -> dict:
+    return {
+        "id": str(uuid.uuid4()),
+        "user_id": str(uuid.uuid4()),
+        "template_id": "star",
+        "title": f"프로젝트 회고 {i}",
+        "answers": {f"q{n}": "상황과 과제, 행동, 결과를 정리한 답변입니다. " * 6 for n in range(6)},
+        "competency_analysis": {
+            "competencies": [
+                {"name": name, "score": 70 + n, "evidence": "구체적인 근거 문장입니다. " * 4}
+                for n, name in enumerate(["리더십", "문제해결", "커뮤니케이션", "분석력", "협업"])
+            ],
+            "summary": "핵심 역량 요약입니다. " * 10,
+        },
+        "created_at": datetime.now().isoformat(),
+    }
+
+
+def payloads(rows: int) -> dict:
+    return {
+        "GET /api/v1/recommendations/bookmarks": {
+            "bookmarks": [
+                {"id": str(uuid.uuid4()), "created_at": datetime.now().isoformat(), "activities": _activity(i)}
+                for i in range(rows)
+            ],
+            "total": rows, "page": 1, "per_page": rows,
+        },
+        "GET /api/v1/recommendations/activities": {
+            "activities": [{**_activity(i), "match_score": 80, "match_reasons": ["전공 일치"]} for i in range(rows)],
+            "total": rows, "page": 1, "per_page": rows,
+        },
+        "GET /api/logs": {
+            "logs": [
+                {
+                    "id": str(uuid.uuid4()), "title": f"로그 {i}", "content": "오늘 한 일 " * 30,
+                    "tags": ["회의", "분석"], "created_at": datetime.now().isoformat(),
+                }
+                for i in range(rows)
+            ],
+            "total": rows, "page": 1, "limit": rows,
+        },
+        "GET /api/v1/reflections": {"reflections": [_reflection(i) for i in range(rows)]},
+    }
+
+
+_success_adapter = TypeAdapter(SuccessResponse)
+
+
+def run_model(data):
+    model = _success_adapter.validate_python({"data": data, "timestamp": datetime.now()})
+    return JSONResponse(content=jsonable_encoder(model)).body
+
+
+def run_encoder(data):
+    return JSONResponse(content=jsonable_encoder({"success": True, "data": data, "timestamp": datetime.now()})).body
+
+
+def run_fast(data):
+    return FastJSONResponse(content=jsonable_encoder({"success": True, "data": data, "timestamp": datetime.now()})).body
+
+
+def run_envelope(data):
+    return success_response(data).body
+
+
+def _time(fn, data, repeat: int) -> float:
+    fn(data)  # 워밍업
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn(data)
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    runners = {"model": run_model, "encoder": run_encoder, "fast": run_fast, "envelope": run_envelope}
+    print(f"rows: {args.rows}, repeat: {args.repeat} (ms / 응답)")
+    print(f"{'endpoint':<42} {'KB':>6} " + " ".join(f"{name:>9}" for name in runners))
+    for endpoint, data in payloads(args.rows).items():
+        size_kb = len(envelope(data).body) / 1024
+        timings = [_time(fn, data, args.repeat) for fn in runners.values()]
+        print(f"{endpoint:<42} {size_kb:>6.0f} " + " ".join(f"{ms:>9.2f}" for ms in timings))
+
+
+if __name__ == "__main__":
+    main()
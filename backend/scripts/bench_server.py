@@ -0,0 +1,145 @@
+"""
+프로덕션 서버 처리량 벤치마크 (워커 수별 requests/s)
+
+실행:
+    # gunicorn.conf.py 로 워커 1 / 2 / 4 개 서버를 차례로 띄워 측정
+    python scripts/bench_server.py --workers 1 2 4 --path /api/v1/health
+
+    # 이미 떠 있는 서버 측정
+    python scripts/bench_server.py --url http://127.0.0.1:5000/api/v1/health
+
+부하 생성기도 CPU 를 쓰므로 --clients 프로세스 수만큼 나눠 돌린다. 서버와 같은 머신에서
+돌리면 코어를 나눠 쓰게 되므로, 코어당 수치는 부하 생성기를 다른 머신에 두고 잴 때가 정확하다.
+Supabase 를 타지 않는 엔드포인트(/api/v1/health)는 서버 자체의 상한을,
+DB 를 타는 엔드포인트는 실제 처리량을 보여준다.
+"""
+import argparse
+import asyncio
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from multiprocessing import Pool
+from pathlib import Path
+
+import httpx
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _load(url: str, concurrency: int, duration: float) -> dict:
+    latencies = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(limits=limits, timeout=10) as client:
+        async def worker():
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                try:
+                    response = await client.get(url)
+                    if response.status_code >= 400:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - started)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return {"latencies": latencies, "errors": errors}
+
+
+def _client_process(args) -> dict:
+    url, concurrency, duration = args
+    return asyncio.run(_load(url, concurrency, duration))
+
+
+def run_load(url: str, clients: int, concurrency: int, duration: float) -> dict:
+    per_client = max(1, concurrency // clients)
+    with Pool(clients) as pool:
+        results = pool.map(_client_process, [(url, per_client, duration)] * clients)
+
+    latencies = sorted(lat for result in results for lat in result["latencies"])
+    errors = sum(result["errors"] for result in results)
+    if not latencies:
+        return {"requests": 0, "rps": 0.0, "errors": errors, "p50_ms": 0.0, "p99_ms": 0.0}
+    return {
+        "requests": len(latencies),
+        "rps": len(latencies) / duration,
+        "errors": errors,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+
+def _wait_ready(url: str, process: subprocess.Popen, timeout: float = 30) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"서버가 시작하지 못했습니다 (exit {process.returncode})")
+        try:
+            httpx.get(url, timeout=1)
+            return
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    raise RuntimeError("서버 준비 대기 시간 초과")
+
+
+def bench_gunicorn(workers: int, path: str, args) -> dict:
+    port = _free_port()
+    env = {**os.environ, "WEB_CONCURRENCY": str(workers), "HOST": "127.0.0.1", "PORT": str(port)}
+    process = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "app.main:app"],
+        cwd=BACKEND_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}{path}"
+    try:
+        _wait_ready(url, process)
+        run_load(url, args.clients, args.concurrency, min(args.duration, 3))  # 워밍업
+        return run_load(url, args.clients, args.concurrency, args.duration)
+    finally:
+        process.send_signal(signal.SIGTERM)
+        process.wait(timeout=60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="이미 떠 있는 서버 URL (주면 서버를 띄우지 않음)")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--path", default="/api/v1/health")
+    parser.add_argument("--concurrency", type=int, default=64, help="전체 동시 요청 수")
+    parser.add_argument("--clients", type=int, default=2, help="부하 생성 프로세스 수")
+    parser.add_argument("--duration", type=float, default=15.0)
+    args = parser.parse_args()
+
+    print(f"cpu: {os.cpu_count()}, concurrency: {args.concurrency}, duration: {args.duration}s")
+    print(f"{'workers':>8} {'requests':>9} {'req/s':>9} {'req/s/worker':>13} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}")
+
+    if args.url:
+        runs = [(None, run_load(args.url, args.clients, args.concurrency, args.duration))]
+    else:
+        runs = [(workers, bench_gunicorn(workers, args.path, args)) for workers in args.workers]
+
+    for workers, result in runs:
+        per_worker = result["rps"] / workers if workers else result["rps"]
+        print(
+            f"{workers or '-':>8} {result['requests']:>9} {result['rps']:>9.0f} {per_worker:>13.0f} "
+            f"{result['p50_ms']:>8.1f} {result['p99_ms']:>8.1f} {result['errors']:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
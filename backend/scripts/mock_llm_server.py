@@ -0,0 +1,100 @@
+"""
+로컬 mock LLM 서버 (OpenAI Chat Completions 호환)
+
+실행:
+    python scripts/mock_llm_server.py --port 8100 --latency-ms 50
+
+.env 에 아래처럼 설정하면 app.utils.llm_client 가 이 서버를 호출한다.
+    OPENAI_API_KEY=mock
+    OPENAI_BASE_URL=http://127.0.0.1:8100/v1
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from aiohttp import web
+
+
+def _usage(messages, completion: str) -> dict:
+    prompt_tokens = sum(len(m.get("content", "")) for m in messages) // 4 + 1
+    completion_tokens = len(completion) // 4 + 1
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+    }
+
+
+def _completion_for(messages) -> str:
+    """시스템 프롬프트 종류에 맞춰 고정된 JSON 응답 생성"""
+    system = messages[0].get("content", "") if messages else ""
+    user = messages[-1].get("content", "") if messages else ""
+
+    if "키워드" in system:
+        try:
+            texts = json.loads(user).get("texts", [])
+        except json.JSONDecodeError:
+            texts = [user]
+        return json.dumps({"keywords": [["데이터분석", "팀워크"] for _ in texts]}, ensure_ascii=False)
+    if "ai_summary" in system:
+        return json.dumps({"ai_summary": "mock 프로젝트 요약", "key_achievements": ["mock 성과"]}, ensure_ascii=False)
+    if "feedback" in system:
+        return json.dumps({
+            "feedback": "mock 피드백입니다.",
+            "suggestions": ["mock 제안"],
+            "improvement_areas": ["mock 개선점"],
+            "strengths": ["mock 강점"],
+        }, ensure_ascii=False)
+    return "mock 응답입니다."
+
+
+async def chat_completions(request: web.Request) -> web.StreamResponse:
+    body = await request.json()
+    messages = body.get("messages", [])
+    completion = _completion_for(messages)
+    await asyncio.sleep(request.app["latency"])
+    request.app["stats"]["requests"] += 1
+
+    if not body.get("stream"):
+        return web.json_response({
+            "id": f"mock-{time.time_ns()}",
+            "object": "chat.completion",
+            "model": body.get("model"),
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": completion}, "finish_reason": "stop"}],
+            "usage": _usage(messages, completion),
+        })
+
+    response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+    await response.prepare(request)
+    for start in range(0, len(completion), 8):
+        chunk = {"choices": [{"index": 0, "delta": {"content": completion[start:start + 8]}}]}
+        await response.write(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode("utf-8"))
+        await asyncio.sleep(0.005)
+    usage_chunk = {"choices": [], "usage": _usage(messages, completion)}
+    await response.write(f"data: {json.dumps(usage_chunk)}\n\n".encode("utf-8"))
+    await response.write(b"data: [DONE]\n\n")
+    await response.write_eof()
+    return response
+
+
+async def stats(request: web.Request) -> web.Response:
+    return web.json_response(request.app["stats"])
+
+
+def create_app(latency_ms: int = 0) -> web.Application:
+    app = web.Application()
+    app["latency"] = latency_ms / 1000
+    app["stats"] = {"requests": 0}
+    app.router.add_post("/v1/chat/completions", chat_completions)
+    app.router.add_get("/stats", stats)
+    return app
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="mock LLM server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--latency-ms", type=int, default=0)
+    args = parser.parse_args()
+    web.run_app(create_app(args.latency_ms), host=args.host, port=args.port)
@@ -0,0 +1,10 @@
+import os
+import sys
+from pathlib import Path
+
+# app.config 의 필수 설정 (테스트는 Supabase 에 접속하지 않는다)
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_ANON_KEY", "test")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "test")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
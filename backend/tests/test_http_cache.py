@@ -0,0 +1,78 @@
+from fastapi.testclient import TestClient
+
+from app.database import get_supabase
+from app.main import app
+from app.routes import recommendations
+from app.utils.auth import get_current_user
+from app.utils.http_cache import body_etag
+
+
+class _Response:
+    def __init__(self, data):
+        self.data = data
+        self.count = len(data)
+
+
+class _Query:
+    def __init__(self, data):
+        self._data = data
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self
+
+    def execute(self):
+        return _Response(self._data)
+
+
+class _Supabase:
+    def __init__(self, data):
+        self._data = data
+
+    def table(self, name):
+        return _Query(self._data)
+
+
+BOOKMARKS = [
+    {
+        "activity_id": "a1",
+        "created_at": "2026-10-01T00:00:00",
+        "activities": {"id": "a1", "title": "공모전", "type": "contest", "deadline": "2026-12-31", "application_end_date": None},
+    }
+]
+
+
+def _assert_revalidates(client, path, headers):
+    first = client.get(path, headers=headers)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    second = client.get(path, headers=headers)
+    assert second.headers["etag"] == etag
+
+    not_modified = client.get(path, headers={**headers, "If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+
+def test_list_bookmarks_repeat_get_returns_304():
+    app.dependency_overrides[get_current_user] = lambda: {"id": "u1"}
+    app.dependency_overrides[get_supabase] = lambda: _Supabase(BOOKMARKS)
+    try:
+        _assert_revalidates(TestClient(app), "/api/v1/recommendations/bookmarks", {})
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_success_response_model_bookmarks_returns_304(monkeypatch):
+    monkeypatch.setattr(recommendations, "get_supabase", lambda: _Supabase(BOOKMARKS))
+    _assert_revalidates(TestClient(app), "/api/recommendations/recommendations/bookmarks", {"x-user-id": "u1"})
+
+
+def test_body_etag_ignores_only_envelope_timestamp():
+    a = b'{"success":true,"data":{"x":1},"message":null,"timestamp":"2026-10-19T10:00:00.000001"}'
+    b = b'{"success":true,"data":{"x":1},"message":null,"timestamp":"2026-10-19T10:00:01.500000"}'
+    assert body_etag(a) == body_etag(b)
+    # data 안의 시각은 데이터이므로 ETag 에 반영
+    c = b'{"success":true,"data":{"timestamp":"1"}}'
+    d = b'{"success":true,"data":{"timestamp":"2"}}'
+    assert body_etag(c) != body_etag(d)
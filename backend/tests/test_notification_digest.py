@@ -0,0 +1,64 @@
+import asyncio
+
+from app.utils import notification_digest
+from app.utils.notification_digest import defer_digest_notifications
+
+
+class _Query:
+    def __init__(self, client, table):
+        self.client = client
+        self.table = table
+
+    def select(self, *args):
+        return self
+
+    def in_(self, column, values):
+        return self
+
+    def insert(self, rows):
+        self.client.inserted.setdefault(self.table, []).extend(rows)
+        return self
+
+    def execute(self):
+        data = self.client.preferences if self.table == "user_preferences" else []
+        return type("Response", (), {"data": data})()
+
+
+class _Client:
+    def __init__(self, preferences):
+        self.preferences = preferences
+        self.inserted = {}
+
+    def table(self, name):
+        return _Query(self, name)
+
+
+def _reminder(user_id):
+    return {"user_id": user_id, "type": "reminder", "title": "회고 작성 시간입니다", "content": None, "link": "/spaces/1"}
+
+
+def test_digest_users_reminders_are_queued(monkeypatch):
+    client = _Client([
+        {"user_id": "weekly", "notification_frequency": "weekly"},
+        {"user_id": "immediate", "notification_frequency": "immediate"},
+    ])
+    monkeypatch.setattr(notification_digest, "get_supabase", lambda: client)
+    other = {"user_id": "weekly", "type": "comment", "title": "새 댓글"}
+
+    # 설정 행이 없는 사용자는 기본값(weekly)으로 대기열에 들어간다
+    immediate = asyncio.run(defer_digest_notifications(
+        [_reminder("weekly"), _reminder("immediate"), _reminder("no-preferences"), other]
+    ))
+
+    assert immediate == [_reminder("immediate"), other]
+    assert [row["user_id"] for row in client.inserted["notification_digest_queue"]] == ["weekly", "no-preferences"]
+    assert "notifications" not in client.inserted
+
+
+def test_non_digest_types_skip_the_preferences_lookup(monkeypatch):
+    def fail():
+        raise AssertionError("조회하면 안 된다")
+
+    monkeypatch.setattr(notification_digest, "get_supabase", fail)
+    rows = [{"user_id": "u1", "type": "comment", "title": "새 댓글"}]
+    assert asyncio.run(defer_digest_notifications(rows)) == rows
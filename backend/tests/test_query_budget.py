@@ -0,0 +1,80 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.utils.instrumented_supabase import InstrumentedClient
+from app.utils.query_tracer import QueryBudgetExceeded, QueryTraceMiddleware, query_budget, trace_queries
+
+
+class _Builder:
+    """postgrest 빌더 대역 (체인 메서드는 자신을 돌려주고 execute 는 빈 결과)"""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self
+
+    def execute(self):
+        return type("Response", (), {"data": []})()
+
+
+class _RawClient:
+    def table(self, name):
+        return _Builder()
+
+
+supabase = InstrumentedClient(_RawClient())
+
+
+def _fetch_user(user_id: str):
+    return supabase.table("users").select("id, name").eq("id", user_id).execute()
+
+
+@pytest.fixture
+def raise_mode(monkeypatch):
+    monkeypatch.setattr(settings, "query_budget_mode", "raise")
+
+
+def _app(budget: int, queries: int) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(QueryTraceMiddleware)
+
+    @app.get("/items")
+    @query_budget(budget)
+    async def list_items():
+        for i in range(queries):
+            supabase.table(f"table_{i}").select("id").execute()
+        return {"ok": True}
+
+    return app
+
+
+def test_handler_over_budget_fails_with_500(raise_mode):
+    client = TestClient(_app(budget=2, queries=3), raise_server_exceptions=False)
+    assert client.get("/items").status_code == 500
+
+
+def test_handler_over_budget_raises(raise_mode):
+    client = TestClient(_app(budget=2, queries=3))
+    with pytest.raises(QueryBudgetExceeded, match="쿼리 예산 초과: 3 > 2"):
+        client.get("/items")
+
+
+def test_handler_within_budget_passes(raise_mode):
+    client = TestClient(_app(budget=3, queries=3))
+    assert client.get("/items").json() == {"ok": True}
+
+
+def test_repeated_query_shape_is_flagged_as_nplus1(raise_mode):
+    threshold = settings.query_nplus1_threshold
+    with pytest.raises(QueryBudgetExceeded, match=f"N\\+1 의심: select users select\\(id, name\\) eq:id x{threshold}"):
+        with trace_queries("loop"):
+            # 값만 다른 같은 모양의 쿼리
+            for i in range(threshold):
+                _fetch_user(f"user-{i}")
+
+
+def test_distinct_query_shapes_are_not_flagged(raise_mode):
+    with trace_queries("distinct") as trace:
+        for i in range(settings.query_nplus1_threshold):
+            supabase.table(f"table_{i}").select("id").eq("id", i).execute()
+    assert trace.repeated_shapes() == {}
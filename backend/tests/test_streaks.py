@@ -0,0 +1,76 @@
+import asyncio
+from datetime import date, timedelta
+
+import pytest
+
+from app.utils import streaks
+from app.utils.streaks import compute_streak, record_active_day
+
+TODAY = date(2026, 10, 19)
+
+
+def apply_rpc(row, day, today):
+    """migrations/add_user_streaks.sql 의 record_streak_activity 규칙을 그대로 옮긴 것"""
+    if day > today:
+        return row
+    if row is None:
+        return (1, 1, day)
+    current, longest, last_active = row
+    if day == last_active + timedelta(days=1):
+        current += 1
+    elif day > last_active + timedelta(days=1):
+        current = 1
+    return (current, max(longest, current), max(last_active, day))
+
+
+def days_ago(*offsets):
+    return [TODAY - timedelta(days=offset) for offset in offsets]
+
+
+@pytest.mark.parametrize("days", [
+    days_ago(5, 4, 3, 1, 0),
+    days_ago(3, 3, 2, 2, 1),
+    days_ago(10, 9, 8, 7, 2, 1, 0),
+    # 미래 날짜가 섞여도 이후 실제 활동이 묻히지 않는다
+    days_ago(4, -3, 3, 2, 1, 0),
+    days_ago(2, -1, 1, -30, 0),
+])
+def test_rpc_rules_match_compute_streak(days):
+    row = None
+    for day in days:
+        row = apply_rpc(row, day, TODAY)
+    assert row == compute_streak(days, TODAY)
+
+
+def test_future_only_days_write_nothing():
+    row = None
+    for day in days_ago(-1, -2):
+        row = apply_rpc(row, day, TODAY)
+    assert row is None
+    assert compute_streak(days_ago(-1, -2), TODAY) == (0, 0, None)
+
+
+class _RecordingClient:
+    def __init__(self):
+        self.calls = []
+
+    def rpc(self, name, params):
+        self.calls.append((name, params))
+        return self
+
+    def execute(self):
+        return self
+
+
+def test_record_active_day_skips_future_dates(monkeypatch):
+    client = _RecordingClient()
+    monkeypatch.setattr(streaks, "get_supabase", lambda: client)
+
+    asyncio.run(record_active_day("u1", TODAY + timedelta(days=1), today=TODAY))
+    assert client.calls == []
+
+    asyncio.run(record_active_day("u1", TODAY, today=TODAY))
+    assert client.calls == [(
+        "record_streak_activity",
+        {"p_user_id": "u1", "p_date": TODAY.isoformat(), "p_today": TODAY.isoformat()},
+    )]